@@ -0,0 +1,27 @@
+-- ============================================================================
+-- PLATFORM STATS RPC
+-- Returns the admin dashboard counts in a single round trip
+-- (PlatformRepository.get_stats calls it via /rest/v1/rpc/platform_stats)
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.platform_stats()
+RETURNS json
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT json_build_object(
+        'total_organizations', (SELECT count(*) FROM organizations),
+        'total_users', (SELECT count(*) FROM users),
+        'active_users', (SELECT count(*) FROM user_sessions),
+        'total_mcp_servers', (SELECT count(*) FROM mcp_configurations)
+    );
+$$;
+
+REVOKE ALL ON FUNCTION public.platform_stats() FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.platform_stats() TO service_role;
+
+-- Make the new function visible to PostgREST without a restart
+NOTIFY pgrst, 'reload schema';
+
+-- Verify the function
+SELECT public.platform_stats() AS platform_stats;
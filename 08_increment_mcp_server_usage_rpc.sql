@@ -0,0 +1,32 @@
+-- ============================================================================
+-- MCP SERVER USAGE RPC
+-- Records one use of an MCP server in a single atomic UPDATE
+-- (atomsAgent.mcp.database.update_server_usage calls it via
+-- /rest/v1/rpc/increment_mcp_server_usage)
+-- ============================================================================
+
+-- The generated schema predates these columns; make sure they exist
+ALTER TABLE public.mcp_servers ADD COLUMN IF NOT EXISTS usage_count integer DEFAULT 0;
+ALTER TABLE public.mcp_servers ADD COLUMN IF NOT EXISTS last_used_at timestamptz;
+
+CREATE OR REPLACE FUNCTION public.increment_mcp_server_usage(p_id uuid)
+RETURNS void
+LANGUAGE sql
+VOLATILE
+AS $$
+    UPDATE mcp_servers
+    SET usage_count = COALESCE(usage_count, 0) + 1,
+        last_used_at = now()
+    WHERE id = p_id;
+$$;
+
+REVOKE ALL ON FUNCTION public.increment_mcp_server_usage(uuid) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.increment_mcp_server_usage(uuid) TO service_role;
+
+-- Make the new function visible to PostgREST without a restart
+NOTIFY pgrst, 'reload schema';
+
+-- Verify the function
+SELECT proname, pg_get_function_arguments(oid) AS arguments
+FROM pg_proc
+WHERE proname = 'increment_mcp_server_usage';
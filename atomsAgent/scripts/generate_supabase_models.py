@@ -13,12 +13,14 @@ available credential pieces. Only ``supabase_pydantic`` is required.
 
 from __future__ import annotations
 
+import argparse
+import ast
 import os
 import re
 import subprocess
 import sys
+from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import Iterable
 
 try:
     import yaml  # type: ignore
@@ -33,6 +35,8 @@ DEFAULT_USER = "postgres.ydogoylwenufckscqijp"
 REPO_ROOT = Path(__file__).resolve().parents[1]
 TARGET_DIR = REPO_ROOT / "src/atomsAgent/db/generated"
 SCHEMA_FILE = TARGET_DIR / "fastapi" / "schema_public_latest.py"
+# The post-processed schema is written out as a package of section modules.
+SCHEMA_PACKAGE = SCHEMA_FILE.with_suffix("")
 
 ENV_FILES: tuple[Path, ...] = (
     REPO_ROOT.parent / "atoms.tech/.env.local",
@@ -51,6 +55,25 @@ YAML_FILES: tuple[Path, ...] = (
     REPO_ROOT.parents[1] / "atoms-mcp-prod/secrets.yml",
 )
 
+# Columns Postgres fills in itself (defaults/triggers). They stay on the read-side
+# models but are stripped from the Insert/Update schemas.
+SERVER_MANAGED_FIELDS: tuple[str, ...] = (
+    "version",
+    "created_at",
+    "updated_at",
+    "deleted_at",
+    "deleted_by",
+    "is_deleted",
+)
+
+# Views and set-returning functions exposed through the schema. They cannot be
+# written to, so no Insert/Update schemas are emitted for them.
+READ_ONLY_RELATIONS: tuple[str, ...] = (
+    "TapFunky",
+    "VAgentStatus",
+    "VRecentSession",
+)
+
 _CONFIG_CACHE: dict[str, str] | None = None
 
 
@@ -184,11 +207,443 @@ def _clean_multiline_string_literals(text: str) -> str:
     return pattern.sub(replace, text)
 
 
-def post_process_schema() -> None:
+CUSTOM_BASE_IMPORT = (
+    "from atomsAgent.db.base import (\n"
+    "    CustomModel,\n"
+    "    CustomModelInsert,\n"
+    "    CustomModelUpdate,\n"
+    "    UUIDStr,\n"
+    ")"
+)
+
+
+def _use_custom_base_classes(text: str) -> str:
+    """Swap the generated ``CustomModel*`` stubs for the shared ones in ``atomsAgent.db.base``."""
+    stub = re.compile(
+        r"\nclass (CustomModel|CustomModelInsert|CustomModelUpdate)\((?:BaseModel|CustomModel)\):\n"
+        r'\t"""[^\n]*"""\n\tpass\n\n?'
+    )
+    text = stub.sub("", text)
+    note = "# Pydantic Base Schema.\n"
+    pointer = "# They live in atomsAgent.db.base so customisations survive regeneration.\n"
+    if pointer not in text:
+        text = text.replace(note, note + pointer, 1)
+    existing = re.compile(r"^from atomsAgent\.db\.base import (?:\([^)]*\)|.*)$", re.MULTILINE)
+    if existing.search(text):
+        text = existing.sub(lambda _match: CUSTOM_BASE_IMPORT, text, count=1)
+    else:
+        marker = "\n# ENUM TYPES"
+        text = text.replace(marker, f"\n{CUSTOM_BASE_IMPORT}\n{marker}", 1)
+    # BaseModel is only referenced by the stubs we just removed.
+    text = re.sub(r"^from pydantic import BaseModel\n", "", text, flags=re.MULTILINE)
+    text = re.sub(r"^(from pydantic import .*)\bBaseModel, ", r"\1", text, flags=re.MULTILINE)
+    return text
+
+
+_CLASS_BLOCK = re.compile(
+    r"^class (?P<name>\w+)\((?P<base>\w+)\):\n(?P<body>.*?)(?=\n\n\n|\n# |\Z)",
+    re.DOTALL | re.MULTILINE,
+)
+
+
+def _rewrite_class_bodies(
+    text: str, bases: Iterable[str], rewrite: Callable[[str, str], str]
+) -> str:
+    """Apply ``rewrite(class_name, body)`` to every class deriving from one of ``bases``."""
+    wanted = set(bases)
+
+    def replace(match: re.Match[str]) -> str:
+        if match.group("base") not in wanted:
+            return match.group(0)
+        body = rewrite(match.group("name"), match.group("body"))
+        return f"class {match.group('name')}({match.group('base')}):\n{body}"
+
+    return _CLASS_BLOCK.sub(replace, text)
+
+
+def _omit_server_managed_fields(text: str, fields: Iterable[str]) -> str:
+    """Drop optional server-managed columns from the Insert/Update schemas."""
+    names = "|".join(re.escape(field) for field in fields)
+    if not names:
+        return text
+    # Only optional declarations (those with a default) are removed; a column the
+    # database cannot fill in on its own stays required.
+    declaration = re.compile(rf"^\t+(?:{names}): .* = ")
+    comment = re.compile(rf"^\t# (?:{names}): ")
+
+    def rewrite(_name: str, body: str) -> str:
+        lines = body.split("\n")
+        return "\n".join(
+            line for line in lines if not (declaration.match(line) or comment.match(line))
+        )
+
+    return _rewrite_class_bodies(text, ("CustomModelInsert", "CustomModelUpdate"), rewrite)
+
+
+def _drop_write_schemas(text: str, relations: Iterable[str]) -> str:
+    """Remove the Insert/Update schemas generated for read-only relations."""
+    names = "|".join(re.escape(name) for name in relations)
+    if not names:
+        return text
+    block = re.compile(
+        rf"^class (?:{names})(?:Insert|Update)\(CustomModel(?:Insert|Update)\):\n.*?(?:\n\n\n|(?=\n# )|\Z)",
+        re.DOTALL | re.MULTILINE,
+    )
+    return block.sub("", text)
+
+
+def _unprefix_field_names(text: str) -> str:
+    """Declare ``field_<column>`` attributes under the column name itself.
+
+    sb-pydantic prefixes columns such as ``type``, ``format`` and ``model_id`` and
+    then aliases them back; naming the attribute after the column drops the alias.
+    """
+    text = re.sub(r'^(\t+field_(\w+): .*?), alias="\2"\)', r"\1)", text, flags=re.MULTILINE)
+    text = re.sub(r'^(\t+field_(\w+): .*?) = Field\(alias="\2"\)$', r"\1", text, flags=re.MULTILINE)
+    return re.sub(r"^(\t+(?:# )?)field_(\w+): ", r"\1\2: ", text, flags=re.MULTILINE)
+
+
+def _bare_none_defaults(text: str) -> str:
+    """Emit ``= None`` for fields whose ``Field()`` only sets ``default=None``."""
+    return re.sub(
+        r"^(\t+\w+: .*?) = Field\(default=None\)(  # .*)?$",
+        r"\1 = None\2",
+        text,
+        flags=re.MULTILINE,
+    )
+
+
+def _use_ip_any_address(text: str) -> str:
+    """Annotate ``inet`` columns with pydantic's single-pass ``IPvAnyAddress``."""
+    text = re.sub(r"\bIPv4Address \| IPv6Address\b", "IPvAnyAddress", text)
+    text = re.sub(
+        r"^from ipaddress import IPv4Address, IPv6Address\n", "", text, flags=re.MULTILINE
+    )
+    if "IPvAnyAddress" in text:
+        text = _add_pydantic_import(text, "IPvAnyAddress")
+    return text
+
+
+def _import_name_key(name: str) -> tuple[int, str, str]:
+    # isort's order-by-type: CONSTANTS, then Classes, then functions/variables.
+    kind = 0 if name.isupper() and len(name) > 1 else 1 if name[:1].isupper() else 2
+    return kind, name.lower(), name
+
+
+def _add_pydantic_import(text: str, name: str) -> str:
+    """Add ``name`` to the ``from pydantic import`` line, whatever else it imports."""
+    line = re.compile(r"^from pydantic import (.*)$", re.MULTILINE)
+    match = line.search(text)
+    if match is None:
+        anchor = "\nfrom pydantic.types import"
+        return text.replace(anchor, f"\nfrom pydantic import {name}{anchor}", 1)
+    names = {part.strip() for part in match.group(1).split(",")} | {name}
+    merged = ", ".join(sorted(names, key=_import_name_key))
+    return text[: match.start()] + f"from pydantic import {merged}" + text[match.end() :]
+
+
+_DESCRIBED_FIELD = re.compile(
+    r'^(?P<decl>\t+\w+: .*?) = Field\((?:default=(?P<default>None), )?description="(?P<doc>[^"]*)"\)'
+    r"(?P<comment>  # .*)?$",
+    re.MULTILINE,
+)
+
+
+def _descriptions_to_comments(text: str) -> str:
+    """Move ``Field(description=...)`` text into trailing comments.
+
+    Descriptions are only read by OpenAPI generation, which never sees these
+    schemas, so keeping them in comments avoids holding the strings at runtime.
+    """
+
+    def replace(match: re.Match[str]) -> str:
+        decl = match.group("decl")
+        if match.group("default"):
+            decl += " = None"
+        return f"{decl}  # {match.group('doc')}"
+
+    text = _DESCRIBED_FIELD.sub(replace, text)
+    if "Field(" not in text:
+        text = re.sub(r"^(from pydantic import .*)\bField, ", r"\1", text, flags=re.MULTILINE)
+    return text
+
+
+def _tuple_array_columns(text: str) -> str:
+    """Type ``text[]`` columns on the Update schemas as ``tuple[str, ...]``.
+
+    Update payloads are not mutated after validation, and a tuple is a single
+    allocation that can also be hashed or used as a cache key.
+    """
+
+    def rewrite(_name: str, body: str) -> str:
+        return re.sub(r"^(\t+\w+: )list\[str\]", r"\1tuple[str, ...]", body, flags=re.MULTILINE)
+
+    return _rewrite_class_bodies(text, ("CustomModelUpdate",), rewrite)
+
+
+def _string_uuid_payloads(text: str) -> str:
+    """Type UUID columns on the Insert/Update schemas as ``UUIDStr``."""
+
+    def rewrite(_name: str, body: str) -> str:
+        return re.sub(r"^(\t+\w+: )UUID4\b", r"\1UUIDStr", body, flags=re.MULTILINE)
+
+    return _rewrite_class_bodies(text, ("CustomModelInsert", "CustomModelUpdate"), rewrite)
+
+
+JSON_UNION = "dict | list[dict] | list[Any] | Json"
+JSON_ALIAS = (
+    "# JSON/JSONB columns share one alias so pydantic builds a single core schema for them.\n"
+    f'JsonLike = TypeAliasType("JsonLike", {JSON_UNION})\n'
+)
+
+
+def _alias_json_unions(text: str) -> str:
+    """Replace the repeated JSON column union with the module-level ``JsonLike`` alias."""
+    text = re.sub(rf"^(\t+\w+: ){re.escape(JSON_UNION)}\b", r"\1JsonLike", text, flags=re.MULTILINE)
+    if "JsonLike" not in text or JSON_ALIAS in text:
+        return text
+    text = text.replace("\n# ENUM TYPES", f"\n{JSON_ALIAS}\n# ENUM TYPES", 1)
+    return text.replace(
+        "\nfrom atomsAgent.db.base import",
+        "from typing_extensions import TypeAliasType\n\nfrom atomsAgent.db.base import",
+        1,
+    )
+
+
+_CONSTRAINED_STR = re.compile(r"Annotated\[str, StringConstraints\(\*\*(\{[^}]*\})\)\]")
+
+
+def _passthrough_json_payloads(text: str) -> str:
+    """Type JSON columns on the Insert/Update schemas as ``Any``.
+
+    Write payloads are handed to PostgREST unchanged, so walking the ``JsonLike``
+    union for every value buys nothing; read-side schemas keep the union.
+    """
+
+    def rewrite(_name: str, body: str) -> str:
+        return re.sub(r"^(\t+\w+: )JsonLike\b", r"\1Any", body, flags=re.MULTILINE)
+
+    return _rewrite_class_bodies(text, ("CustomModelInsert", "CustomModelUpdate"), rewrite)
+
+
+_STR_ENUM = re.compile(
+    r'^class (?P<name>\w+)Enum\(str, Enum\):\n(?P<members>(?:\t\w+ = "[^"]*"\n)+)', re.MULTILINE
+)
+
+
+def _literal_enum_payloads(text: str) -> str:
+    """Validate enum columns on the Insert/Update schemas against ``Literal`` value sets.
+
+    Every ``<Name>Enum`` gets a ``<Name>Literal`` twin; write payloads use it and
+    keep plain strings, while read-side schemas still hand out enum members.
+    """
+    literals = []
+    names = []
+    for match in _STR_ENUM.finditer(text):
+        values = ", ".join(re.findall(r' = ("[^"]*")', match.group("members")))
+        literals.append(f"{match.group('name')}Literal = Literal[{values}]\n")
+        names.append(match.group("name"))
+    if not literals:
+        return text
+    definitions = "".join(line for line in literals if line not in text)
+    if definitions:
+        text = text.replace("\n# CUSTOM CLASSES", f"\n{definitions}\n\n# CUSTOM CLASSES", 1)
+        text = re.sub(
+            r"^from typing import (.*)$", _add_literal_import, text, count=1, flags=re.MULTILINE
+        )
+
+    enum_ref = re.compile(rf"\b({'|'.join(names)})Enum\b")
+
+    def rewrite(_name: str, body: str) -> str:
+        return re.sub(enum_ref, r"\1Literal", body)
+
+    return _rewrite_class_bodies(text, ("CustomModelInsert", "CustomModelUpdate"), rewrite)
+
+
+def _add_literal_import(match: re.Match[str]) -> str:
+    names = {name.strip() for name in match.group(1).split(",")} | {"Literal"}
+    return f"from typing import {', '.join(sorted(names))}"
+
+
+def _alias_constrained_strings(text: str) -> str:
+    """Hoist inline ``Annotated[str, StringConstraints(...)]`` into shared aliases."""
+    aliases: dict[str, str] = {}
+
+    def replace(match: re.Match[str]) -> str:
+        constraints = ast.literal_eval(match.group(1))
+        name = "Str" + "_".join(str(value) for value in constraints.values())
+        kwargs = ", ".join(f"{key}={value!r}" for key, value in constraints.items())
+        aliases[name] = f"{name} = Annotated[str, StringConstraints({kwargs})]\n"
+        return name
+
+    text = _CONSTRAINED_STR.sub(replace, text)
+    definitions = "".join(alias for alias in aliases.values() if alias not in text)
+    if definitions:
+        text = text.replace("\n# ENUM TYPES", f"\n{definitions}\n# ENUM TYPES", 1)
+    return text
+
+
+# Section header in the generated module -> submodule of the schema package.
+SCHEMA_SECTIONS: tuple[tuple[str, str], ...] = (
+    ("# ENUM TYPES", "_types"),
+    ("# CUSTOM CLASSES", "base"),
+    ("# INSERT CLASSES", "insert"),
+    ("# UPDATE CLASSES", "update"),
+    ("# OPERATIONAL CLASSES", "operational"),
+)
+
+SCHEMA_PACKAGE_INIT = '''"""Supabase ``public`` schema models generated by ``scripts/generate_supabase_models.py``.
+
+The classes live in per-section submodules that are imported on first attribute
+access (PEP 562), so importing a couple of schemas does not execute all of them.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_MODULES: dict[str, str] = {{
+{entries}
+}}
+
+__all__ = sorted(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}") from None
+    value = getattr(importlib.import_module(f"{{__name__}}.{{module}}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return __all__
+'''
+
+
+def _split_schema_module(text: str) -> dict[str, str]:
+    """Split the post-processed schema into ``{submodule: source}`` by section header.
+
+    Each submodule imports only the names it uses: the prelude imports it needs and
+    explicit ``from .<section> import ...`` lines for classes defined in the others.
+    """
+    starts = sorted((text.index(f"\n{header}\n") + 1, module) for header, module in SCHEMA_SECTIONS)
+    prelude = text[: starts[0][0]]
+    imports_end = prelude.index(CUSTOM_BASE_IMPORT) + len(CUSTOM_BASE_IMPORT) + 1
+    imports, aliases = prelude[:imports_end], prelude[imports_end:]
+    bodies: dict[str, str] = {}
+    for (start, module), (end, _) in zip(starts, [*starts[1:], (len(text), "")], strict=True):
+        body = text[start:end].rstrip("\n") + "\n"
+        if module == "_types":
+            body = aliases.lstrip("\n") + "\n" + body
+        bodies[module] = body
+
+    defined = {name: module for module, body in bodies.items() for name in _defined_names(body)}
+    modules: dict[str, str] = {}
+    for module, body in bodies.items():
+        used = _used_names(body)
+        local: dict[str, list[str]] = {}
+        for name in sorted(used):
+            owner = defined.get(name)
+            if owner is not None and owner != module:
+                local.setdefault(owner, []).append(name)
+        header = _render_imports(imports, used, local)
+        modules[module] = header + "\n" + body
+    return modules
+
+
+def _defined_names(source: str) -> list[str]:
+    names = []
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.ClassDef):
+            names.append(node.name)
+        elif isinstance(node, ast.Assign):
+            names.extend(target.id for target in node.targets if isinstance(target, ast.Name))
+    return names
+
+
+def _used_names(source: str) -> set[str]:
+    return {node.id for node in ast.walk(ast.parse(source)) if isinstance(node, ast.Name)}
+
+
+def _render_imports(prelude: str, used: set[str], local: dict[str, list[str]]) -> str:
+    """Render the prelude imports ``used`` needs, grouped and ordered as isort does."""
+    straight: set[str] = set()
+    members: dict[str, set[str]] = {}
+    for node in ast.parse(prelude).body:
+        if isinstance(node, ast.Import):
+            straight.update(alias.name for alias in node.names if alias.name in used)
+        elif isinstance(node, ast.ImportFrom) and node.module != "__future__":
+            for alias in node.names:
+                if (alias.asname or alias.name) in used:
+                    member = alias.name + (f" as {alias.asname}" if alias.asname else "")
+                    members.setdefault(node.module or "", set()).add(member)
+    for module, names in local.items():
+        members[f".{module}"] = set(names)
+
+    def group(module: str) -> int:
+        top = module.split(".")[0]
+        if module.startswith("."):
+            return 3
+        if top == "atomsAgent":
+            return 2
+        return 0 if top in sys.stdlib_module_names else 1
+
+    blocks: list[list[str]] = [[], [], [], []]
+    for module in sorted(straight, key=str.lower):
+        blocks[group(module)].append(f"import {module}")
+    for module in sorted(members, key=str.lower):
+        names = sorted(members[module], key=lambda member: _import_name_key(member.split()[0]))
+        line = f"from {module} import {', '.join(names)}"
+        if len(line) > 100:
+            # The generated modules indent with tabs, and isort follows suit.
+            line = f"from {module} import (\n" + "".join(f"\t{name},\n" for name in names) + ")"
+        blocks[group(module)].append(line)
+    rendered = "\n\n".join("\n".join(block) for block in blocks if block)
+    return "from __future__ import annotations\n\n" + rendered + "\n"
+
+
+def _write_schema_package(text: str) -> None:
+    modules = _split_schema_module(text)
+    SCHEMA_PACKAGE.mkdir(exist_ok=True)
+    for stale in SCHEMA_PACKAGE.glob("*.py"):
+        stale.unlink()
+    exports: dict[str, str] = {}
+    for module, source in modules.items():
+        (SCHEMA_PACKAGE / f"{module}.py").write_text(source)
+        for name in re.findall(r"^(?:class (\w+)\b|(\w+) = )", source, flags=re.MULTILINE):
+            exports.setdefault(name[0] or name[1], module)
+    entries = "\n".join(f'    "{name}": "{module}",' for name, module in exports.items())
+    (SCHEMA_PACKAGE / "__init__.py").write_text(SCHEMA_PACKAGE_INIT.format(entries=entries))
+    SCHEMA_FILE.unlink()
+
+
+def post_process_schema(
+    omit_server_managed: Iterable[str] = SERVER_MANAGED_FIELDS,
+    field_descriptions: bool = False,
+) -> None:
     if not SCHEMA_FILE.exists():
         raise FileNotFoundError(f"Generated schema missing at {SCHEMA_FILE}")
     text = SCHEMA_FILE.read_text()
     text = _clean_multiline_string_literals(text)
+    text = _use_custom_base_classes(text)
+    text = _omit_server_managed_fields(text, omit_server_managed)
+    text = _drop_write_schemas(text, READ_ONLY_RELATIONS)
+    text = _unprefix_field_names(text)
+    text = _alias_json_unions(text)
+    text = _passthrough_json_payloads(text)
+    text = _alias_constrained_strings(text)
+    text = _bare_none_defaults(text)
+    text = _tuple_array_columns(text)
+    text = _string_uuid_payloads(text)
+    text = _literal_enum_payloads(text)
+    if not field_descriptions:
+        text = _descriptions_to_comments(text)
+    text = _use_ip_any_address(text)
     lines: list[str] = []
     seen_any = False
     for line in text.splitlines():
@@ -197,14 +652,34 @@ def post_process_schema() -> None:
                 continue
             seen_any = True
         lines.append(line)
-    SCHEMA_FILE.write_text("\n".join(lines) + "\n")
-
-
-def main() -> None:
+    _write_schema_package("\n".join(lines) + "\n")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--omit-server-managed",
+        default=",".join(SERVER_MANAGED_FIELDS),
+        help=(
+            "Comma-separated columns to strip from Insert/Update schemas because the "
+            "database manages them (pass an empty string to keep everything)."
+        ),
+    )
+    parser.add_argument(
+        "--field-descriptions",
+        action="store_true",
+        help="Keep column comments as Field(description=...) instead of source comments.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = parse_args(argv)
+    omit = [name.strip() for name in args.omit_server_managed.split(",") if name.strip()]
     db_url = build_db_url()
     print(f"Using database URL: {db_url.split('@')[-1]}")
     run_supabase_pydantic(db_url)
-    post_process_schema()
+    post_process_schema(omit_server_managed=omit, field_descriptions=args.field_descriptions)
     print(f"✅ Supabase models updated in {TARGET_DIR}")
 
 
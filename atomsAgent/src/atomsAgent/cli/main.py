@@ -164,7 +164,22 @@ def _run_command(command: list[str]) -> subprocess.CompletedProcess:
 
 
 def _run_async(awaitable):
-    return asyncio.run(awaitable)
+    async def _run_and_close():
+        try:
+            return await awaitable
+        finally:
+            await _close_supabase_client()
+
+    return asyncio.run(_run_and_close())
+
+
+async def _close_supabase_client() -> None:
+    from atomsAgent.dependencies import get_supabase_client
+
+    # The pooled HTTP client is bound to this command's event loop, so close it
+    # before asyncio.run() tears the loop down.
+    if get_supabase_client.cache_info().currsize:
+        await get_supabase_client().aclose()
 
 
 @supabase_app.command("generate-models")
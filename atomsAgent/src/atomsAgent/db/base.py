@@ -0,0 +1,143 @@
+"""Base classes shared by the generated Supabase schema models.
+
+``sb-pydantic`` emits empty ``CustomModel*`` stubs at the top of every generated
+schema module. ``scripts/generate_supabase_models.py`` replaces those stubs with an
+import of the classes below so that customisations survive regeneration.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from decimal import Decimal
+from functools import cache
+from ipaddress import IPv4Address, IPv6Address
+from typing import Annotated, Any, TypeVar
+from uuid import UUID
+
+import orjson
+from pydantic import BaseModel, BeforeValidator, ConfigDict, StringConstraints, TypeAdapter
+
+ModelT = TypeVar("ModelT", bound="CustomModel")
+InsertT = TypeVar("InsertT", bound="CustomModelInsert")
+
+# Insert/Update payloads are serialised straight back to PostgREST, so their UUID
+# columns stay strings instead of round-tripping through uuid.UUID. The pattern
+# accepts any UUID version (pydantic's UUID4 rejects v1/v7 ids); uuid.UUID values
+# from application code are converted to their string form first.
+UUIDStr = Annotated[
+    str,
+    StringConstraints(
+        pattern=r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+    ),
+    BeforeValidator(lambda value: str(value) if isinstance(value, UUID) else value),
+]
+
+# orjson already writes UUID, datetime, Enum and dataclasses natively; the hook
+# only has to cover the few remaining column types.
+JSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="python")
+    if isinstance(value, (IPv4Address, IPv6Address, Decimal)):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps_json(value: Any) -> bytes:
+    """Serialize ``value`` with orjson using the shared schema-model hook."""
+    return orjson.dumps(value, default=_json_default, option=JSON_OPTIONS)
+
+
+@cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+class CustomModel(BaseModel):
+    """Base model class with common features.
+
+    Core schemas are built on first use (``defer_build``): importing the schema
+    package should not compile validators for the hundreds of tables a process
+    never touches.
+    """
+
+    # Columns are exposed under their own names, including model_id/model_name.
+    model_config = ConfigDict(defer_build=True, protected_namespaces=())
+
+    @classmethod
+    def validate_many(cls: type[ModelT], rows: Iterable[Any]) -> list[ModelT]:
+        """Validate a batch of rows in a single pydantic-core call.
+
+        The ``list[cls]`` adapter is built on first use and cached per class.
+        """
+        return _list_adapter(cls).validate_python(rows)
+
+    @classmethod
+    def validate_many_json(cls: type[ModelT], data: str | bytes) -> list[ModelT]:
+        """Validate a JSON array of rows without decoding it to Python first."""
+        return _list_adapter(cls).validate_json(data)
+
+    def to_json(self, **dump_kwargs: Any) -> bytes:
+        """Serialize to JSON bytes through orjson instead of pydantic's JSON mode."""
+        return dumps_json(self.model_dump(mode="python", **dump_kwargs))
+
+
+class CustomModelInsert(CustomModel):
+    """Base model for insert operations with common features."""
+
+    @classmethod
+    def from_trusted(cls: type[InsertT], **data: Any) -> InsertT:
+        """Build an instance from trusted data WITHOUT any validation.
+
+        This is only safe for rows produced by our own queries against Supabase,
+        where Postgres has already enforced the column types. Anything that
+        originates outside the process (request bodies, webhooks, user input)
+        must go through ``model_validate`` instead.
+
+        Unlike ``model_construct`` nothing is checked or filled in: values are
+        stored exactly as given, aliases are not resolved and defaults are not
+        applied, so callers must pass every field they intend to read.
+        """
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "__dict__", data)
+        object.__setattr__(obj, "__pydantic_fields_set__", set(data))
+        object.__setattr__(obj, "__pydantic_extra__", None)
+        object.__setattr__(obj, "__pydantic_private__", None)
+        return obj
+
+
+class CustomModelUpdate(CustomModel):
+    """Base model for update operations with common features.
+
+    The config pins pydantic's lean defaults: unknown keys are dropped rather
+    than stored in ``__pydantic_extra__``, the ``None`` defaults are not run
+    through validators and assignments are never revalidated.
+    """
+
+    model_config = ConfigDict(
+        extra="ignore",
+        validate_default=False,
+        validate_assignment=False,
+        revalidate_instances="never",
+    )
+
+    def model_dump_fast(self) -> dict[str, Any]:
+        """Return the non-null fields as a plain dict, like ``model_dump(exclude_none=True)``.
+
+        Update schemas only hold flat column values, so copying ``__dict__`` is
+        enough and skips pydantic's serializer dispatch. Values are returned as
+        stored; use ``model_dump`` when JSON-mode conversion is needed.
+        """
+        return {name: value for name, value in self.__dict__.items() if value is not None}
+
+    def to_patch_bytes(self) -> bytes:
+        """Serialize only the explicitly set fields as a JSON PATCH body.
+
+        Runs entirely in pydantic-core's Rust serializer, so there is no
+        intermediate dict or ``json.dumps`` pass.
+        """
+        return self.__pydantic_serializer__.to_json(self, exclude_unset=True)
@@ -0,0 +1,311 @@
+"""Supabase ``public`` schema models generated by ``scripts/generate_supabase_models.py``.
+
+The classes live in per-section submodules that are imported on first attribute
+access (PEP 562), so importing a couple of schemas does not execute all of them.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_MODULES: dict[str, str] = {
+    "JsonLike": "_types",
+    "Str2_255": "_types",
+    "PublicEntityTypeEnum": "_types",
+    "PublicAssignmentRoleEnum": "_types",
+    "PublicRequirementStatusEnum": "_types",
+    "PublicAuditEventTypeEnum": "_types",
+    "PublicAuditSeverityEnum": "_types",
+    "PublicResourceTypeEnum": "_types",
+    "PublicUserRoleTypeEnum": "_types",
+    "PublicInvitationStatusEnum": "_types",
+    "PublicUserStatusEnum": "_types",
+    "PublicBillingPlanEnum": "_types",
+    "PublicPricingPlanIntervalEnum": "_types",
+    "PublicProjectRoleEnum": "_types",
+    "PublicVisibilityEnum": "_types",
+    "PublicProjectStatusEnum": "_types",
+    "PublicExecutionStatusEnum": "_types",
+    "PublicRequirementPriorityEnum": "_types",
+    "PublicRequirementLevelEnum": "_types",
+    "PublicSubscriptionStatusEnum": "_types",
+    "PublicTestTypeEnum": "_types",
+    "PublicTestPriorityEnum": "_types",
+    "PublicTestStatusEnum": "_types",
+    "PublicTestMethodEnum": "_types",
+    "PublicTraceLinkTypeEnum": "_types",
+    "PublicEntityTypeLiteral": "_types",
+    "PublicAssignmentRoleLiteral": "_types",
+    "PublicRequirementStatusLiteral": "_types",
+    "PublicAuditEventTypeLiteral": "_types",
+    "PublicAuditSeverityLiteral": "_types",
+    "PublicResourceTypeLiteral": "_types",
+    "PublicUserRoleTypeLiteral": "_types",
+    "PublicInvitationStatusLiteral": "_types",
+    "PublicUserStatusLiteral": "_types",
+    "PublicBillingPlanLiteral": "_types",
+    "PublicPricingPlanIntervalLiteral": "_types",
+    "PublicProjectRoleLiteral": "_types",
+    "PublicVisibilityLiteral": "_types",
+    "PublicProjectStatusLiteral": "_types",
+    "PublicExecutionStatusLiteral": "_types",
+    "PublicRequirementPriorityLiteral": "_types",
+    "PublicRequirementLevelLiteral": "_types",
+    "PublicSubscriptionStatusLiteral": "_types",
+    "PublicTestTypeLiteral": "_types",
+    "PublicTestPriorityLiteral": "_types",
+    "PublicTestStatusLiteral": "_types",
+    "PublicTestMethodLiteral": "_types",
+    "PublicTraceLinkTypeLiteral": "_types",
+    "AdminAuditLogBaseSchema": "base",
+    "AgentHealthBaseSchema": "base",
+    "AgentBaseSchema": "base",
+    "ApiKeyBaseSchema": "base",
+    "AssignmentBaseSchema": "base",
+    "AuditLogBaseSchema": "base",
+    "BillingCacheBaseSchema": "base",
+    "BlockBaseSchema": "base",
+    "ChatMessageBaseSchema": "base",
+    "ChatSessionBaseSchema": "base",
+    "ColumnBaseSchema": "base",
+    "DiagramElementLinkBaseSchema": "base",
+    "DiagramElementLinksWithDetailBaseSchema": "base",
+    "DocumentBaseSchema": "base",
+    "EmbeddingCacheBaseSchema": "base",
+    "ExcalidrawDiagramBaseSchema": "base",
+    "ExcalidrawElementLinkBaseSchema": "base",
+    "ExternalDocumentBaseSchema": "base",
+    "McpAuditLogBaseSchema": "base",
+    "McpConfigurationBaseSchema": "base",
+    "McpOauthTokenBaseSchema": "base",
+    "McpOauthTransactionBaseSchema": "base",
+    "McpProfileBaseSchema": "base",
+    "McpProxyConfigBaseSchema": "base",
+    "McpRegistrySyncStatusBaseSchema": "base",
+    "McpServerSecurityReviewBaseSchema": "base",
+    "McpServerUsageLogBaseSchema": "base",
+    "McpServerBaseSchema": "base",
+    "McpSessionBaseSchema": "base",
+    "ModelBaseSchema": "base",
+    "NotificationBaseSchema": "base",
+    "OrganizationInvitationBaseSchema": "base",
+    "OrganizationMemberBaseSchema": "base",
+    "OrganizationBaseSchema": "base",
+    "PgAllForeignKeyBaseSchema": "base",
+    "PlatformAdminBaseSchema": "base",
+    "ProfileBaseSchema": "base",
+    "ProjectInvitationBaseSchema": "base",
+    "ProjectMemberBaseSchema": "base",
+    "ProjectBaseSchema": "base",
+    "PropertyBaseSchema": "base",
+    "RagEmbeddingBaseSchema": "base",
+    "RagSearchAnalyticBaseSchema": "base",
+    "ReactFlowDiagramBaseSchema": "base",
+    "RequirementTestBaseSchema": "base",
+    "RequirementBaseSchema": "base",
+    "RequirementsClosureBaseSchema": "base",
+    "SignupRequestBaseSchema": "base",
+    "StripeCustomerBaseSchema": "base",
+    "SystemPromptBaseSchema": "base",
+    "TableRowBaseSchema": "base",
+    "TapFunkyBaseSchema": "base",
+    "TestMatrixViewBaseSchema": "base",
+    "TestReqBaseSchema": "base",
+    "TraceLinkBaseSchema": "base",
+    "UsageLogBaseSchema": "base",
+    "UserMcpServerBaseSchema": "base",
+    "UserRoleBaseSchema": "base",
+    "VAgentStatusBaseSchema": "base",
+    "VRecentSessionBaseSchema": "base",
+    "AdminAuditLogInsert": "insert",
+    "AgentHealthInsert": "insert",
+    "AgentInsert": "insert",
+    "ApiKeyInsert": "insert",
+    "AssignmentInsert": "insert",
+    "AuditLogInsert": "insert",
+    "BillingCacheInsert": "insert",
+    "BlockInsert": "insert",
+    "ChatMessageInsert": "insert",
+    "ChatSessionInsert": "insert",
+    "ColumnInsert": "insert",
+    "DiagramElementLinkInsert": "insert",
+    "DiagramElementLinksWithDetailInsert": "insert",
+    "DocumentInsert": "insert",
+    "EmbeddingCacheInsert": "insert",
+    "ExcalidrawDiagramInsert": "insert",
+    "ExcalidrawElementLinkInsert": "insert",
+    "ExternalDocumentInsert": "insert",
+    "McpAuditLogInsert": "insert",
+    "McpConfigurationInsert": "insert",
+    "McpOauthTokenInsert": "insert",
+    "McpOauthTransactionInsert": "insert",
+    "McpProfileInsert": "insert",
+    "McpProxyConfigInsert": "insert",
+    "McpRegistrySyncStatusInsert": "insert",
+    "McpServerSecurityReviewInsert": "insert",
+    "McpServerUsageLogInsert": "insert",
+    "McpServerInsert": "insert",
+    "McpSessionInsert": "insert",
+    "ModelInsert": "insert",
+    "NotificationInsert": "insert",
+    "OrganizationInvitationInsert": "insert",
+    "OrganizationMemberInsert": "insert",
+    "OrganizationInsert": "insert",
+    "PgAllForeignKeyInsert": "insert",
+    "PlatformAdminInsert": "insert",
+    "ProfileInsert": "insert",
+    "ProjectInvitationInsert": "insert",
+    "ProjectMemberInsert": "insert",
+    "ProjectInsert": "insert",
+    "PropertyInsert": "insert",
+    "RagEmbeddingInsert": "insert",
+    "RagSearchAnalyticInsert": "insert",
+    "ReactFlowDiagramInsert": "insert",
+    "RequirementTestInsert": "insert",
+    "RequirementInsert": "insert",
+    "RequirementsClosureInsert": "insert",
+    "SignupRequestInsert": "insert",
+    "StripeCustomerInsert": "insert",
+    "SystemPromptInsert": "insert",
+    "TableRowInsert": "insert",
+    "TestMatrixViewInsert": "insert",
+    "TestReqInsert": "insert",
+    "TraceLinkInsert": "insert",
+    "UsageLogInsert": "insert",
+    "UserMcpServerInsert": "insert",
+    "UserRoleInsert": "insert",
+    "AdminAuditLogUpdate": "update",
+    "AgentHealthUpdate": "update",
+    "AgentUpdate": "update",
+    "ApiKeyUpdate": "update",
+    "AssignmentUpdate": "update",
+    "AuditLogUpdate": "update",
+    "BillingCacheUpdate": "update",
+    "BlockUpdate": "update",
+    "ChatMessageUpdate": "update",
+    "ChatSessionUpdate": "update",
+    "ColumnUpdate": "update",
+    "DiagramElementLinkUpdate": "update",
+    "DiagramElementLinksWithDetailUpdate": "update",
+    "DocumentUpdate": "update",
+    "EmbeddingCacheUpdate": "update",
+    "ExcalidrawDiagramUpdate": "update",
+    "ExcalidrawElementLinkUpdate": "update",
+    "ExternalDocumentUpdate": "update",
+    "McpAuditLogUpdate": "update",
+    "McpConfigurationUpdate": "update",
+    "McpOauthTokenUpdate": "update",
+    "McpOauthTransactionUpdate": "update",
+    "McpProfileUpdate": "update",
+    "McpProxyConfigUpdate": "update",
+    "McpRegistrySyncStatusUpdate": "update",
+    "McpServerSecurityReviewUpdate": "update",
+    "McpServerUsageLogUpdate": "update",
+    "McpServerUpdate": "update",
+    "McpSessionUpdate": "update",
+    "ModelUpdate": "update",
+    "NotificationUpdate": "update",
+    "OrganizationInvitationUpdate": "update",
+    "OrganizationMemberUpdate": "update",
+    "OrganizationUpdate": "update",
+    "PgAllForeignKeyUpdate": "update",
+    "PlatformAdminUpdate": "update",
+    "ProfileUpdate": "update",
+    "ProjectInvitationUpdate": "update",
+    "ProjectMemberUpdate": "update",
+    "ProjectUpdate": "update",
+    "PropertyUpdate": "update",
+    "RagEmbeddingUpdate": "update",
+    "RagSearchAnalyticUpdate": "update",
+    "ReactFlowDiagramUpdate": "update",
+    "RequirementTestUpdate": "update",
+    "RequirementUpdate": "update",
+    "RequirementsClosureUpdate": "update",
+    "SignupRequestUpdate": "update",
+    "StripeCustomerUpdate": "update",
+    "SystemPromptUpdate": "update",
+    "TableRowUpdate": "update",
+    "TestMatrixViewUpdate": "update",
+    "TestReqUpdate": "update",
+    "TraceLinkUpdate": "update",
+    "UsageLogUpdate": "update",
+    "UserMcpServerUpdate": "update",
+    "UserRoleUpdate": "update",
+    "AdminAuditLog": "operational",
+    "AgentHealth": "operational",
+    "Agent": "operational",
+    "ApiKey": "operational",
+    "Assignment": "operational",
+    "AuditLog": "operational",
+    "BillingCache": "operational",
+    "Block": "operational",
+    "ChatMessage": "operational",
+    "ChatSession": "operational",
+    "Column": "operational",
+    "DiagramElementLink": "operational",
+    "DiagramElementLinksWithDetail": "operational",
+    "Document": "operational",
+    "EmbeddingCache": "operational",
+    "ExcalidrawDiagram": "operational",
+    "ExcalidrawElementLink": "operational",
+    "ExternalDocument": "operational",
+    "McpAuditLog": "operational",
+    "McpConfiguration": "operational",
+    "McpOauthToken": "operational",
+    "McpOauthTransaction": "operational",
+    "McpProfile": "operational",
+    "McpProxyConfig": "operational",
+    "McpRegistrySyncStatus": "operational",
+    "McpServerSecurityReview": "operational",
+    "McpServerUsageLog": "operational",
+    "McpServer": "operational",
+    "McpSession": "operational",
+    "Model": "operational",
+    "Notification": "operational",
+    "OrganizationInvitation": "operational",
+    "OrganizationMember": "operational",
+    "Organization": "operational",
+    "PgAllForeignKey": "operational",
+    "PlatformAdmin": "operational",
+    "Profile": "operational",
+    "ProjectInvitation": "operational",
+    "ProjectMember": "operational",
+    "Project": "operational",
+    "Property": "operational",
+    "RagEmbedding": "operational",
+    "RagSearchAnalytic": "operational",
+    "ReactFlowDiagram": "operational",
+    "RequirementTest": "operational",
+    "Requirement": "operational",
+    "RequirementsClosure": "operational",
+    "SignupRequest": "operational",
+    "StripeCustomer": "operational",
+    "SystemPrompt": "operational",
+    "TableRow": "operational",
+    "TapFunky": "operational",
+    "TestMatrixView": "operational",
+    "TestReq": "operational",
+    "TraceLink": "operational",
+    "UsageLog": "operational",
+    "UserMcpServer": "operational",
+    "UserRole": "operational",
+    "VAgentStatus": "operational",
+    "VRecentSession": "operational",
+}
+
+__all__ = sorted(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return __all__
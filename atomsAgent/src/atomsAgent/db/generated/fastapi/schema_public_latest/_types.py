@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import Annotated, Any, Literal
+
+from pydantic import Json
+from pydantic.types import StringConstraints
+from typing_extensions import TypeAliasType
+
+# JSON/JSONB columns share one alias so pydantic builds a single core schema for them.
+JsonLike = TypeAliasType("JsonLike", dict | list[dict] | list[Any] | Json)
+
+Str2_255 = Annotated[str, StringConstraints(min_length=2, max_length=255)]
+
+
+# ENUM TYPES
+# These are generated from Postgres user-defined enum types.
+
+class PublicEntityTypeEnum(str, Enum):
+	DOCUMENT = "document"
+	REQUIREMENT = "requirement"
+
+class PublicAssignmentRoleEnum(str, Enum):
+	ASSIGNEE = "assignee"
+	REVIEWER = "reviewer"
+	APPROVER = "approver"
+
+class PublicRequirementStatusEnum(str, Enum):
+	ACTIVE = "active"
+	ARCHIVED = "archived"
+	DRAFT = "draft"
+	DELETED = "deleted"
+	IN_REVIEW = "in_review"
+	IN_PROGRESS = "in_progress"
+	APPROVED = "approved"
+	REJECTED = "rejected"
+
+class PublicAuditEventTypeEnum(str, Enum):
+	LOGIN = "login"
+	LOGOUT = "logout"
+	LOGIN_FAILED = "login_failed"
+	PASSWORD_CHANGE = "password_change"
+	MFA_ENABLED = "mfa_enabled"
+	MFA_DISABLED = "mfa_disabled"
+	PERMISSION_GRANTED = "permission_granted"
+	PERMISSION_DENIED = "permission_denied"
+	ROLE_ASSIGNED = "role_assigned"
+	ROLE_REMOVED = "role_removed"
+	DATA_CREATED = "data_created"
+	DATA_READ = "data_read"
+	DATA_UPDATED = "data_updated"
+	DATA_DELETED = "data_deleted"
+	DATA_EXPORTED = "data_exported"
+	SYSTEM_CONFIG_CHANGED = "system_config_changed"
+	BACKUP_CREATED = "backup_created"
+	BACKUP_RESTORED = "backup_restored"
+	SECURITY_VIOLATION = "security_violation"
+	SUSPICIOUS_ACTIVITY = "suspicious_activity"
+	RATE_LIMIT_EXCEEDED = "rate_limit_exceeded"
+	COMPLIANCE_REPORT_GENERATED = "compliance_report_generated"
+	AUDIT_LOG_ACCESSED = "audit_log_accessed"
+	DATA_RETENTION_APPLIED = "data_retention_applied"
+
+class PublicAuditSeverityEnum(str, Enum):
+	LOW = "low"
+	MEDIUM = "medium"
+	HIGH = "high"
+	CRITICAL = "critical"
+
+class PublicResourceTypeEnum(str, Enum):
+	ORGANIZATION = "organization"
+	PROJECT = "project"
+	DOCUMENT = "document"
+	REQUIREMENT = "requirement"
+	USER = "user"
+	MEMBER = "member"
+	INVITATION = "invitation"
+	ROLE = "role"
+	PERMISSION = "permission"
+	EXTERNAL_DOCUMENT = "external_document"
+	DIAGRAM = "diagram"
+	TRACE_LINK = "trace_link"
+	ASSIGNMENT = "assignment"
+	AUDIT_LOG = "audit_log"
+	SECURITY_EVENT = "security_event"
+	SYSTEM_CONFIG = "system_config"
+	COMPLIANCE_REPORT = "compliance_report"
+
+class PublicUserRoleTypeEnum(str, Enum):
+	MEMBER = "member"
+	ADMIN = "admin"
+	OWNER = "owner"
+	SUPER_ADMIN = "super_admin"
+
+class PublicInvitationStatusEnum(str, Enum):
+	PENDING = "pending"
+	ACCEPTED = "accepted"
+	REJECTED = "rejected"
+	REVOKED = "revoked"
+
+class PublicUserStatusEnum(str, Enum):
+	ACTIVE = "active"
+	INACTIVE = "inactive"
+
+class PublicBillingPlanEnum(str, Enum):
+	FREE = "free"
+	PRO = "pro"
+	ENTERPRISE = "enterprise"
+
+class PublicPricingPlanIntervalEnum(str, Enum):
+	NONE = "none"
+	MONTH = "month"
+	YEAR = "year"
+
+class PublicProjectRoleEnum(str, Enum):
+	OWNER = "owner"
+	ADMIN = "admin"
+	MAINTAINER = "maintainer"
+	EDITOR = "editor"
+	VIEWER = "viewer"
+
+class PublicVisibilityEnum(str, Enum):
+	PRIVATE = "private"
+	TEAM = "team"
+	ORGANIZATION = "organization"
+	PUBLIC = "public"
+
+class PublicProjectStatusEnum(str, Enum):
+	ACTIVE = "active"
+	ARCHIVED = "archived"
+	DRAFT = "draft"
+	DELETED = "deleted"
+
+class PublicExecutionStatusEnum(str, Enum):
+	NOT_EXECUTED = "not_executed"
+	IN_PROGRESS = "in_progress"
+	PASSED = "passed"
+	FAILED = "failed"
+	BLOCKED = "blocked"
+	SKIPPED = "skipped"
+
+class PublicRequirementPriorityEnum(str, Enum):
+	LOW = "low"
+	MEDIUM = "medium"
+	HIGH = "high"
+	CRITICAL = "critical"
+
+class PublicRequirementLevelEnum(str, Enum):
+	COMPONENT = "component"
+	SYSTEM = "system"
+	SUBSYSTEM = "subsystem"
+
+class PublicSubscriptionStatusEnum(str, Enum):
+	ACTIVE = "active"
+	INACTIVE = "inactive"
+	TRIALING = "trialing"
+	PAST_DUE = "past_due"
+	CANCELED = "canceled"
+	PAUSED = "paused"
+
+class PublicTestTypeEnum(str, Enum):
+	UNIT = "unit"
+	INTEGRATION = "integration"
+	SYSTEM = "system"
+	ACCEPTANCE = "acceptance"
+	PERFORMANCE = "performance"
+	SECURITY = "security"
+	USABILITY = "usability"
+	OTHER = "other"
+
+class PublicTestPriorityEnum(str, Enum):
+	CRITICAL = "critical"
+	HIGH = "high"
+	MEDIUM = "medium"
+	LOW = "low"
+
+class PublicTestStatusEnum(str, Enum):
+	DRAFT = "draft"
+	READY = "ready"
+	IN_PROGRESS = "in_progress"
+	BLOCKED = "blocked"
+	COMPLETED = "completed"
+	OBSOLETE = "obsolete"
+
+class PublicTestMethodEnum(str, Enum):
+	MANUAL = "manual"
+	AUTOMATED = "automated"
+	HYBRID = "hybrid"
+
+class PublicTraceLinkTypeEnum(str, Enum):
+	DERIVES_FROM = "derives_from"
+	IMPLEMENTS = "implements"
+	RELATES_TO = "relates_to"
+	CONFLICTS_WITH = "conflicts_with"
+	IS_RELATED_TO = "is_related_to"
+	PARENT_OF = "parent_of"
+	CHILD_OF = "child_of"
+
+
+
+PublicEntityTypeLiteral = Literal["document", "requirement"]
+PublicAssignmentRoleLiteral = Literal["assignee", "reviewer", "approver"]
+PublicRequirementStatusLiteral = Literal["active", "archived", "draft", "deleted", "in_review", "in_progress", "approved", "rejected"]
+PublicAuditEventTypeLiteral = Literal["login", "logout", "login_failed", "password_change", "mfa_enabled", "mfa_disabled", "permission_granted", "permission_denied", "role_assigned", "role_removed", "data_created", "data_read", "data_updated", "data_deleted", "data_exported", "system_config_changed", "backup_created", "backup_restored", "security_violation", "suspicious_activity", "rate_limit_exceeded", "compliance_report_generated", "audit_log_accessed", "data_retention_applied"]
+PublicAuditSeverityLiteral = Literal["low", "medium", "high", "critical"]
+PublicResourceTypeLiteral = Literal["organization", "project", "document", "requirement", "user", "member", "invitation", "role", "permission", "external_document", "diagram", "trace_link", "assignment", "audit_log", "security_event", "system_config", "compliance_report"]
+PublicUserRoleTypeLiteral = Literal["member", "admin", "owner", "super_admin"]
+PublicInvitationStatusLiteral = Literal["pending", "accepted", "rejected", "revoked"]
+PublicUserStatusLiteral = Literal["active", "inactive"]
+PublicBillingPlanLiteral = Literal["free", "pro", "enterprise"]
+PublicPricingPlanIntervalLiteral = Literal["none", "month", "year"]
+PublicProjectRoleLiteral = Literal["owner", "admin", "maintainer", "editor", "viewer"]
+PublicVisibilityLiteral = Literal["private", "team", "organization", "public"]
+PublicProjectStatusLiteral = Literal["active", "archived", "draft", "deleted"]
+PublicExecutionStatusLiteral = Literal["not_executed", "in_progress", "passed", "failed", "blocked", "skipped"]
+PublicRequirementPriorityLiteral = Literal["low", "medium", "high", "critical"]
+PublicRequirementLevelLiteral = Literal["component", "system", "subsystem"]
+PublicSubscriptionStatusLiteral = Literal["active", "inactive", "trialing", "past_due", "canceled", "paused"]
+PublicTestTypeLiteral = Literal["unit", "integration", "system", "acceptance", "performance", "security", "usability", "other"]
+PublicTestPriorityLiteral = Literal["critical", "high", "medium", "low"]
+PublicTestStatusLiteral = Literal["draft", "ready", "in_progress", "blocked", "completed", "obsolete"]
+PublicTestMethodLiteral = Literal["manual", "automated", "hybrid"]
+PublicTraceLinkTypeLiteral = Literal["derives_from", "implements", "relates_to", "conflicts_with", "is_related_to", "parent_of", "child_of"]
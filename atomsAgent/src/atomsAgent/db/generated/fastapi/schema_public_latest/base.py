@@ -0,0 +1,1371 @@
+from __future__ import annotations
+
+import datetime
+from typing import Any
+
+from pydantic import UUID4, IPvAnyAddress
+
+from atomsAgent.db.base import CustomModel
+
+from ._types import (
+	JsonLike,
+	PublicAssignmentRoleEnum,
+	PublicAuditEventTypeEnum,
+	PublicAuditSeverityEnum,
+	PublicBillingPlanEnum,
+	PublicEntityTypeEnum,
+	PublicExecutionStatusEnum,
+	PublicInvitationStatusEnum,
+	PublicPricingPlanIntervalEnum,
+	PublicProjectRoleEnum,
+	PublicProjectStatusEnum,
+	PublicRequirementLevelEnum,
+	PublicRequirementPriorityEnum,
+	PublicRequirementStatusEnum,
+	PublicResourceTypeEnum,
+	PublicSubscriptionStatusEnum,
+	PublicTestMethodEnum,
+	PublicTestPriorityEnum,
+	PublicTestStatusEnum,
+	PublicTestTypeEnum,
+	PublicTraceLinkTypeEnum,
+	PublicUserRoleTypeEnum,
+	PublicUserStatusEnum,
+	PublicVisibilityEnum,
+	Str2_255,
+)
+
+# CUSTOM CLASSES
+# Note: These are custom model classes for defining common features among
+# Pydantic Base Schema.
+# They live in atomsAgent.db.base so customisations survive regeneration.
+
+
+# BASE CLASSES
+# Note: These are the base Row models that include all fields.
+
+
+class AdminAuditLogBaseSchema(CustomModel):
+	"""AdminAuditLog Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	action: str
+	admin_id: UUID4
+	created_at: datetime.datetime | None = None
+	details: JsonLike | None = None
+	ip_address: str | None = None
+	target_org_id: str | None = None
+	target_user_id: str | None = None
+
+
+class AgentHealthBaseSchema(CustomModel):
+	"""AgentHealth Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	agent_id: UUID4
+	consecutive_failures: int | None = None
+	created_at: datetime.datetime | None = None
+	last_check: datetime.datetime | None = None
+	last_error: str | None = None
+	metadata: JsonLike | None = None
+	status: str
+	updated_at: datetime.datetime | None = None
+
+
+class AgentBaseSchema(CustomModel):
+	"""Agent Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	config: JsonLike | None = None  # Provider-specific configuration: {provider, location, api_key}
+	created_at: datetime.datetime | None = None
+	description: str | None = None
+	enabled: bool | None = None
+	type: str
+	name: str
+	updated_at: datetime.datetime | None = None
+
+
+class ApiKeyBaseSchema(CustomModel):
+	"""ApiKey Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	description: str | None = None
+	expires_at: datetime.datetime | None = None
+	is_active: bool | None = None  # Whether this key is active (soft delete via this flag)
+	key_hash: str  # SHA256 hash of the actual API key (never store plaintext keys)
+	last_used_at: datetime.datetime | None = None
+	name: str | None = None
+	organization_id: str
+	updated_at: datetime.datetime | None = None
+	user_id: str
+
+
+class AssignmentBaseSchema(CustomModel):
+	"""Assignment Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	assignee_id: UUID4
+	comment: str | None = None
+	completed_at: datetime.datetime | None = None
+	created_at: datetime.datetime | None = None
+	created_by: UUID4 | None = None
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	due_date: datetime.datetime | None = None
+	entity_id: UUID4
+	entity_type: PublicEntityTypeEnum
+	is_deleted: bool | None = None
+	role: PublicAssignmentRoleEnum
+	status: PublicRequirementStatusEnum
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4 | None = None
+	version: int
+
+
+class AuditLogBaseSchema(CustomModel):
+	"""AuditLog Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	action: str
+	actor_id: UUID4 | None = None
+	compliance_category: str | None = None
+	correlation_id: UUID4 | None = None
+	created_at: datetime.datetime
+	description: str | None = None
+	details: JsonLike | None = None
+	entity_id: UUID4
+	entity_type: str
+	event_type: PublicAuditEventTypeEnum | None = None
+	ip_address: IPvAnyAddress | None = None
+	metadata: JsonLike | None = None
+	new_data: JsonLike | None = None
+	old_data: JsonLike | None = None
+	organization_id: UUID4 | None = None
+	project_id: UUID4 | None = None
+	resource_id: UUID4 | None = None
+	resource_type: PublicResourceTypeEnum | None = None
+	risk_level: str | None = None
+	session_id: str | None = None
+	severity: PublicAuditSeverityEnum | None = None
+	soc2_control: str | None = None
+	source_system: str | None = None
+	threat_indicators: list[str] | None = None
+	timestamp: datetime.datetime | None = None
+	updated_at: datetime.datetime | None = None
+	user_agent: str | None = None
+	user_id: UUID4 | None = None
+
+
+class BillingCacheBaseSchema(CustomModel):
+	"""BillingCache Base Schema."""
+
+	# Primary Keys
+	organization_id: UUID4
+
+	# Columns
+	billing_status: JsonLike
+	current_period_usage: JsonLike
+	period_end: datetime.datetime
+	period_start: datetime.datetime
+	synced_at: datetime.datetime
+
+
+class BlockBaseSchema(CustomModel):
+	"""Block Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	content: JsonLike | None = None
+	created_at: datetime.datetime | None = None
+	created_by: UUID4 | None = None
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	document_id: UUID4
+	type: str
+	is_deleted: bool | None = None
+	name: str
+	org_id: UUID4 | None = None
+	position: int
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4 | None = None
+	version: int
+
+
+class ChatMessageBaseSchema(CustomModel):
+	"""ChatMessage Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	content: str
+	created_at: datetime.datetime | None = None
+	is_active: bool
+	message_index: int  # Sequential index of message within session (0-based, for ordering)
+	metadata: JsonLike | None = None  # Message metadata: {model_used, latency_ms, cost}
+	parent_id: UUID4 | None = None
+	role: str
+	sequence: int  # Sequential order of messages within a session
+	session_id: UUID4
+	tokens_in: int | None = None
+	tokens_out: int | None = None
+	tokens_total: int | None = None
+	updated_at: datetime.datetime | None = None  # Last update timestamp for message edits
+	variant_index: int
+
+
+class ChatSessionBaseSchema(CustomModel):
+	"""ChatSession Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	agent_id: UUID4 | None = None
+	agent_type: str | None = None
+	archived: bool  # Whether this session is archived (hidden from default lists)
+	created_at: datetime.datetime | None = None
+	model_id: UUID4 | None = None
+	last_message_at: datetime.datetime | None = None
+	message_count: int  # Total number of messages in this session
+	metadata: JsonLike | None = None  # Session metadata: {system_prompt, temperature, max_tokens}
+	model: str | None = None  # Model identifier used for this chat session
+	org_id: UUID4 | None = None
+	title: str | None = None
+	tokens_in: int  # Total input tokens used in this session
+	tokens_out: int  # Total output tokens generated in this session
+	tokens_total: int  # Total tokens (in + out) for this session
+	updated_at: datetime.datetime | None = None
+	user_id: UUID4
+
+
+class ColumnBaseSchema(CustomModel):
+	"""Column Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	block_id: UUID4 | None = None
+	created_at: datetime.datetime | None = None
+	created_by: UUID4 | None = None
+	default_value: str | None = None
+	is_hidden: bool | None = None
+	is_pinned: bool | None = None
+	position: float
+	property_id: UUID4
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4 | None = None
+	width: int | None = None
+
+
+class DiagramElementLinkBaseSchema(CustomModel):
+	"""DiagramElementLink Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	created_by: UUID4 | None = None
+	diagram_id: UUID4
+	element_id: str  # Excalidraw element ID from the diagram
+	link_type: str | None = None  # Whether link was created manually or auto-detected
+	metadata: JsonLike | None = None  # Additional data like element type, text, confidence scores
+	requirement_id: UUID4
+	updated_at: datetime.datetime | None = None
+
+
+class DiagramElementLinksWithDetailBaseSchema(CustomModel):
+	"""DiagramElementLinksWithDetail Base Schema."""
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	created_by: UUID4 | None = None
+	created_by_avatar: str | None = None
+	created_by_name: str | None = None
+	diagram_id: UUID4 | None = None
+	diagram_name: str | None = None
+	element_id: str | None = None
+	id: UUID4 | None = None
+	link_type: str | None = None
+	metadata: JsonLike | None = None
+	requirement_description: str | None = None
+	requirement_id: UUID4 | None = None
+	requirement_name: str | None = None
+	updated_at: datetime.datetime | None = None
+
+
+class DocumentBaseSchema(CustomModel):
+	"""Document Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	created_by: UUID4 | None = None
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	description: str | None = None
+	embedding: Any | None = None
+	fts_vector: str | None = None  # Full-text search vector: name(A) + description(B) + slug(C)
+	is_deleted: bool | None = None
+	name: str
+	project_id: UUID4
+	slug: str
+	tags: list[str] | None = None
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4 | None = None
+	version: int
+
+
+class EmbeddingCacheBaseSchema(CustomModel):
+	"""EmbeddingCache Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	access_count: int | None = None
+	accessed_at: datetime.datetime | None = None
+	cache_key: str
+	created_at: datetime.datetime | None = None
+	embedding: Any | None = None
+	model: str
+	tokens_used: int
+
+
+class ExcalidrawDiagramBaseSchema(CustomModel):
+	"""ExcalidrawDiagram Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	created_by: UUID4 | None = None
+	diagram_data: JsonLike | None = None
+	name: str | None = None
+	organization_id: UUID4 | None = None
+	project_id: UUID4 | None = None
+	thumbnail_url: str | None = None
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4 | None = None
+
+
+class ExcalidrawElementLinkBaseSchema(CustomModel):
+	"""ExcalidrawElementLink Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	create_by: UUID4 | None = None
+	created_at: datetime.datetime
+	element_id: str | None = None
+	excalidraw_canvas_id: UUID4 | None = None
+	requirement_id: UUID4 | None = None
+
+
+class ExternalDocumentBaseSchema(CustomModel):
+	"""ExternalDocument Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	created_by: UUID4 | None = None
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	type: str | None = None
+	gumloop_name: str | None = None
+	is_deleted: bool | None = None
+	name: str
+	organization_id: UUID4
+	owned_by: UUID4 | None = None
+	size: int | None = None
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4 | None = None
+	url: str | None = None
+
+
+class McpAuditLogBaseSchema(CustomModel):
+	"""McpAuditLog Base Schema."""
+
+	# Primary Keys
+	id: int
+
+	# Columns
+	action: str
+	details: str | None = None
+	ip_address: str | None = None
+	org_id: str
+	resource_id: str | None = None
+	resource_type: str
+	timestamp: datetime.datetime
+	user_agent: str | None = None
+	user_id: str
+
+
+class McpConfigurationBaseSchema(CustomModel):
+	"""McpConfiguration Base Schema."""
+
+	# Primary Keys
+	id: str
+
+	# Columns
+	args: str | None = None
+	auth_header: str | None = None
+	auth_token: str | None = None
+	auth_type: str
+	command: str | None = None
+	config: str | None = None
+	created_at: datetime.datetime
+	created_by: str
+	description: str | None = None
+	enabled: bool
+	endpoint: str | None = None
+	type: str
+	name: str
+	org_id: str | None = None
+	scope: str
+	updated_at: datetime.datetime
+	updated_by: str
+	user_id: str | None = None
+
+
+class McpOauthTokenBaseSchema(CustomModel):
+	"""McpOauthToken Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	access_token: str | None = None
+	expires_at: datetime.datetime | None = None
+	issued_at: datetime.datetime
+	mcp_namespace: str
+	organization_id: UUID4 | None = None
+	provider_key: str
+	refresh_token: str | None = None
+	scope: str | None = None
+	token_type: str | None = None
+	transaction_id: UUID4
+	upstream_response: JsonLike | None = None
+	user_id: UUID4 | None = None
+
+
+class McpOauthTransactionBaseSchema(CustomModel):
+	"""McpOauthTransaction Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	authorization_url: str | None = None
+	code_challenge: str | None = None
+	code_verifier: str | None = None
+	completed_at: datetime.datetime | None = None
+	created_at: datetime.datetime
+	error: JsonLike | None = None
+	mcp_namespace: str
+	organization_id: UUID4 | None = None
+	provider_key: str
+	scopes: list[str] | None = None
+	state: str | None = None
+	status: str
+	updated_at: datetime.datetime
+	upstream_metadata: JsonLike | None = None
+	user_id: UUID4 | None = None
+
+
+class McpProfileBaseSchema(CustomModel):
+	"""McpProfile Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	description: str | None = None
+	name: str
+	servers: JsonLike | None = None
+	updated_at: datetime.datetime | None = None
+	user_id: UUID4
+
+
+class McpProxyConfigBaseSchema(CustomModel):
+	"""McpProxyConfig Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	auth_config: JsonLike  # JSON configuration for authentication (tokens, scopes, etc.)
+	auth_type: str  # Type of authentication: none, bearer, or oauth
+	created_at: datetime.datetime
+	created_by: UUID4
+	error_count: int | None = None
+	health_error: str | None = None
+	health_status: str | None = None
+	last_error: str | None = None
+	last_error_at: datetime.datetime | None = None
+	last_health_check: datetime.datetime | None = None
+	last_used_at: datetime.datetime | None = None
+	organization_id: UUID4 | None = None
+	proxy_status: str | None = None  # Current status of the proxy: pending, active, error, or disabled
+	proxy_url: str | None = None  # URL of the FastMCP proxy instance
+	request_count: int | None = None
+	server_name: str  # Unique name for the MCP server
+	server_url: str  # URL of the upstream MCP server
+	updated_at: datetime.datetime
+
+
+class McpRegistrySyncStatusBaseSchema(CustomModel):
+	"""McpRegistrySyncStatus Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime
+	error_details: JsonLike | None = None
+	error_message: str | None = None
+	servers_added: int | None = None
+	servers_failed: int | None = None
+	servers_removed: int | None = None
+	servers_updated: int | None = None
+	sync_completed_at: datetime.datetime | None = None
+	sync_started_at: datetime.datetime
+	sync_status: str
+
+
+class McpServerSecurityReviewBaseSchema(CustomModel):
+	"""McpServerSecurityReview Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	auth_review_notes: str | None = None
+	auth_review_passed: bool | None = None
+	code_review_notes: str | None = None
+	code_review_passed: bool | None = None
+	created_at: datetime.datetime
+	dependency_review_notes: str | None = None
+	dependency_review_passed: bool | None = None
+	expires_at: datetime.datetime | None = None
+	license_review_notes: str | None = None
+	license_review_passed: bool | None = None
+	network_review_notes: str | None = None
+	network_review_passed: bool | None = None
+	notes: str | None = None
+	recommendations: str | None = None
+	review_date: datetime.datetime
+	reviewed_by: str
+	reviewer_email: str | None = None
+	risk_level: str | None = None
+	security_scan_notes: str | None = None
+	security_scan_passed: bool | None = None
+	security_scan_results: JsonLike | None = None
+	server_id: UUID4
+	status: str
+	updated_at: datetime.datetime
+
+
+class McpServerUsageLogBaseSchema(CustomModel):
+	"""McpServerUsageLog Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime
+	duration_ms: int | None = None
+	error_code: str | None = None
+	error_message: str | None = None
+	ip_address: IPvAnyAddress | None = None
+	request_params: JsonLike | None = None
+	server_id: UUID4
+	success: bool
+	tool_name: str | None = None
+	user_agent: str | None = None
+	user_id: UUID4
+	user_server_id: UUID4
+
+
+class McpServerBaseSchema(CustomModel):
+	"""McpServer Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	active_users: int | None = None
+	auth_config: JsonLike | None = None
+	auth_type: str  # Authentication type: oauth or bearer
+	category: str | None = None
+	created_at: datetime.datetime
+	created_by: UUID4 | None = None
+	deprecated: bool | None = None
+	deprecation_date: datetime.datetime | None = None
+	deprecation_reason: str | None = None
+	description: str | None = None
+	documentation_url: str | None = None
+	downloads: int | None = None
+	enabled: bool | None = None
+	env: JsonLike | None = None  # Environment variables for the MCP server
+	health_status: str | None = None
+	homepage_url: str | None = None
+	install_count: int | None = None
+	last_health_check: datetime.datetime | None = None
+	last_synced_at: datetime.datetime | None = None
+	last_updated_at: datetime.datetime | None = None
+	license: str | None = None
+	metadata: JsonLike | None = None  # Additional server metadata stored as JSON
+	name: str
+	namespace: str  # Unique namespace (e.g., io.github.anthropic/mcp-server-github)
+	organization_id: UUID4 | None = None
+	project_id: UUID4 | None = None
+	publisher_namespace: str | None = None
+	publisher_type: str | None = None
+	publisher_verified: bool | None = None  # Whether publisher identity is verified
+	repository_url: str | None = None
+	scope: str | None = None  # Installation scope: user, organization, or system
+	security_notes: str | None = None
+	security_review_date: datetime.datetime | None = None
+	security_review_expires_at: datetime.datetime | None = None
+	security_review_status: str | None = None  # Current security review status
+	security_reviewed_by: str | None = None
+	source: str
+	stars: int | None = None
+	sync_source: str | None = None
+	tags: list[str] | None = None
+	tier: str  # Server tier: first-party (atoms.tech), curated (reviewed), community (user risk)
+	transport: str  # Transport type: sse or http (NO stdio in shared containers)
+	transport_config: JsonLike | None = None
+	transport_type: str | None = None
+	updated_at: datetime.datetime
+	url: str
+	user_id: UUID4 | None = None  # User who installed this server (for user scope)
+	version: str
+
+
+class McpSessionBaseSchema(CustomModel):
+	"""McpSession Base Schema."""
+
+	# Primary Keys
+	session_id: str
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	expires_at: datetime.datetime
+	mcp_state: JsonLike | None = None
+	oauth_data: JsonLike
+	updated_at: datetime.datetime | None = None
+	user_id: UUID4
+
+
+class ModelBaseSchema(CustomModel):
+	"""Model Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	agent_id: UUID4
+	config: JsonLike | None = None  # Model-specific settings: {temperature, max_tokens, top_p}
+	created_at: datetime.datetime | None = None
+	description: str | None = None
+	display_name: str | None = None
+	enabled: bool | None = None
+	model_id: str | None = None
+	name: str
+	provider: str | None = None
+	updated_at: datetime.datetime | None = None
+
+
+class NotificationBaseSchema(CustomModel):
+	"""Notification Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	type: Any
+	message: str | None = None
+	metadata: JsonLike | None = None
+	read_at: datetime.datetime | None = None
+	title: str
+	unread: bool | None = None
+	user_id: UUID4
+
+
+class OrganizationInvitationBaseSchema(CustomModel):
+	"""OrganizationInvitation Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	created_by: UUID4
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	email: str
+	expires_at: datetime.datetime
+	is_deleted: bool | None = None
+	metadata: JsonLike | None = None
+	organization_id: UUID4
+	role: PublicUserRoleTypeEnum
+	status: PublicInvitationStatusEnum
+	token: UUID4
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4
+
+
+class OrganizationMemberBaseSchema(CustomModel):
+	"""OrganizationMember Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	is_deleted: bool | None = None
+	last_active_at: datetime.datetime | None = None
+	organization_id: UUID4
+	permissions: JsonLike | None = None
+	role: PublicUserRoleTypeEnum
+	status: PublicUserStatusEnum | None = None
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4 | None = None
+	user_id: UUID4
+
+
+class OrganizationBaseSchema(CustomModel):
+	"""Organization Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	billing_cycle: PublicPricingPlanIntervalEnum
+	billing_plan: PublicBillingPlanEnum
+	created_at: datetime.datetime | None = None
+	created_by: UUID4
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	description: str | None = None
+	embedding: Any | None = None
+	type: Any
+	fts_vector: str | None = None  # Full-text search vector: name(A) + description(B) + slug(C)
+	is_deleted: bool | None = None
+	logo_url: str | None = None
+	max_members: int
+	max_monthly_requests: int
+	member_count: int | None = None
+	metadata: JsonLike | None = None
+	name: Str2_255
+	owner_id: UUID4 | None = None
+	settings: JsonLike | None = None
+	slug: str
+	status: PublicUserStatusEnum | None = None
+	storage_used: int | None = None
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4
+
+
+class PgAllForeignKeyBaseSchema(CustomModel):
+	"""PgAllForeignKey Base Schema."""
+
+	# Columns
+	fk_columns: list[Any] | None = None
+	fk_constraint_name: Any | None = None
+	fk_schema_name: Any | None = None
+	fk_table_name: Any | None = None
+	fk_table_oid: Any | None = None
+	is_deferrable: bool | None = None
+	is_deferred: bool | None = None
+	match_type: str | None = None
+	on_delete: str | None = None
+	on_update: str | None = None
+	pk_columns: list[Any] | None = None
+	pk_constraint_name: Any | None = None
+	pk_index_name: Any | None = None
+	pk_schema_name: Any | None = None
+	pk_table_name: Any | None = None
+	pk_table_oid: Any | None = None
+
+
+class PlatformAdminBaseSchema(CustomModel):
+	"""PlatformAdmin Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	added_at: datetime.datetime | None = None
+	added_by: UUID4 | None = None
+	created_at: datetime.datetime | None = None
+	email: str
+	is_active: bool | None = None
+	name: str | None = None
+	updated_at: datetime.datetime | None = None
+	workos_user_id: str
+
+
+class ProfileBaseSchema(CustomModel):
+	"""Profile Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	avatar_url: str | None = None
+	created_at: datetime.datetime | None = None
+	current_organization_id: UUID4 | None = None
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	email: str
+	full_name: str | None = None
+	is_approved: bool
+	is_deleted: bool | None = None
+	job_title: str | None = None
+	last_login_at: datetime.datetime | None = None
+	login_count: int | None = None
+	personal_organization_id: UUID4 | None = None
+	pinned_organization_id: UUID4 | None = None
+	preferences: JsonLike | None = None
+	status: PublicUserStatusEnum | None = None
+	updated_at: datetime.datetime | None = None
+	workos_id: str | None = None
+
+
+class ProjectInvitationBaseSchema(CustomModel):
+	"""ProjectInvitation Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	created_by: UUID4
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	email: str
+	expires_at: datetime.datetime
+	is_deleted: bool | None = None
+	metadata: JsonLike | None = None
+	project_id: UUID4
+	role: PublicProjectRoleEnum
+	status: PublicInvitationStatusEnum
+	token: UUID4
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4
+
+
+class ProjectMemberBaseSchema(CustomModel):
+	"""ProjectMember Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	is_deleted: bool | None = None
+	last_accessed_at: datetime.datetime | None = None
+	org_id: UUID4 | None = None
+	permissions: JsonLike | None = None
+	project_id: UUID4
+	role: PublicProjectRoleEnum
+	status: PublicUserStatusEnum | None = None
+	updated_at: datetime.datetime | None = None
+	user_id: UUID4
+
+
+class ProjectBaseSchema(CustomModel):
+	"""Project Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	created_by: UUID4
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	description: str | None = None
+	embedding: Any | None = None
+	fts_vector: str | None = None  # Full-text search vector: name(A) + description(B) + slug(C)
+	is_deleted: bool | None = None
+	metadata: JsonLike | None = None
+	name: Str2_255
+	organization_id: UUID4
+	owned_by: UUID4
+	settings: JsonLike | None = None
+	slug: str
+	star_count: int | None = None
+	status: PublicProjectStatusEnum
+	tags: list[str] | None = None
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4
+	version: int | None = None
+	visibility: PublicVisibilityEnum
+
+
+class PropertyBaseSchema(CustomModel):
+	"""Property Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	created_by: UUID4 | None = None
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	document_id: UUID4 | None = None
+	is_base: bool | None = None
+	is_deleted: bool
+	name: str
+	options: JsonLike | None = None
+	org_id: UUID4
+	project_id: UUID4 | None = None
+	property_type: str
+	scope: str | None = None
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4 | None = None
+
+
+class RagEmbeddingBaseSchema(CustomModel):
+	"""RagEmbedding Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	content_hash: str | None = None
+	created_at: datetime.datetime | None = None
+	embedding: Any
+	entity_id: str
+	entity_type: str
+	metadata: JsonLike | None = None
+	quality_score: float | None = None
+
+
+class RagSearchAnalyticBaseSchema(CustomModel):
+	"""RagSearchAnalytic Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	cache_hit: bool
+	created_at: datetime.datetime | None = None
+	execution_time_ms: int
+	organization_id: UUID4 | None = None
+	query_hash: str
+	query_text: str
+	result_count: int
+	search_type: str
+	user_id: UUID4 | None = None
+
+
+class ReactFlowDiagramBaseSchema(CustomModel):
+	"""ReactFlowDiagram Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	created_by: UUID4 | None = None
+	description: str | None = None
+	diagram_type: str | None = None
+	edges: JsonLike
+	layout_algorithm: str | None = None
+	metadata: JsonLike | None = None
+	name: str
+	nodes: JsonLike
+	project_id: UUID4
+	settings: JsonLike | None = None
+	theme: str | None = None
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4 | None = None
+	viewport: JsonLike | None = None
+
+
+class RequirementTestBaseSchema(CustomModel):
+	"""RequirementTest Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	defects: JsonLike | None = None
+	evidence_artifacts: JsonLike | None = None
+	executed_at: datetime.datetime | None = None
+	executed_by: UUID4 | None = None
+	execution_environment: str | None = None
+	execution_status: PublicExecutionStatusEnum
+	execution_version: str | None = None
+	external_req_id: str | None = None
+	external_test_id: str | None = None
+	requirement_id: UUID4
+	result_notes: str | None = None
+	test_id: UUID4
+	updated_at: datetime.datetime | None = None
+
+
+class RequirementBaseSchema(CustomModel):
+	"""Requirement Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	ai_analysis: JsonLike | None = None
+	block_id: UUID4
+	created_at: datetime.datetime | None = None
+	created_by: UUID4 | None = None
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	description: str | None = None
+	document_id: UUID4
+	embedding: Any | None = None
+	enchanced_requirement: str | None = None
+	external_id: str | None = None
+	format: Any
+	type: str | None = None
+	fts_vector: str | None = None  # Full-text search vector: name(A) + description(B) + requirements(C)
+	is_deleted: bool | None = None
+	level: PublicRequirementLevelEnum
+	name: str
+	original_requirement: str | None = None
+	position: float
+	priority: PublicRequirementPriorityEnum
+	properties: JsonLike | None = None
+	status: PublicRequirementStatusEnum
+	tags: list[str] | None = None
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4 | None = None
+	version: int
+
+
+class RequirementsClosureBaseSchema(CustomModel):
+	"""RequirementsClosure Base Schema."""
+
+	# Primary Keys
+	ancestor_id: UUID4
+	descendant_id: UUID4
+
+	# Columns
+	created_at: datetime.datetime
+	created_by: UUID4
+	depth: int
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4 | None = None
+
+
+class SignupRequestBaseSchema(CustomModel):
+	"""SignupRequest Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	approved_at: datetime.datetime | None = None
+	approved_by: UUID4 | None = None
+	created_at: datetime.datetime
+	denial_reason: str | None = None
+	denied_at: datetime.datetime | None = None
+	denied_by: UUID4 | None = None
+	email: str
+	full_name: str
+	message: str | None = None
+	status: str
+	updated_at: datetime.datetime
+
+
+class StripeCustomerBaseSchema(CustomModel):
+	"""StripeCustomer Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	cancel_at_period_end: bool | None = None
+	created_at: datetime.datetime | None = None
+	current_period_end: datetime.datetime | None = None
+	current_period_start: datetime.datetime | None = None
+	organization_id: UUID4 | None = None
+	payment_method_brand: str | None = None
+	payment_method_last4: str | None = None
+	price_id: str | None = None
+	stripe_customer_id: str | None = None
+	stripe_subscription_id: str | None = None
+	subscription_status: PublicSubscriptionStatusEnum
+	updated_at: datetime.datetime | None = None
+
+
+class SystemPromptBaseSchema(CustomModel):
+	"""SystemPrompt Base Schema."""
+
+	# Primary Keys
+	id: str
+
+	# Columns
+	content: str
+	created_at: datetime.datetime
+	created_by: str | None = None
+	description: str | None = None  # Optional description of the system prompt purpose
+	enabled: bool
+	is_default: bool | None = None  # Whether this is the default prompt for its scope
+	is_public: bool | None = None
+	name: str  # Display name for the system prompt
+	organization_id: str | None = None
+	priority: int
+	scope: str
+	tags: list[str] | None = None
+	template: str | None = None
+	updated_at: datetime.datetime
+	updated_by: str | None = None  # User ID who last updated this prompt
+	user_id: str | None = None
+	variables: JsonLike | None = None
+	version: int | None = None  # Version number for tracking changes
+
+
+class TableRowBaseSchema(CustomModel):
+	"""TableRow Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	block_id: UUID4
+	created_at: datetime.datetime | None = None
+	created_by: UUID4 | None = None
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	document_id: UUID4
+	is_deleted: bool | None = None
+	position: float
+	row_data: JsonLike | None = None
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4 | None = None
+	version: int
+
+
+class TapFunkyBaseSchema(CustomModel):
+	"""TapFunky Base Schema."""
+
+	# Columns
+	args: str | None = None
+	is_definer: bool | None = None
+	is_strict: bool | None = None
+	is_visible: bool | None = None
+	kind: Any | None = None
+	langoid: Any | None = None
+	name: Any | None = None
+	oid: Any | None = None
+	owner: Any | None = None
+	returns: str | None = None
+	returns_set: bool | None = None
+	schema: Any | None = None
+	volatility: Any | None = None
+
+
+class TestMatrixViewBaseSchema(CustomModel):
+	"""TestMatrixView Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	configuration: JsonLike
+	created_at: datetime.datetime | None = None
+	created_by: UUID4
+	is_active: bool | None = None
+	is_default: bool | None = None
+	name: str
+	project_id: UUID4
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4
+
+
+class TestReqBaseSchema(CustomModel):
+	"""TestReq Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	attachments: JsonLike | None = None
+	category: list[str] | None = None
+	created_at: datetime.datetime | None = None
+	created_by: UUID4 | None = None
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	description: str | None = None
+	estimated_duration: datetime.timedelta | None = None
+	expected_results: str | None = None
+	is_active: bool | None = None
+	is_deleted: bool
+	method: PublicTestMethodEnum
+	preconditions: str | None = None
+	priority: PublicTestPriorityEnum
+	project_id: UUID4 | None = None
+	result: str | None = None
+	status: PublicTestStatusEnum
+	test_environment: str | None = None
+	test_id: str | None = None
+	test_steps: JsonLike | None = None
+	test_type: PublicTestTypeEnum
+	title: str
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4 | None = None
+	version: str | None = None
+
+
+class TraceLinkBaseSchema(CustomModel):
+	"""TraceLink Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	created_by: UUID4 | None = None
+	deleted_at: datetime.datetime | None = None
+	deleted_by: UUID4 | None = None
+	description: str | None = None
+	is_deleted: bool | None = None
+	link_type: PublicTraceLinkTypeEnum
+	source_id: UUID4
+	source_type: PublicEntityTypeEnum
+	target_id: UUID4
+	target_type: PublicEntityTypeEnum
+	updated_at: datetime.datetime | None = None
+	updated_by: UUID4 | None = None
+	version: int
+
+
+class UsageLogBaseSchema(CustomModel):
+	"""UsageLog Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	created_at: datetime.datetime | None = None
+	feature: str
+	metadata: JsonLike | None = None
+	organization_id: UUID4
+	quantity: int
+	unit_type: str
+	user_id: UUID4
+
+
+class UserMcpServerBaseSchema(CustomModel):
+	"""UserMcpServer Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	auth_token_encrypted: str | None = None
+	custom_config: JsonLike | None = None
+	enabled: bool | None = None
+	error_count: int | None = None
+	health_check_error: str | None = None
+	installed_at: datetime.datetime
+	last_error: str | None = None
+	last_error_at: datetime.datetime | None = None
+	last_health_check: datetime.datetime | None = None
+	last_used_at: datetime.datetime | None = None
+	oauth_tokens_encrypted: str | None = None
+	organization_id: UUID4 | None = None
+	server_id: UUID4
+	status: str | None = None
+	tool_permissions: JsonLike | None = None
+	updated_at: datetime.datetime
+	usage_count: int | None = None
+	user_id: UUID4
+
+
+class UserRoleBaseSchema(CustomModel):
+	"""UserRole Base Schema."""
+
+	# Primary Keys
+	id: UUID4
+
+	# Columns
+	admin_role: PublicUserRoleTypeEnum | None = None
+	created_at: datetime.datetime
+	document_id: UUID4 | None = None
+	document_role: PublicProjectRoleEnum | None = None
+	org_id: UUID4 | None = None
+	project_id: UUID4 | None = None
+	project_role: PublicProjectRoleEnum | None = None
+	updated_at: datetime.datetime
+	user_id: UUID4
+
+
+class VAgentStatusBaseSchema(CustomModel):
+	"""VAgentStatus Base Schema."""
+
+	# Columns
+	consecutive_failures: int | None = None
+	enabled: bool | None = None
+	model_count: int | None = None
+	type: str | None = None
+	health_status: str | None = None
+	id: UUID4 | None = None
+	last_check: datetime.datetime | None = None
+	name: str | None = None
+
+
+class VRecentSessionBaseSchema(CustomModel):
+	"""VRecentSession Base Schema."""
+
+	# Columns
+	agent_name: str | None = None
+	created_at: datetime.datetime | None = None
+	model_name: str | None = None
+	id: UUID4 | None = None
+	last_message_at: datetime.datetime | None = None
+	message_count: int | None = None
+	org_id: UUID4 | None = None
+	title: str | None = None
+	updated_at: datetime.datetime | None = None
+	user_id: UUID4 | None = None
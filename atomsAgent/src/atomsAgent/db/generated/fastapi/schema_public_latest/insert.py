@@ -0,0 +1,1845 @@
+from __future__ import annotations
+
+import datetime
+from typing import Any
+
+from pydantic import IPvAnyAddress
+
+from atomsAgent.db.base import CustomModelInsert, UUIDStr
+
+from ._types import (
+	PublicAssignmentRoleLiteral,
+	PublicAuditEventTypeLiteral,
+	PublicAuditSeverityLiteral,
+	PublicBillingPlanLiteral,
+	PublicEntityTypeLiteral,
+	PublicExecutionStatusLiteral,
+	PublicInvitationStatusLiteral,
+	PublicPricingPlanIntervalLiteral,
+	PublicProjectRoleLiteral,
+	PublicProjectStatusLiteral,
+	PublicRequirementLevelLiteral,
+	PublicRequirementPriorityLiteral,
+	PublicRequirementStatusLiteral,
+	PublicResourceTypeLiteral,
+	PublicSubscriptionStatusLiteral,
+	PublicTestMethodLiteral,
+	PublicTestPriorityLiteral,
+	PublicTestStatusLiteral,
+	PublicTestTypeLiteral,
+	PublicTraceLinkTypeLiteral,
+	PublicUserRoleTypeLiteral,
+	PublicUserStatusLiteral,
+	PublicVisibilityLiteral,
+	Str2_255,
+)
+
+# INSERT CLASSES
+# Note: These models are used for insert operations. Auto-generated fields
+# (like IDs and timestamps) are optional.
+
+
+class AdminAuditLogInsert(CustomModelInsert):
+	"""AdminAuditLog Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# details: nullable
+	# ip_address: nullable
+	# target_org_id: nullable
+	# target_user_id: nullable
+	
+	# Required fields
+	action: str
+	admin_id: UUIDStr
+	
+		# Optional fields
+	details: Any | None = None
+	ip_address: str | None = None
+	target_org_id: str | None = None
+	target_user_id: str | None = None
+
+
+class AgentHealthInsert(CustomModelInsert):
+	"""AgentHealth Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# consecutive_failures: nullable, has default value
+	# last_check: nullable
+	# last_error: nullable
+	# metadata: nullable
+	
+	# Required fields
+	agent_id: UUIDStr
+	status: str
+	
+		# Optional fields
+	consecutive_failures: int | None = None
+	last_check: datetime.datetime | None = None
+	last_error: str | None = None
+	metadata: Any | None = None
+
+
+class AgentInsert(CustomModelInsert):
+	"""Agent Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# config: nullable
+	# description: nullable
+	# enabled: nullable, has default value
+	
+	# Required fields
+	type: str
+	name: str
+	
+		# Optional fields
+	config: Any | None = None  # Provider-specific configuration: {provider, location, api_key}
+	description: str | None = None
+	enabled: bool | None = None
+
+
+class ApiKeyInsert(CustomModelInsert):
+	"""ApiKey Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# description: nullable
+	# expires_at: nullable
+	# is_active: nullable, has default value
+	# last_used_at: nullable
+	# name: nullable
+	
+	# Required fields
+	key_hash: str  # SHA256 hash of the actual API key (never store plaintext keys)
+	organization_id: str
+	user_id: str
+	
+		# Optional fields
+	description: str | None = None
+	expires_at: datetime.datetime | None = None
+	is_active: bool | None = None  # Whether this key is active (soft delete via this flag)
+	last_used_at: datetime.datetime | None = None
+	name: str | None = None
+
+
+class AssignmentInsert(CustomModelInsert):
+	"""Assignment Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# comment: nullable
+	# completed_at: nullable
+	# created_by: nullable
+	# due_date: nullable
+	# updated_by: nullable
+	
+	# Required fields
+	assignee_id: UUIDStr
+	entity_id: UUIDStr
+	entity_type: PublicEntityTypeLiteral
+	role: PublicAssignmentRoleLiteral
+	status: PublicRequirementStatusLiteral
+	
+		# Optional fields
+	comment: str | None = None
+	completed_at: datetime.datetime | None = None
+	created_by: UUIDStr | None = None
+	due_date: datetime.datetime | None = None
+	updated_by: UUIDStr | None = None
+
+
+class AuditLogInsert(CustomModelInsert):
+	"""AuditLog Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# actor_id: nullable
+	# compliance_category: nullable
+	# correlation_id: nullable
+	# description: nullable
+	# details: nullable
+	# event_type: nullable
+	# ip_address: nullable
+	# metadata: nullable, has default value
+	# new_data: nullable
+	# old_data: nullable
+	# organization_id: nullable
+	# project_id: nullable
+	# resource_id: nullable
+	# resource_type: nullable
+	# risk_level: nullable
+	# session_id: nullable
+	# severity: nullable, has default value
+	# soc2_control: nullable
+	# source_system: nullable
+	# threat_indicators: nullable
+	# timestamp: nullable
+	# user_agent: nullable
+	# user_id: nullable
+	
+	# Required fields
+	action: str
+	entity_id: UUIDStr
+	entity_type: str
+	
+		# Optional fields
+	actor_id: UUIDStr | None = None
+	compliance_category: str | None = None
+	correlation_id: UUIDStr | None = None
+	description: str | None = None
+	details: Any | None = None
+	event_type: PublicAuditEventTypeLiteral | None = None
+	ip_address: IPvAnyAddress | None = None
+	metadata: Any | None = None
+	new_data: Any | None = None
+	old_data: Any | None = None
+	organization_id: UUIDStr | None = None
+	project_id: UUIDStr | None = None
+	resource_id: UUIDStr | None = None
+	resource_type: PublicResourceTypeLiteral | None = None
+	risk_level: str | None = None
+	session_id: str | None = None
+	severity: PublicAuditSeverityLiteral | None = None
+	soc2_control: str | None = None
+	source_system: str | None = None
+	threat_indicators: list[str] | None = None
+	timestamp: datetime.datetime | None = None
+	user_agent: str | None = None
+	user_id: UUIDStr | None = None
+
+
+class BillingCacheInsert(CustomModelInsert):
+	"""BillingCache Insert Schema."""
+
+	# Primary Keys
+	organization_id: UUIDStr
+
+	# Field properties:
+	# billing_status: has default value
+	# current_period_usage: has default value
+	# period_end: has default value
+	# period_start: has default value
+	# synced_at: has default value
+	
+		# Optional fields
+	billing_status: Any | None = None
+	current_period_usage: Any | None = None
+	period_end: datetime.datetime | None = None
+	period_start: datetime.datetime | None = None
+	synced_at: datetime.datetime | None = None
+
+
+class BlockInsert(CustomModelInsert):
+	"""Block Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# content: nullable, has default value
+	# created_by: nullable
+	# name: has default value
+	# org_id: nullable
+	# updated_by: nullable
+	
+	# Required fields
+	document_id: UUIDStr
+	type: str
+	position: int
+	
+		# Optional fields
+	content: Any | None = None
+	created_by: UUIDStr | None = None
+	name: str | None = None
+	org_id: UUIDStr | None = None
+	updated_by: UUIDStr | None = None
+
+
+class ChatMessageInsert(CustomModelInsert):
+	"""ChatMessage Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# is_active: has default value
+	# message_index: has default value
+	# metadata: nullable
+	# parent_id: nullable
+	# sequence: has default value
+	# tokens_in: nullable
+	# tokens_out: nullable
+	# tokens_total: nullable
+	# variant_index: has default value
+	
+	# Required fields
+	content: str
+	role: str
+	session_id: UUIDStr
+	
+		# Optional fields
+	is_active: bool | None = None
+	message_index: int | None = None  # Sequential index of message within session (0-based, for ordering)
+	metadata: Any | None = None  # Message metadata: {model_used, latency_ms, cost}
+	parent_id: UUIDStr | None = None
+	sequence: int | None = None  # Sequential order of messages within a session
+	tokens_in: int | None = None
+	tokens_out: int | None = None
+	tokens_total: int | None = None
+	variant_index: int | None = None
+
+
+class ChatSessionInsert(CustomModelInsert):
+	"""ChatSession Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# agent_id: nullable
+	# agent_type: nullable
+	# archived: has default value
+	# model_id: nullable
+	# last_message_at: nullable
+	# message_count: has default value
+	# metadata: nullable
+	# model: nullable
+	# org_id: nullable
+	# title: nullable
+	# tokens_in: has default value
+	# tokens_out: has default value
+	# tokens_total: has default value
+	
+	# Required fields
+	user_id: UUIDStr
+	
+		# Optional fields
+	agent_id: UUIDStr | None = None
+	agent_type: str | None = None
+	archived: bool | None = None  # Whether this session is archived (hidden from default lists)
+	model_id: UUIDStr | None = None
+	last_message_at: datetime.datetime | None = None
+	message_count: int | None = None  # Total number of messages in this session
+	metadata: Any | None = None  # Session metadata: {system_prompt, temperature, max_tokens}
+	model: str | None = None  # Model identifier used for this chat session
+	org_id: UUIDStr | None = None
+	title: str | None = None
+	tokens_in: int | None = None  # Total input tokens used in this session
+	tokens_out: int | None = None  # Total output tokens generated in this session
+	tokens_total: int | None = None  # Total tokens (in + out) for this session
+
+
+class ColumnInsert(CustomModelInsert):
+	"""Column Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# block_id: nullable
+	# created_by: nullable
+	# default_value: nullable
+	# is_hidden: nullable, has default value
+	# is_pinned: nullable, has default value
+	# updated_by: nullable
+	# width: nullable, has default value
+	
+	# Required fields
+	position: float
+	property_id: UUIDStr
+	
+		# Optional fields
+	block_id: UUIDStr | None = None
+	created_by: UUIDStr | None = None
+	default_value: str | None = None
+	is_hidden: bool | None = None
+	is_pinned: bool | None = None
+	updated_by: UUIDStr | None = None
+	width: int | None = None
+
+
+class DiagramElementLinkInsert(CustomModelInsert):
+	"""DiagramElementLink Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# created_by: nullable
+	# link_type: nullable, has default value
+	# metadata: nullable, has default value
+	
+	# Required fields
+	diagram_id: UUIDStr
+	element_id: str  # Excalidraw element ID from the diagram
+	requirement_id: UUIDStr
+	
+		# Optional fields
+	created_by: UUIDStr | None = None
+	link_type: str | None = None  # Whether link was created manually or auto-detected
+	metadata: Any | None = None  # Additional data like element type, text, confidence scores
+
+
+class DiagramElementLinksWithDetailInsert(CustomModelInsert):
+	"""DiagramElementLinksWithDetail Insert Schema."""
+
+	# Field properties:
+	# created_by: nullable
+	# created_by_avatar: nullable
+	# created_by_name: nullable
+	# diagram_id: nullable
+	# diagram_name: nullable
+	# element_id: nullable
+	# id: nullable
+	# link_type: nullable
+	# metadata: nullable
+	# requirement_description: nullable
+	# requirement_id: nullable
+	# requirement_name: nullable
+	
+		# Optional fields
+	created_by: UUIDStr | None = None
+	created_by_avatar: str | None = None
+	created_by_name: str | None = None
+	diagram_id: UUIDStr | None = None
+	diagram_name: str | None = None
+	element_id: str | None = None
+	id: UUIDStr | None = None
+	link_type: str | None = None
+	metadata: Any | None = None
+	requirement_description: str | None = None
+	requirement_id: UUIDStr | None = None
+	requirement_name: str | None = None
+
+
+class DocumentInsert(CustomModelInsert):
+	"""Document Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# created_by: nullable
+	# description: nullable
+	# embedding: nullable
+	# fts_vector: nullable
+	# tags: nullable, has default value
+	# updated_by: nullable
+	
+	# Required fields
+	name: str
+	project_id: UUIDStr
+	slug: str
+	
+		# Optional fields
+	created_by: UUIDStr | None = None
+	description: str | None = None
+	embedding: Any | None = None
+	fts_vector: str | None = None  # Full-text search vector: name(A) + description(B) + slug(C)
+	tags: list[str] | None = None
+	updated_by: UUIDStr | None = None
+
+
+class EmbeddingCacheInsert(CustomModelInsert):
+	"""EmbeddingCache Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# access_count: nullable, has default value
+	# accessed_at: nullable, has default value
+	# embedding: nullable
+	# model: has default value
+	# tokens_used: has default value
+	
+	# Required fields
+	cache_key: str
+	
+		# Optional fields
+	access_count: int | None = None
+	accessed_at: datetime.datetime | None = None
+	embedding: Any | None = None
+	model: str | None = None
+	tokens_used: int | None = None
+
+
+class ExcalidrawDiagramInsert(CustomModelInsert):
+	"""ExcalidrawDiagram Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# created_by: nullable
+	# diagram_data: nullable
+	# name: nullable
+	# organization_id: nullable
+	# project_id: nullable
+	# thumbnail_url: nullable
+	# updated_by: nullable
+	
+		# Optional fields
+	created_by: UUIDStr | None = None
+	diagram_data: Any | None = None
+	name: str | None = None
+	organization_id: UUIDStr | None = None
+	project_id: UUIDStr | None = None
+	thumbnail_url: str | None = None
+	updated_by: UUIDStr | None = None
+
+
+class ExcalidrawElementLinkInsert(CustomModelInsert):
+	"""ExcalidrawElementLink Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# create_by: nullable, has default value
+	# element_id: nullable
+	# excalidraw_canvas_id: nullable, has default value
+	# requirement_id: nullable, has default value
+	
+		# Optional fields
+	create_by: UUIDStr | None = None
+	element_id: str | None = None
+	excalidraw_canvas_id: UUIDStr | None = None
+	requirement_id: UUIDStr | None = None
+
+
+class ExternalDocumentInsert(CustomModelInsert):
+	"""ExternalDocument Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# created_by: nullable
+	# type: nullable
+	# gumloop_name: nullable
+	# owned_by: nullable
+	# size: nullable
+	# updated_by: nullable
+	# url: nullable
+	
+	# Required fields
+	name: str
+	organization_id: UUIDStr
+	
+		# Optional fields
+	created_by: UUIDStr | None = None
+	type: str | None = None
+	gumloop_name: str | None = None
+	owned_by: UUIDStr | None = None
+	size: int | None = None
+	updated_by: UUIDStr | None = None
+	url: str | None = None
+
+
+class McpAuditLogInsert(CustomModelInsert):
+	"""McpAuditLog Insert Schema."""
+
+	# Primary Keys
+	id: int | None = None  # has default value, auto-generated
+
+	# Field properties:
+	# details: nullable
+	# ip_address: nullable
+	# resource_id: nullable
+	# timestamp: has default value
+	# user_agent: nullable
+	
+	# Required fields
+	action: str
+	org_id: str
+	resource_type: str
+	user_id: str
+	
+		# Optional fields
+	details: str | None = None
+	ip_address: str | None = None
+	resource_id: str | None = None
+	timestamp: datetime.datetime | None = None
+	user_agent: str | None = None
+
+
+class McpConfigurationInsert(CustomModelInsert):
+	"""McpConfiguration Insert Schema."""
+
+	# Primary Keys
+	id: str | None = None  # has default value
+
+	# Field properties:
+	# args: nullable
+	# auth_header: nullable
+	# auth_token: nullable
+	# command: nullable
+	# config: nullable
+	# description: nullable
+	# enabled: has default value
+	# endpoint: nullable
+	# org_id: nullable
+	# user_id: nullable
+	
+	# Required fields
+	auth_type: str
+	created_by: str
+	type: str
+	name: str
+	scope: str
+	updated_by: str
+	
+		# Optional fields
+	args: str | None = None
+	auth_header: str | None = None
+	auth_token: str | None = None
+	command: str | None = None
+	config: str | None = None
+	description: str | None = None
+	enabled: bool | None = None
+	endpoint: str | None = None
+	org_id: str | None = None
+	user_id: str | None = None
+
+
+class McpOauthTokenInsert(CustomModelInsert):
+	"""McpOauthToken Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# access_token: nullable
+	# expires_at: nullable
+	# issued_at: has default value
+	# organization_id: nullable
+	# refresh_token: nullable
+	# scope: nullable
+	# token_type: nullable
+	# upstream_response: nullable, has default value
+	# user_id: nullable
+	
+	# Required fields
+	mcp_namespace: str
+	provider_key: str
+	transaction_id: UUIDStr
+	
+		# Optional fields
+	access_token: str | None = None
+	expires_at: datetime.datetime | None = None
+	issued_at: datetime.datetime | None = None
+	organization_id: UUIDStr | None = None
+	refresh_token: str | None = None
+	scope: str | None = None
+	token_type: str | None = None
+	upstream_response: Any | None = None
+	user_id: UUIDStr | None = None
+
+
+class McpOauthTransactionInsert(CustomModelInsert):
+	"""McpOauthTransaction Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# authorization_url: nullable
+	# code_challenge: nullable
+	# code_verifier: nullable
+	# completed_at: nullable
+	# error: nullable
+	# organization_id: nullable
+	# scopes: nullable
+	# state: nullable
+	# upstream_metadata: nullable, has default value
+	# user_id: nullable
+	
+	# Required fields
+	mcp_namespace: str
+	provider_key: str
+	status: str
+	
+		# Optional fields
+	authorization_url: str | None = None
+	code_challenge: str | None = None
+	code_verifier: str | None = None
+	completed_at: datetime.datetime | None = None
+	error: Any | None = None
+	organization_id: UUIDStr | None = None
+	scopes: list[str] | None = None
+	state: str | None = None
+	upstream_metadata: Any | None = None
+	user_id: UUIDStr | None = None
+
+
+class McpProfileInsert(CustomModelInsert):
+	"""McpProfile Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# description: nullable
+	# servers: nullable, has default value
+	
+	# Required fields
+	name: str
+	user_id: UUIDStr
+	
+		# Optional fields
+	description: str | None = None
+	servers: Any | None = None
+
+
+class McpProxyConfigInsert(CustomModelInsert):
+	"""McpProxyConfig Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# auth_config: has default value
+	# error_count: nullable, has default value
+	# health_error: nullable
+	# health_status: nullable, has default value
+	# last_error: nullable
+	# last_error_at: nullable
+	# last_health_check: nullable
+	# last_used_at: nullable
+	# organization_id: nullable
+	# proxy_status: nullable, has default value
+	# proxy_url: nullable
+	# request_count: nullable, has default value
+	
+	# Required fields
+	auth_type: str  # Type of authentication: none, bearer, or oauth
+	created_by: UUIDStr
+	server_name: str  # Unique name for the MCP server
+	server_url: str  # URL of the upstream MCP server
+	
+		# Optional fields
+	auth_config: Any | None = None  # JSON configuration for authentication (tokens, scopes, etc.)
+	error_count: int | None = None
+	health_error: str | None = None
+	health_status: str | None = None
+	last_error: str | None = None
+	last_error_at: datetime.datetime | None = None
+	last_health_check: datetime.datetime | None = None
+	last_used_at: datetime.datetime | None = None
+	organization_id: UUIDStr | None = None
+	proxy_status: str | None = None  # Current status of the proxy: pending, active, error, or disabled
+	proxy_url: str | None = None  # URL of the FastMCP proxy instance
+	request_count: int | None = None
+
+
+class McpRegistrySyncStatusInsert(CustomModelInsert):
+	"""McpRegistrySyncStatus Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# error_details: nullable
+	# error_message: nullable
+	# servers_added: nullable, has default value
+	# servers_failed: nullable, has default value
+	# servers_removed: nullable, has default value
+	# servers_updated: nullable, has default value
+	# sync_completed_at: nullable
+	
+	# Required fields
+	sync_started_at: datetime.datetime
+	sync_status: str
+	
+		# Optional fields
+	error_details: Any | None = None
+	error_message: str | None = None
+	servers_added: int | None = None
+	servers_failed: int | None = None
+	servers_removed: int | None = None
+	servers_updated: int | None = None
+	sync_completed_at: datetime.datetime | None = None
+
+
+class McpServerSecurityReviewInsert(CustomModelInsert):
+	"""McpServerSecurityReview Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# auth_review_notes: nullable
+	# auth_review_passed: nullable
+	# code_review_notes: nullable
+	# code_review_passed: nullable
+	# dependency_review_notes: nullable
+	# dependency_review_passed: nullable
+	# expires_at: nullable
+	# license_review_notes: nullable
+	# license_review_passed: nullable
+	# network_review_notes: nullable
+	# network_review_passed: nullable
+	# notes: nullable
+	# recommendations: nullable
+	# review_date: has default value
+	# reviewer_email: nullable
+	# risk_level: nullable
+	# security_scan_notes: nullable
+	# security_scan_passed: nullable
+	# security_scan_results: nullable
+	
+	# Required fields
+	reviewed_by: str
+	server_id: UUIDStr
+	status: str
+	
+		# Optional fields
+	auth_review_notes: str | None = None
+	auth_review_passed: bool | None = None
+	code_review_notes: str | None = None
+	code_review_passed: bool | None = None
+	dependency_review_notes: str | None = None
+	dependency_review_passed: bool | None = None
+	expires_at: datetime.datetime | None = None
+	license_review_notes: str | None = None
+	license_review_passed: bool | None = None
+	network_review_notes: str | None = None
+	network_review_passed: bool | None = None
+	notes: str | None = None
+	recommendations: str | None = None
+	review_date: datetime.datetime | None = None
+	reviewer_email: str | None = None
+	risk_level: str | None = None
+	security_scan_notes: str | None = None
+	security_scan_passed: bool | None = None
+	security_scan_results: Any | None = None
+
+
+class McpServerUsageLogInsert(CustomModelInsert):
+	"""McpServerUsageLog Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# duration_ms: nullable
+	# error_code: nullable
+	# error_message: nullable
+	# ip_address: nullable
+	# request_params: nullable
+	# tool_name: nullable
+	# user_agent: nullable
+	
+	# Required fields
+	server_id: UUIDStr
+	success: bool
+	user_id: UUIDStr
+	user_server_id: UUIDStr
+	
+		# Optional fields
+	duration_ms: int | None = None
+	error_code: str | None = None
+	error_message: str | None = None
+	ip_address: IPvAnyAddress | None = None
+	request_params: Any | None = None
+	tool_name: str | None = None
+	user_agent: str | None = None
+
+
+class McpServerInsert(CustomModelInsert):
+	"""McpServer Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# active_users: nullable, has default value
+	# auth_config: nullable, has default value
+	# category: nullable
+	# created_by: nullable
+	# deprecated: nullable, has default value
+	# deprecation_date: nullable
+	# deprecation_reason: nullable
+	# description: nullable
+	# documentation_url: nullable
+	# downloads: nullable, has default value
+	# enabled: nullable, has default value
+	# env: nullable, has default value
+	# health_status: nullable
+	# homepage_url: nullable
+	# install_count: nullable, has default value
+	# last_health_check: nullable
+	# last_synced_at: nullable
+	# last_updated_at: nullable
+	# license: nullable
+	# metadata: nullable, has default value
+	# organization_id: nullable
+	# project_id: nullable
+	# publisher_namespace: nullable
+	# publisher_type: nullable
+	# publisher_verified: nullable, has default value
+	# repository_url: nullable
+	# scope: nullable, has default value
+	# security_notes: nullable
+	# security_review_date: nullable
+	# security_review_expires_at: nullable
+	# security_review_status: nullable
+	# security_reviewed_by: nullable
+	# stars: nullable, has default value
+	# sync_source: nullable
+	# tags: nullable, has default value
+	# tier: has default value
+	# transport_config: nullable, has default value
+	# transport_type: nullable
+	# user_id: nullable
+	
+	# Required fields
+	auth_type: str  # Authentication type: oauth or bearer
+	name: str
+	namespace: str  # Unique namespace (e.g., io.github.anthropic/mcp-server-github)
+	source: str
+	transport: str  # Transport type: sse or http (NO stdio in shared containers)
+	url: str
+	
+		# Optional fields
+	active_users: int | None = None
+	auth_config: Any | None = None
+	category: str | None = None
+	created_by: UUIDStr | None = None
+	deprecated: bool | None = None
+	deprecation_date: datetime.datetime | None = None
+	deprecation_reason: str | None = None
+	description: str | None = None
+	documentation_url: str | None = None
+	downloads: int | None = None
+	enabled: bool | None = None
+	env: Any | None = None  # Environment variables for the MCP server
+	health_status: str | None = None
+	homepage_url: str | None = None
+	install_count: int | None = None
+	last_health_check: datetime.datetime | None = None
+	last_synced_at: datetime.datetime | None = None
+	last_updated_at: datetime.datetime | None = None
+	license: str | None = None
+	metadata: Any | None = None  # Additional server metadata stored as JSON
+	organization_id: UUIDStr | None = None
+	project_id: UUIDStr | None = None
+	publisher_namespace: str | None = None
+	publisher_type: str | None = None
+	publisher_verified: bool | None = None  # Whether publisher identity is verified
+	repository_url: str | None = None
+	scope: str | None = None  # Installation scope: user, organization, or system
+	security_notes: str | None = None
+	security_review_date: datetime.datetime | None = None
+	security_review_expires_at: datetime.datetime | None = None
+	security_review_status: str | None = None  # Current security review status
+	security_reviewed_by: str | None = None
+	stars: int | None = None
+	sync_source: str | None = None
+	tags: list[str] | None = None
+	tier: str | None = None  # Server tier: first-party (atoms.tech), curated (reviewed), community (user risk)
+	transport_config: Any | None = None
+	transport_type: str | None = None
+	user_id: UUIDStr | None = None  # User who installed this server (for user scope)
+
+
+class McpSessionInsert(CustomModelInsert):
+	"""McpSession Insert Schema."""
+
+	# Primary Keys
+	session_id: str
+
+	# Field properties:
+	# mcp_state: nullable
+	
+	# Required fields
+	expires_at: datetime.datetime
+	oauth_data: Any
+	user_id: UUIDStr
+	
+		# Optional fields
+	mcp_state: Any | None = None
+
+
+class ModelInsert(CustomModelInsert):
+	"""Model Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# config: nullable
+	# description: nullable
+	# display_name: nullable
+	# enabled: nullable, has default value
+	# model_id: nullable
+	# provider: nullable
+	
+	# Required fields
+	agent_id: UUIDStr
+	name: str
+	
+		# Optional fields
+	config: Any | None = None  # Model-specific settings: {temperature, max_tokens, top_p}
+	description: str | None = None
+	display_name: str | None = None
+	enabled: bool | None = None
+	model_id: str | None = None
+	provider: str | None = None
+
+
+class NotificationInsert(CustomModelInsert):
+	"""Notification Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# message: nullable
+	# metadata: nullable, has default value
+	# read_at: nullable
+	# unread: nullable, has default value
+	
+	# Required fields
+	type: Any
+	title: str
+	user_id: UUIDStr
+	
+		# Optional fields
+	message: str | None = None
+	metadata: Any | None = None
+	read_at: datetime.datetime | None = None
+	unread: bool | None = None
+
+
+class OrganizationInvitationInsert(CustomModelInsert):
+	"""OrganizationInvitation Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# expires_at: has default value
+	# metadata: nullable, has default value
+	# role: has default value
+	# status: has default value
+	# token: has default value
+	
+	# Required fields
+	created_by: UUIDStr
+	email: str
+	organization_id: UUIDStr
+	updated_by: UUIDStr
+	
+		# Optional fields
+	expires_at: datetime.datetime | None = None
+	metadata: Any | None = None
+	role: PublicUserRoleTypeLiteral | None = None
+	status: PublicInvitationStatusLiteral | None = None
+	token: UUIDStr | None = None
+
+
+class OrganizationMemberInsert(CustomModelInsert):
+	"""OrganizationMember Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# last_active_at: nullable
+	# permissions: nullable, has default value
+	# role: has default value
+	# status: nullable, has default value
+	# updated_by: nullable
+	
+	# Required fields
+	organization_id: UUIDStr
+	user_id: UUIDStr
+	
+		# Optional fields
+	last_active_at: datetime.datetime | None = None
+	permissions: Any | None = None
+	role: PublicUserRoleTypeLiteral | None = None
+	status: PublicUserStatusLiteral | None = None
+	updated_by: UUIDStr | None = None
+
+
+class OrganizationInsert(CustomModelInsert):
+	"""Organization Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# billing_cycle: has default value
+	# billing_plan: has default value
+	# description: nullable
+	# embedding: nullable
+	# type: has default value
+	# fts_vector: nullable
+	# logo_url: nullable
+	# max_members: has default value
+	# max_monthly_requests: has default value
+	# member_count: nullable, has default value
+	# metadata: nullable, has default value
+	# owner_id: nullable
+	# settings: nullable, has default value
+	# status: nullable, has default value
+	# storage_used: nullable, has default value
+	
+	# Required fields
+	created_by: UUIDStr
+	name: Str2_255
+	slug: str
+	updated_by: UUIDStr
+	
+		# Optional fields
+	billing_cycle: PublicPricingPlanIntervalLiteral | None = None
+	billing_plan: PublicBillingPlanLiteral | None = None
+	description: str | None = None
+	embedding: Any | None = None
+	type: Any | None = None
+	fts_vector: str | None = None  # Full-text search vector: name(A) + description(B) + slug(C)
+	logo_url: str | None = None
+	max_members: int | None = None
+	max_monthly_requests: int | None = None
+	member_count: int | None = None
+	metadata: Any | None = None
+	owner_id: UUIDStr | None = None
+	settings: Any | None = None
+	status: PublicUserStatusLiteral | None = None
+	storage_used: int | None = None
+
+
+class PgAllForeignKeyInsert(CustomModelInsert):
+	"""PgAllForeignKey Insert Schema."""
+
+	# Field properties:
+	# fk_columns: nullable
+	# fk_constraint_name: nullable
+	# fk_schema_name: nullable
+	# fk_table_name: nullable
+	# fk_table_oid: nullable
+	# is_deferrable: nullable
+	# is_deferred: nullable
+	# match_type: nullable
+	# on_delete: nullable
+	# on_update: nullable
+	# pk_columns: nullable
+	# pk_constraint_name: nullable
+	# pk_index_name: nullable
+	# pk_schema_name: nullable
+	# pk_table_name: nullable
+	# pk_table_oid: nullable
+	
+		# Optional fields
+	fk_columns: list[Any] | None = None
+	fk_constraint_name: Any | None = None
+	fk_schema_name: Any | None = None
+	fk_table_name: Any | None = None
+	fk_table_oid: Any | None = None
+	is_deferrable: bool | None = None
+	is_deferred: bool | None = None
+	match_type: str | None = None
+	on_delete: str | None = None
+	on_update: str | None = None
+	pk_columns: list[Any] | None = None
+	pk_constraint_name: Any | None = None
+	pk_index_name: Any | None = None
+	pk_schema_name: Any | None = None
+	pk_table_name: Any | None = None
+	pk_table_oid: Any | None = None
+
+
+class PlatformAdminInsert(CustomModelInsert):
+	"""PlatformAdmin Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# added_at: nullable, has default value
+	# added_by: nullable
+	# is_active: nullable, has default value
+	# name: nullable
+	
+	# Required fields
+	email: str
+	workos_user_id: str
+	
+		# Optional fields
+	added_at: datetime.datetime | None = None
+	added_by: UUIDStr | None = None
+	is_active: bool | None = None
+	name: str | None = None
+
+
+class ProfileInsert(CustomModelInsert):
+	"""Profile Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr
+
+	# Field properties:
+	# avatar_url: nullable
+	# current_organization_id: nullable
+	# full_name: nullable
+	# is_approved: has default value
+	# job_title: nullable
+	# last_login_at: nullable
+	# login_count: nullable, has default value
+	# personal_organization_id: nullable
+	# pinned_organization_id: nullable
+	# preferences: nullable, has default value
+	# status: nullable, has default value
+	# workos_id: nullable
+	
+	# Required fields
+	email: str
+	
+		# Optional fields
+	avatar_url: str | None = None
+	current_organization_id: UUIDStr | None = None
+	full_name: str | None = None
+	is_approved: bool | None = None
+	job_title: str | None = None
+	last_login_at: datetime.datetime | None = None
+	login_count: int | None = None
+	personal_organization_id: UUIDStr | None = None
+	pinned_organization_id: UUIDStr | None = None
+	preferences: Any | None = None
+	status: PublicUserStatusLiteral | None = None
+	workos_id: str | None = None
+
+
+class ProjectInvitationInsert(CustomModelInsert):
+	"""ProjectInvitation Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# expires_at: has default value
+	# metadata: nullable, has default value
+	# role: has default value
+	# status: has default value
+	# token: has default value
+	
+	# Required fields
+	created_by: UUIDStr
+	email: str
+	project_id: UUIDStr
+	updated_by: UUIDStr
+	
+		# Optional fields
+	expires_at: datetime.datetime | None = None
+	metadata: Any | None = None
+	role: PublicProjectRoleLiteral | None = None
+	status: PublicInvitationStatusLiteral | None = None
+	token: UUIDStr | None = None
+
+
+class ProjectMemberInsert(CustomModelInsert):
+	"""ProjectMember Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# last_accessed_at: nullable
+	# org_id: nullable
+	# permissions: nullable, has default value
+	# role: has default value
+	# status: nullable, has default value
+	
+	# Required fields
+	project_id: UUIDStr
+	user_id: UUIDStr
+	
+		# Optional fields
+	last_accessed_at: datetime.datetime | None = None
+	org_id: UUIDStr | None = None
+	permissions: Any | None = None
+	role: PublicProjectRoleLiteral | None = None
+	status: PublicUserStatusLiteral | None = None
+
+
+class ProjectInsert(CustomModelInsert):
+	"""Project Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# description: nullable
+	# embedding: nullable
+	# fts_vector: nullable
+	# metadata: nullable, has default value
+	# settings: nullable, has default value
+	# star_count: nullable, has default value
+	# status: has default value
+	# tags: nullable, has default value
+	# visibility: has default value
+	
+	# Required fields
+	created_by: UUIDStr
+	name: Str2_255
+	organization_id: UUIDStr
+	owned_by: UUIDStr
+	slug: str
+	updated_by: UUIDStr
+	
+		# Optional fields
+	description: str | None = None
+	embedding: Any | None = None
+	fts_vector: str | None = None  # Full-text search vector: name(A) + description(B) + slug(C)
+	metadata: Any | None = None
+	settings: Any | None = None
+	star_count: int | None = None
+	status: PublicProjectStatusLiteral | None = None
+	tags: list[str] | None = None
+	visibility: PublicVisibilityLiteral | None = None
+
+
+class PropertyInsert(CustomModelInsert):
+	"""Property Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# created_by: nullable
+	# document_id: nullable
+	# is_base: nullable, has default value
+	# options: nullable, has default value
+	# project_id: nullable
+	# scope: nullable
+	# updated_by: nullable
+	
+	# Required fields
+	name: str
+	org_id: UUIDStr
+	property_type: str
+	
+		# Optional fields
+	created_by: UUIDStr | None = None
+	document_id: UUIDStr | None = None
+	is_base: bool | None = None
+	options: Any | None = None
+	project_id: UUIDStr | None = None
+	scope: str | None = None
+	updated_by: UUIDStr | None = None
+
+
+class RagEmbeddingInsert(CustomModelInsert):
+	"""RagEmbedding Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# content_hash: nullable
+	# metadata: nullable
+	# quality_score: nullable, has default value
+	
+	# Required fields
+	embedding: Any
+	entity_id: str
+	entity_type: str
+	
+		# Optional fields
+	content_hash: str | None = None
+	metadata: Any | None = None
+	quality_score: float | None = None
+
+
+class RagSearchAnalyticInsert(CustomModelInsert):
+	"""RagSearchAnalytic Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# cache_hit: has default value
+	# organization_id: nullable
+	# user_id: nullable
+	
+	# Required fields
+	execution_time_ms: int
+	query_hash: str
+	query_text: str
+	result_count: int
+	search_type: str
+	
+		# Optional fields
+	cache_hit: bool | None = None
+	organization_id: UUIDStr | None = None
+	user_id: UUIDStr | None = None
+
+
+class ReactFlowDiagramInsert(CustomModelInsert):
+	"""ReactFlowDiagram Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# created_by: nullable
+	# description: nullable
+	# diagram_type: nullable, has default value
+	# edges: has default value
+	# layout_algorithm: nullable, has default value
+	# metadata: nullable, has default value
+	# name: has default value
+	# nodes: has default value
+	# settings: nullable, has default value
+	# theme: nullable, has default value
+	# updated_by: nullable
+	# viewport: nullable, has default value
+	
+	# Required fields
+	project_id: UUIDStr
+	
+		# Optional fields
+	created_by: UUIDStr | None = None
+	description: str | None = None
+	diagram_type: str | None = None
+	edges: Any | None = None
+	layout_algorithm: str | None = None
+	metadata: Any | None = None
+	name: str | None = None
+	nodes: Any | None = None
+	settings: Any | None = None
+	theme: str | None = None
+	updated_by: UUIDStr | None = None
+	viewport: Any | None = None
+
+
+class RequirementTestInsert(CustomModelInsert):
+	"""RequirementTest Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# defects: nullable
+	# evidence_artifacts: nullable
+	# executed_at: nullable
+	# executed_by: nullable
+	# execution_environment: nullable
+	# execution_status: has default value
+	# execution_version: nullable
+	# external_req_id: nullable
+	# external_test_id: nullable
+	# result_notes: nullable
+	
+	# Required fields
+	requirement_id: UUIDStr
+	test_id: UUIDStr
+	
+		# Optional fields
+	defects: Any | None = None
+	evidence_artifacts: Any | None = None
+	executed_at: datetime.datetime | None = None
+	executed_by: UUIDStr | None = None
+	execution_environment: str | None = None
+	execution_status: PublicExecutionStatusLiteral | None = None
+	execution_version: str | None = None
+	external_req_id: str | None = None
+	external_test_id: str | None = None
+	result_notes: str | None = None
+
+
+class RequirementInsert(CustomModelInsert):
+	"""Requirement Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# ai_analysis: nullable, has default value
+	# created_by: nullable
+	# description: nullable
+	# embedding: nullable
+	# enchanced_requirement: nullable
+	# external_id: nullable
+	# format: has default value
+	# type: nullable
+	# fts_vector: nullable
+	# level: has default value
+	# original_requirement: nullable
+	# position: has default value
+	# priority: has default value
+	# properties: nullable, has default value
+	# status: has default value
+	# tags: nullable, has default value
+	# updated_by: nullable
+	
+	# Required fields
+	block_id: UUIDStr
+	document_id: UUIDStr
+	name: str
+	
+		# Optional fields
+	ai_analysis: Any | None = None
+	created_by: UUIDStr | None = None
+	description: str | None = None
+	embedding: Any | None = None
+	enchanced_requirement: str | None = None
+	external_id: str | None = None
+	format: Any | None = None
+	type: str | None = None
+	fts_vector: str | None = None  # Full-text search vector: name(A) + description(B) + requirements(C)
+	level: PublicRequirementLevelLiteral | None = None
+	original_requirement: str | None = None
+	position: float | None = None
+	priority: PublicRequirementPriorityLiteral | None = None
+	properties: Any | None = None
+	status: PublicRequirementStatusLiteral | None = None
+	tags: list[str] | None = None
+	updated_by: UUIDStr | None = None
+
+
+class RequirementsClosureInsert(CustomModelInsert):
+	"""RequirementsClosure Insert Schema."""
+
+	# Primary Keys
+	ancestor_id: UUIDStr
+	descendant_id: UUIDStr
+
+	# Field properties:
+	# updated_by: nullable
+	
+	# Required fields
+	created_by: UUIDStr
+	depth: int
+	
+		# Optional fields
+	updated_by: UUIDStr | None = None
+
+
+class SignupRequestInsert(CustomModelInsert):
+	"""SignupRequest Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# approved_at: nullable
+	# approved_by: nullable
+	# denial_reason: nullable
+	# denied_at: nullable
+	# denied_by: nullable
+	# message: nullable
+	# status: has default value
+	
+	# Required fields
+	email: str
+	full_name: str
+	
+		# Optional fields
+	approved_at: datetime.datetime | None = None
+	approved_by: UUIDStr | None = None
+	denial_reason: str | None = None
+	denied_at: datetime.datetime | None = None
+	denied_by: UUIDStr | None = None
+	message: str | None = None
+	status: str | None = None
+
+
+class StripeCustomerInsert(CustomModelInsert):
+	"""StripeCustomer Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# cancel_at_period_end: nullable, has default value
+	# current_period_end: nullable
+	# current_period_start: nullable
+	# organization_id: nullable
+	# payment_method_brand: nullable
+	# payment_method_last4: nullable
+	# price_id: nullable
+	# stripe_customer_id: nullable
+	# stripe_subscription_id: nullable
+	
+	# Required fields
+	subscription_status: PublicSubscriptionStatusLiteral
+	
+		# Optional fields
+	cancel_at_period_end: bool | None = None
+	current_period_end: datetime.datetime | None = None
+	current_period_start: datetime.datetime | None = None
+	organization_id: UUIDStr | None = None
+	payment_method_brand: str | None = None
+	payment_method_last4: str | None = None
+	price_id: str | None = None
+	stripe_customer_id: str | None = None
+	stripe_subscription_id: str | None = None
+
+
+class SystemPromptInsert(CustomModelInsert):
+	"""SystemPrompt Insert Schema."""
+
+	# Primary Keys
+	id: str | None = None  # has default value
+
+	# Field properties:
+	# created_by: nullable
+	# description: nullable
+	# enabled: has default value
+	# is_default: nullable, has default value
+	# is_public: nullable, has default value
+	# organization_id: nullable
+	# priority: has default value
+	# tags: nullable
+	# template: nullable
+	# updated_by: nullable
+	# user_id: nullable
+	# variables: nullable
+	
+	# Required fields
+	content: str
+	name: str  # Display name for the system prompt
+	scope: str
+	
+		# Optional fields
+	created_by: str | None = None
+	description: str | None = None  # Optional description of the system prompt purpose
+	enabled: bool | None = None
+	is_default: bool | None = None  # Whether this is the default prompt for its scope
+	is_public: bool | None = None
+	organization_id: str | None = None
+	priority: int | None = None
+	tags: list[str] | None = None
+	template: str | None = None
+	updated_by: str | None = None  # User ID who last updated this prompt
+	user_id: str | None = None
+	variables: Any | None = None
+
+
+class TableRowInsert(CustomModelInsert):
+	"""TableRow Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# created_by: nullable
+	# position: has default value
+	# row_data: nullable, has default value
+	# updated_by: nullable
+	
+	# Required fields
+	block_id: UUIDStr
+	document_id: UUIDStr
+	
+		# Optional fields
+	created_by: UUIDStr | None = None
+	position: float | None = None
+	row_data: Any | None = None
+	updated_by: UUIDStr | None = None
+
+
+class TestMatrixViewInsert(CustomModelInsert):
+	"""TestMatrixView Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# configuration: has default value
+	# is_active: nullable, has default value
+	# is_default: nullable, has default value
+	
+	# Required fields
+	created_by: UUIDStr
+	name: str
+	project_id: UUIDStr
+	updated_by: UUIDStr
+	
+		# Optional fields
+	configuration: Any | None = None
+	is_active: bool | None = None
+	is_default: bool | None = None
+
+
+class TestReqInsert(CustomModelInsert):
+	"""TestReq Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# attachments: nullable
+	# category: nullable
+	# created_by: nullable
+	# description: nullable
+	# estimated_duration: nullable
+	# expected_results: nullable
+	# is_active: nullable, has default value
+	# method: has default value
+	# preconditions: nullable
+	# priority: has default value
+	# project_id: nullable
+	# result: nullable, has default value
+	# status: has default value
+	# test_environment: nullable
+	# test_id: nullable
+	# test_steps: nullable
+	# test_type: has default value
+	# updated_by: nullable
+	
+	# Required fields
+	title: str
+	
+		# Optional fields
+	attachments: Any | None = None
+	category: list[str] | None = None
+	created_by: UUIDStr | None = None
+	description: str | None = None
+	estimated_duration: datetime.timedelta | None = None
+	expected_results: str | None = None
+	is_active: bool | None = None
+	method: PublicTestMethodLiteral | None = None
+	preconditions: str | None = None
+	priority: PublicTestPriorityLiteral | None = None
+	project_id: UUIDStr | None = None
+	result: str | None = None
+	status: PublicTestStatusLiteral | None = None
+	test_environment: str | None = None
+	test_id: str | None = None
+	test_steps: Any | None = None
+	test_type: PublicTestTypeLiteral | None = None
+	updated_by: UUIDStr | None = None
+
+
+class TraceLinkInsert(CustomModelInsert):
+	"""TraceLink Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# created_by: nullable
+	# description: nullable
+	# updated_by: nullable
+	
+	# Required fields
+	link_type: PublicTraceLinkTypeLiteral
+	source_id: UUIDStr
+	source_type: PublicEntityTypeLiteral
+	target_id: UUIDStr
+	target_type: PublicEntityTypeLiteral
+	
+		# Optional fields
+	created_by: UUIDStr | None = None
+	description: str | None = None
+	updated_by: UUIDStr | None = None
+
+
+class UsageLogInsert(CustomModelInsert):
+	"""UsageLog Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# metadata: nullable, has default value
+	
+	# Required fields
+	feature: str
+	organization_id: UUIDStr
+	quantity: int
+	unit_type: str
+	user_id: UUIDStr
+	
+		# Optional fields
+	metadata: Any | None = None
+
+
+class UserMcpServerInsert(CustomModelInsert):
+	"""UserMcpServer Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# auth_token_encrypted: nullable
+	# custom_config: nullable, has default value
+	# enabled: nullable, has default value
+	# error_count: nullable, has default value
+	# health_check_error: nullable
+	# installed_at: has default value
+	# last_error: nullable
+	# last_error_at: nullable
+	# last_health_check: nullable
+	# last_used_at: nullable
+	# oauth_tokens_encrypted: nullable
+	# organization_id: nullable
+	# status: nullable, has default value
+	# tool_permissions: nullable, has default value
+	# usage_count: nullable, has default value
+	
+	# Required fields
+	server_id: UUIDStr
+	user_id: UUIDStr
+	
+		# Optional fields
+	auth_token_encrypted: str | None = None
+	custom_config: Any | None = None
+	enabled: bool | None = None
+	error_count: int | None = None
+	health_check_error: str | None = None
+	installed_at: datetime.datetime | None = None
+	last_error: str | None = None
+	last_error_at: datetime.datetime | None = None
+	last_health_check: datetime.datetime | None = None
+	last_used_at: datetime.datetime | None = None
+	oauth_tokens_encrypted: str | None = None
+	organization_id: UUIDStr | None = None
+	status: str | None = None
+	tool_permissions: Any | None = None
+	usage_count: int | None = None
+
+
+class UserRoleInsert(CustomModelInsert):
+	"""UserRole Insert Schema."""
+
+	# Primary Keys
+	id: UUIDStr | None = None  # has default value
+
+	# Field properties:
+	# admin_role: nullable
+	# document_id: nullable
+	# document_role: nullable
+	# org_id: nullable
+	# project_id: nullable
+	# project_role: nullable
+	
+	# Required fields
+	user_id: UUIDStr
+	
+		# Optional fields
+	admin_role: PublicUserRoleTypeLiteral | None = None
+	document_id: UUIDStr | None = None
+	document_role: PublicProjectRoleLiteral | None = None
+	org_id: UUIDStr | None = None
+	project_id: UUIDStr | None = None
+	project_role: PublicProjectRoleLiteral | None = None
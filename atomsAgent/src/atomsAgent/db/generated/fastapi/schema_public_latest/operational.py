@@ -0,0 +1,517 @@
+from __future__ import annotations
+
+from .base import (
+	AdminAuditLogBaseSchema,
+	AgentBaseSchema,
+	AgentHealthBaseSchema,
+	ApiKeyBaseSchema,
+	AssignmentBaseSchema,
+	AuditLogBaseSchema,
+	BillingCacheBaseSchema,
+	BlockBaseSchema,
+	ChatMessageBaseSchema,
+	ChatSessionBaseSchema,
+	ColumnBaseSchema,
+	DiagramElementLinkBaseSchema,
+	DiagramElementLinksWithDetailBaseSchema,
+	DocumentBaseSchema,
+	EmbeddingCacheBaseSchema,
+	ExcalidrawDiagramBaseSchema,
+	ExcalidrawElementLinkBaseSchema,
+	ExternalDocumentBaseSchema,
+	McpAuditLogBaseSchema,
+	McpConfigurationBaseSchema,
+	McpOauthTokenBaseSchema,
+	McpOauthTransactionBaseSchema,
+	McpProfileBaseSchema,
+	McpProxyConfigBaseSchema,
+	McpRegistrySyncStatusBaseSchema,
+	McpServerBaseSchema,
+	McpServerSecurityReviewBaseSchema,
+	McpServerUsageLogBaseSchema,
+	McpSessionBaseSchema,
+	ModelBaseSchema,
+	NotificationBaseSchema,
+	OrganizationBaseSchema,
+	OrganizationInvitationBaseSchema,
+	OrganizationMemberBaseSchema,
+	PgAllForeignKeyBaseSchema,
+	PlatformAdminBaseSchema,
+	ProfileBaseSchema,
+	ProjectBaseSchema,
+	ProjectInvitationBaseSchema,
+	ProjectMemberBaseSchema,
+	PropertyBaseSchema,
+	RagEmbeddingBaseSchema,
+	RagSearchAnalyticBaseSchema,
+	ReactFlowDiagramBaseSchema,
+	RequirementBaseSchema,
+	RequirementsClosureBaseSchema,
+	RequirementTestBaseSchema,
+	SignupRequestBaseSchema,
+	StripeCustomerBaseSchema,
+	SystemPromptBaseSchema,
+	TableRowBaseSchema,
+	TapFunkyBaseSchema,
+	TestMatrixViewBaseSchema,
+	TestReqBaseSchema,
+	TraceLinkBaseSchema,
+	UsageLogBaseSchema,
+	UserMcpServerBaseSchema,
+	UserRoleBaseSchema,
+	VAgentStatusBaseSchema,
+	VRecentSessionBaseSchema,
+)
+
+# OPERATIONAL CLASSES
+
+
+class AdminAuditLog(AdminAuditLogBaseSchema):
+	"""AdminAuditLog Schema for Pydantic. Inherits from AdminAuditLogBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	platform_admin: PlatformAdmin | None = None
+
+
+class AgentHealth(AgentHealthBaseSchema):
+	"""AgentHealth Schema for Pydantic. Inherits from AgentHealthBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	agent: Agent | None = None
+
+
+class Agent(AgentBaseSchema):
+	"""Agent Schema for Pydantic. Inherits from AgentBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	agent_health: AgentHealth | None = None
+	chat_sessions: list[ChatSession] | None = None
+	model: Model | None = None
+
+
+class ApiKey(ApiKeyBaseSchema):
+	"""ApiKey Schema for Pydantic. Inherits from ApiKeyBaseSchema. Add any customization here."""
+	pass
+
+
+class Assignment(AssignmentBaseSchema):
+	"""Assignment Schema for Pydantic. Inherits from AssignmentBaseSchema. Add any customization here."""
+	pass
+
+
+class AuditLog(AuditLogBaseSchema):
+	"""AuditLog Schema for Pydantic. Inherits from AuditLogBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	organization: Organization | None = None
+	project: Project | None = None
+	profile: Profile | None = None
+
+
+class BillingCache(BillingCacheBaseSchema):
+	"""BillingCache Schema for Pydantic. Inherits from BillingCacheBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	organization: Organization | None = None
+
+
+class Block(BlockBaseSchema):
+	"""Block Schema for Pydantic. Inherits from BlockBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	document: Document | None = None
+	organization: Organization | None = None
+	columns: list[Column] | None = None
+	requirements: list[Requirement] | None = None
+	table_rows: list[TableRow] | None = None
+
+
+class ChatMessage(ChatMessageBaseSchema):
+	"""ChatMessage Schema for Pydantic. Inherits from ChatMessageBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	chat_session: ChatSession | None = None
+	chat_messages: list[ChatMessage] | None = None
+
+
+class ChatSession(ChatSessionBaseSchema):
+	"""ChatSession Schema for Pydantic. Inherits from ChatSessionBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	agent: Agent | None = None
+	model: Model | None = None
+	organization: Organization | None = None
+	profile: Profile | None = None
+	chat_messages: list[ChatMessage] | None = None
+
+
+class Column(ColumnBaseSchema):
+	"""Column Schema for Pydantic. Inherits from ColumnBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	block: Block | None = None
+	property: Property | None = None
+
+
+class DiagramElementLink(DiagramElementLinkBaseSchema):
+	"""DiagramElementLink Schema for Pydantic. Inherits from DiagramElementLinkBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	excalidraw_diagram: ExcalidrawDiagram | None = None
+	requirement: Requirement | None = None
+
+
+class DiagramElementLinksWithDetail(DiagramElementLinksWithDetailBaseSchema):
+	"""DiagramElementLinksWithDetail Schema for Pydantic. Inherits from DiagramElementLinksWithDetailBaseSchema. Add any customization here."""
+	pass
+
+
+class Document(DocumentBaseSchema):
+	"""Document Schema for Pydantic. Inherits from DocumentBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	project: Project | None = None
+	blocks: list[Block] | None = None
+	properties: list[Property] | None = None
+	requirements: list[Requirement] | None = None
+	table_rows: list[TableRow] | None = None
+	user_roles: list[UserRole] | None = None
+
+
+class EmbeddingCache(EmbeddingCacheBaseSchema):
+	"""EmbeddingCache Schema for Pydantic. Inherits from EmbeddingCacheBaseSchema. Add any customization here."""
+	pass
+
+
+class ExcalidrawDiagram(ExcalidrawDiagramBaseSchema):
+	"""ExcalidrawDiagram Schema for Pydantic. Inherits from ExcalidrawDiagramBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	diagram_element_link: DiagramElementLink | None = None
+
+
+class ExcalidrawElementLink(ExcalidrawElementLinkBaseSchema):
+	"""ExcalidrawElementLink Schema for Pydantic. Inherits from ExcalidrawElementLinkBaseSchema. Add any customization here."""
+	pass
+
+
+class ExternalDocument(ExternalDocumentBaseSchema):
+	"""ExternalDocument Schema for Pydantic. Inherits from ExternalDocumentBaseSchema. Add any customization here."""
+	pass
+
+
+class McpAuditLog(McpAuditLogBaseSchema):
+	"""McpAuditLog Schema for Pydantic. Inherits from McpAuditLogBaseSchema. Add any customization here."""
+	pass
+
+
+class McpConfiguration(McpConfigurationBaseSchema):
+	"""McpConfiguration Schema for Pydantic. Inherits from McpConfigurationBaseSchema. Add any customization here."""
+	pass
+
+
+class McpOauthToken(McpOauthTokenBaseSchema):
+	"""McpOauthToken Schema for Pydantic. Inherits from McpOauthTokenBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	organization: Organization | None = None
+	mcp_oauth_transaction: McpOauthTransaction | None = None
+
+
+class McpOauthTransaction(McpOauthTransactionBaseSchema):
+	"""McpOauthTransaction Schema for Pydantic. Inherits from McpOauthTransactionBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	organization: Organization | None = None
+	mcp_oauth_tokens: list[McpOauthToken] | None = None
+
+
+class McpProfile(McpProfileBaseSchema):
+	"""McpProfile Schema for Pydantic. Inherits from McpProfileBaseSchema. Add any customization here."""
+	pass
+
+
+class McpProxyConfig(McpProxyConfigBaseSchema):
+	"""McpProxyConfig Schema for Pydantic. Inherits from McpProxyConfigBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	organization: Organization | None = None
+
+
+class McpRegistrySyncStatus(McpRegistrySyncStatusBaseSchema):
+	"""McpRegistrySyncStatus Schema for Pydantic. Inherits from McpRegistrySyncStatusBaseSchema. Add any customization here."""
+	pass
+
+
+class McpServerSecurityReview(McpServerSecurityReviewBaseSchema):
+	"""McpServerSecurityReview Schema for Pydantic. Inherits from McpServerSecurityReviewBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	mcp_server: McpServer | None = None
+
+
+class McpServerUsageLog(McpServerUsageLogBaseSchema):
+	"""McpServerUsageLog Schema for Pydantic. Inherits from McpServerUsageLogBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	mcp_server: McpServer | None = None
+	user_mcp_server: UserMcpServer | None = None
+
+
+class McpServer(McpServerBaseSchema):
+	"""McpServer Schema for Pydantic. Inherits from McpServerBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	mcp_server_security_reviews: list[McpServerSecurityReview] | None = None
+	mcp_server_usage_logs: list[McpServerUsageLog] | None = None
+	user_mcp_server: UserMcpServer | None = None
+
+
+class McpSession(McpSessionBaseSchema):
+	"""McpSession Schema for Pydantic. Inherits from McpSessionBaseSchema. Add any customization here."""
+	pass
+
+
+class Model(ModelBaseSchema):
+	"""Model Schema for Pydantic. Inherits from ModelBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	agent: Agent | None = None
+	chat_sessions: list[ChatSession] | None = None
+
+
+class Notification(NotificationBaseSchema):
+	"""Notification Schema for Pydantic. Inherits from NotificationBaseSchema. Add any customization here."""
+	pass
+
+
+class OrganizationInvitation(OrganizationInvitationBaseSchema):
+	"""OrganizationInvitation Schema for Pydantic. Inherits from OrganizationInvitationBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	organization: Organization | None = None
+
+
+class OrganizationMember(OrganizationMemberBaseSchema):
+	"""OrganizationMember Schema for Pydantic. Inherits from OrganizationMemberBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	organization: Organization | None = None
+
+
+class Organization(OrganizationBaseSchema):
+	"""Organization Schema for Pydantic. Inherits from OrganizationBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	audit_logs: list[AuditLog] | None = None
+	billing_cache: BillingCache | None = None
+	blocks: list[Block] | None = None
+	chat_sessions: list[ChatSession] | None = None
+	mcp_oauth_tokens: list[McpOauthToken] | None = None
+	mcp_oauth_transactions: list[McpOauthTransaction] | None = None
+	mcp_proxy_configs: list[McpProxyConfig] | None = None
+	organization_invitations: list[OrganizationInvitation] | None = None
+	organization_member: OrganizationMember | None = None
+	project_members: list[ProjectMember] | None = None
+	projects: list[Project] | None = None
+	properties: list[Property] | None = None
+	stripe_customer: StripeCustomer | None = None
+	usage_logs: list[UsageLog] | None = None
+	user_mcp_servers: list[UserMcpServer] | None = None
+	user_roles: list[UserRole] | None = None
+
+
+class PgAllForeignKey(PgAllForeignKeyBaseSchema):
+	"""PgAllForeignKey Schema for Pydantic. Inherits from PgAllForeignKeyBaseSchema. Add any customization here."""
+	pass
+
+
+class PlatformAdmin(PlatformAdminBaseSchema):
+	"""PlatformAdmin Schema for Pydantic. Inherits from PlatformAdminBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	platform_admins: PlatformAdmin | None = None
+	admin_audit_logs: list[AdminAuditLog] | None = None
+
+
+class Profile(ProfileBaseSchema):
+	"""Profile Schema for Pydantic. Inherits from ProfileBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	audit_logs: AuditLog | None = None
+	chat_sessions: ChatSession | None = None
+	properties: Property | None = None
+	requirements_closure: RequirementsClosure | None = None
+	test_req: TestReq | None = None
+
+
+class ProjectInvitation(ProjectInvitationBaseSchema):
+	"""ProjectInvitation Schema for Pydantic. Inherits from ProjectInvitationBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	project: Project | None = None
+
+
+class ProjectMember(ProjectMemberBaseSchema):
+	"""ProjectMember Schema for Pydantic. Inherits from ProjectMemberBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	organization: Organization | None = None
+	project: Project | None = None
+
+
+class Project(ProjectBaseSchema):
+	"""Project Schema for Pydantic. Inherits from ProjectBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	organization: Organization | None = None
+	audit_logs: list[AuditLog] | None = None
+	documents: list[Document] | None = None
+	project_invitations: list[ProjectInvitation] | None = None
+	project_member: ProjectMember | None = None
+	properties: list[Property] | None = None
+	react_flow_diagrams: list[ReactFlowDiagram] | None = None
+	test_matrix_views: list[TestMatrixView] | None = None
+	test_reqs: list[TestReq] | None = None
+	user_roles: list[UserRole] | None = None
+
+
+class Property(PropertyBaseSchema):
+	"""Property Schema for Pydantic. Inherits from PropertyBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	profile: Profile | None = None
+	document: Document | None = None
+	organization: Organization | None = None
+	project: Project | None = None
+	columns: list[Column] | None = None
+
+
+class RagEmbedding(RagEmbeddingBaseSchema):
+	"""RagEmbedding Schema for Pydantic. Inherits from RagEmbeddingBaseSchema. Add any customization here."""
+	pass
+
+
+class RagSearchAnalytic(RagSearchAnalyticBaseSchema):
+	"""RagSearchAnalytic Schema for Pydantic. Inherits from RagSearchAnalyticBaseSchema. Add any customization here."""
+	pass
+
+
+class ReactFlowDiagram(ReactFlowDiagramBaseSchema):
+	"""ReactFlowDiagram Schema for Pydantic. Inherits from ReactFlowDiagramBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	project: Project | None = None
+
+
+class RequirementTest(RequirementTestBaseSchema):
+	"""RequirementTest Schema for Pydantic. Inherits from RequirementTestBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	requirement: Requirement | None = None
+	test_req: TestReq | None = None
+
+
+class Requirement(RequirementBaseSchema):
+	"""Requirement Schema for Pydantic. Inherits from RequirementBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	block: Block | None = None
+	document: Document | None = None
+	diagram_element_link: DiagramElementLink | None = None
+	requirement_test: RequirementTest | None = None
+	requirements_closures: list[RequirementsClosure] | None = None
+
+
+class RequirementsClosure(RequirementsClosureBaseSchema):
+	"""RequirementsClosure Schema for Pydantic. Inherits from RequirementsClosureBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	requirement: Requirement | None = None
+	profile: Profile | None = None
+
+
+class SignupRequest(SignupRequestBaseSchema):
+	"""SignupRequest Schema for Pydantic. Inherits from SignupRequestBaseSchema. Add any customization here."""
+	pass
+
+
+class StripeCustomer(StripeCustomerBaseSchema):
+	"""StripeCustomer Schema for Pydantic. Inherits from StripeCustomerBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	organization: Organization | None = None
+
+
+class SystemPrompt(SystemPromptBaseSchema):
+	"""SystemPrompt Schema for Pydantic. Inherits from SystemPromptBaseSchema. Add any customization here."""
+	pass
+
+
+class TableRow(TableRowBaseSchema):
+	"""TableRow Schema for Pydantic. Inherits from TableRowBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	block: Block | None = None
+	document: Document | None = None
+
+
+class TapFunky(TapFunkyBaseSchema):
+	"""TapFunky Schema for Pydantic. Inherits from TapFunkyBaseSchema. Add any customization here."""
+	pass
+
+
+class TestMatrixView(TestMatrixViewBaseSchema):
+	"""TestMatrixView Schema for Pydantic. Inherits from TestMatrixViewBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	project: Project | None = None
+
+
+class TestReq(TestReqBaseSchema):
+	"""TestReq Schema for Pydantic. Inherits from TestReqBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	profile: Profile | None = None
+	project: Project | None = None
+	requirement_test: RequirementTest | None = None
+
+
+class TraceLink(TraceLinkBaseSchema):
+	"""TraceLink Schema for Pydantic. Inherits from TraceLinkBaseSchema. Add any customization here."""
+	pass
+
+
+class UsageLog(UsageLogBaseSchema):
+	"""UsageLog Schema for Pydantic. Inherits from UsageLogBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	organization: Organization | None = None
+
+
+class UserMcpServer(UserMcpServerBaseSchema):
+	"""UserMcpServer Schema for Pydantic. Inherits from UserMcpServerBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	organization: Organization | None = None
+	mcp_server: McpServer | None = None
+	mcp_server_usage_logs: list[McpServerUsageLog] | None = None
+
+
+class UserRole(UserRoleBaseSchema):
+	"""UserRole Schema for Pydantic. Inherits from UserRoleBaseSchema. Add any customization here."""
+
+	# Foreign Keys
+	document: Document | None = None
+	organization: Organization | None = None
+	project: Project | None = None
+
+
+class VAgentStatus(VAgentStatusBaseSchema):
+	"""VAgentStatus Schema for Pydantic. Inherits from VAgentStatusBaseSchema. Add any customization here."""
+	pass
+
+
+class VRecentSession(VRecentSessionBaseSchema):
+	"""VRecentSession Schema for Pydantic. Inherits from VRecentSessionBaseSchema. Add any customization here."""
+	pass
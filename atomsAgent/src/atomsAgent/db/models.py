@@ -2,15 +2,20 @@
 
 This module provides wrapper classes around the generated Supabase models
 to add custom methods like `from_row` for compatibility with the repository layer.
+
+Keep these classes free of field and model validators: trusted rows are built
+with ``model_construct``, which never runs them, so any normalisation has to
+live in plain helpers (see ``_with_prompt_defaults``) that both paths share.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable
 from datetime import datetime
-from typing import Any
+from typing import Any, TypeVar
 from uuid import UUID
 
-from pydantic import ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 from atomsAgent.db.generated.fastapi.schema_public_latest import (
     ChatMessageBaseSchema,
@@ -21,6 +26,42 @@ from atomsAgent.db.generated.fastapi.schema_public_latest import (
     SystemPromptBaseSchema,
 )
 
+RowModelT = TypeVar("RowModelT", bound=BaseModel)
+
+# Bound validate_python per model class, looked up once instead of per row.
+_VALIDATORS: dict[type[BaseModel], Callable[[Any], Any]] = {}
+
+
+def _from_row(cls: type[RowModelT], row: dict[str, Any], trusted: bool) -> RowModelT:
+    """Build ``cls`` from a Supabase row.
+
+    Rows are validated by default, so UUID and timestamp columns come back typed.
+    ``trusted=True`` skips validation via ``model_construct`` and keeps column
+    values exactly as decoded from JSON (UUIDs and timestamps stay strings); only
+    pass it where the caller never relies on those types.
+    """
+    if trusted:
+        return cls.model_construct(**row)
+    validate = _VALIDATORS.get(cls)
+    if validate is None:
+        # Resolving the attribute also completes a deferred schema build.
+        validate = _VALIDATORS[cls] = cls.__pydantic_validator__.validate_python
+    return validate(row)
+
+
+def _from_rows(
+    cls: type[RowModelT], rows: Iterable[dict[str, Any]], trusted: bool
+) -> list[RowModelT]:
+    """Build ``cls`` instances for a batch of rows.
+
+    Untrusted batches are validated in a single pydantic-core call through the
+    cached ``list[cls]`` adapter behind ``validate_many``.
+    """
+    if trusted:
+        construct = cls.model_construct
+        return [construct(**row) for row in rows]
+    return cls.validate_many(rows)  # type: ignore[attr-defined]
+
 
 class SupabaseChatMessage(ChatMessageBaseSchema):
     """Chat message model with custom methods.
@@ -28,16 +69,23 @@ class SupabaseChatMessage(ChatMessageBaseSchema):
     Uses BaseSchema to avoid circular dependencies with foreign key relationships.
     """
 
-    model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
+    model_config = ConfigDict(from_attributes=True)
 
     # Override UUID fields to accept any UUID version
     id: UUID = Field(...)  # type: ignore
     session_id: UUID = Field(...)  # type: ignore
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> SupabaseChatMessage:
+    def from_row(cls, row: dict[str, Any], *, trusted: bool = False) -> SupabaseChatMessage:
         """Create a SupabaseChatMessage instance from a database row."""
-        return cls.model_validate(row)
+        return _from_row(cls, row, trusted)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[dict[str, Any]], *, trusted: bool = False
+    ) -> list[SupabaseChatMessage]:
+        """Create SupabaseChatMessage instances from a batch of database rows."""
+        return _from_rows(cls, rows, trusted)
 
 
 class SupabaseChatSession(ChatSessionBaseSchema):
@@ -46,19 +94,26 @@ class SupabaseChatSession(ChatSessionBaseSchema):
     Uses BaseSchema to avoid circular dependencies with foreign key relationships.
     """
 
-    model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
+    model_config = ConfigDict(from_attributes=True)
 
     # Override UUID fields to accept any UUID version
     id: UUID = Field(...)  # type: ignore
     user_id: UUID = Field(...)  # type: ignore
     org_id: UUID | None = Field(default=None)  # type: ignore
     agent_id: UUID | None = Field(default=None)  # type: ignore
-    field_model_id: UUID | None = Field(default=None, alias="model_id")  # type: ignore
+    model_id: UUID | None = Field(default=None)  # type: ignore
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> SupabaseChatSession:
+    def from_row(cls, row: dict[str, Any], *, trusted: bool = False) -> SupabaseChatSession:
         """Create a SupabaseChatSession instance from a database row."""
-        return cls.model_validate(row)
+        return _from_row(cls, row, trusted)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[dict[str, Any]], *, trusted: bool = False
+    ) -> list[SupabaseChatSession]:
+        """Create SupabaseChatSession instances from a batch of database rows."""
+        return _from_rows(cls, rows, trusted)
 
 
 class SupabaseMcpConfiguration(McpConfigurationBaseSchema):
@@ -67,15 +122,22 @@ class SupabaseMcpConfiguration(McpConfigurationBaseSchema):
     Uses BaseSchema to avoid circular dependencies with foreign key relationships.
     """
 
-    model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
+    model_config = ConfigDict(from_attributes=True)
 
     # Override UUID fields to accept any UUID version (if any exist)
     # MCP config uses string IDs, so no UUID override needed
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> SupabaseMcpConfiguration:
+    def from_row(cls, row: dict[str, Any], *, trusted: bool = False) -> SupabaseMcpConfiguration:
         """Create a SupabaseMcpConfiguration instance from a database row."""
-        return cls.model_validate(row)
+        return _from_row(cls, row, trusted)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[dict[str, Any]], *, trusted: bool = False
+    ) -> list[SupabaseMcpConfiguration]:
+        """Create SupabaseMcpConfiguration instances from a batch of database rows."""
+        return _from_rows(cls, rows, trusted)
 
 
 class SupabaseMcpOauthToken(McpOauthTokenBaseSchema):
@@ -84,7 +146,7 @@ class SupabaseMcpOauthToken(McpOauthTokenBaseSchema):
     Uses BaseSchema to avoid circular dependencies with foreign key relationships.
     """
 
-    model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
+    model_config = ConfigDict(from_attributes=True)
 
     # Override UUID fields to accept any UUID version
     id: UUID = Field(...)  # type: ignore
@@ -93,9 +155,16 @@ class SupabaseMcpOauthToken(McpOauthTokenBaseSchema):
     organization_id: UUID | None = Field(default=None)  # type: ignore
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> SupabaseMcpOauthToken:
+    def from_row(cls, row: dict[str, Any], *, trusted: bool = False) -> SupabaseMcpOauthToken:
         """Create a SupabaseMcpOauthToken instance from a database row."""
-        return cls.model_validate(row)
+        return _from_row(cls, row, trusted)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[dict[str, Any]], *, trusted: bool = False
+    ) -> list[SupabaseMcpOauthToken]:
+        """Create SupabaseMcpOauthToken instances from a batch of database rows."""
+        return _from_rows(cls, rows, trusted)
 
 
 class SupabaseMcpOauthTransaction(McpOauthTransactionBaseSchema):
@@ -104,7 +173,7 @@ class SupabaseMcpOauthTransaction(McpOauthTransactionBaseSchema):
     Uses BaseSchema to avoid circular dependencies with foreign key relationships.
     """
 
-    model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
+    model_config = ConfigDict(from_attributes=True)
 
     # Override UUID fields to accept any UUID version
     id: UUID = Field(...)  # type: ignore
@@ -112,9 +181,37 @@ class SupabaseMcpOauthTransaction(McpOauthTransactionBaseSchema):
     organization_id: UUID | None = Field(default=None)  # type: ignore
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> SupabaseMcpOauthTransaction:
+    def from_row(cls, row: dict[str, Any], *, trusted: bool = False) -> SupabaseMcpOauthTransaction:
         """Create a SupabaseMcpOauthTransaction instance from a database row."""
-        return cls.model_validate(row)
+        return _from_row(cls, row, trusted)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[dict[str, Any]], *, trusted: bool = False
+    ) -> list[SupabaseMcpOauthTransaction]:
+        """Create SupabaseMcpOauthTransaction instances from a batch of database rows."""
+        return _from_rows(cls, rows, trusted)
+
+
+def _with_prompt_defaults(row: dict[str, Any]) -> dict[str, Any]:
+    """Fill the required system prompt columns a partial select may omit."""
+    # Rows selected from the table always carry these columns; only partial
+    # selects need the copy and the defaults below.
+    if "created_at" in row and "updated_at" in row and "name" in row:
+        return row
+
+    # Provide defaults for required fields if missing
+    now = datetime.now()
+    data = dict(row)
+
+    # Set defaults only if fields are missing
+    if 'created_at' not in data:
+        data['created_at'] = now
+    if 'updated_at' not in data:
+        data['updated_at'] = now
+    if 'name' not in data:
+        data['name'] = data.get('id', 'unnamed')
+    return data
 
 
 class SupabaseSystemPrompt(SystemPromptBaseSchema):
@@ -123,27 +220,22 @@ class SupabaseSystemPrompt(SystemPromptBaseSchema):
     Uses BaseSchema to avoid circular dependencies with foreign key relationships.
     """
 
-    model_config = ConfigDict(from_attributes=True, arbitrary_types_allowed=True)
+    model_config = ConfigDict(from_attributes=True)
 
     @classmethod
-    def from_row(cls, row: dict[str, Any]) -> SupabaseSystemPrompt:
+    def from_row(cls, row: dict[str, Any], *, trusted: bool = False) -> SupabaseSystemPrompt:
         """Create a SupabaseSystemPrompt instance from a database row.
 
         Handles missing fields by providing defaults for required fields.
         """
-        # Provide defaults for required fields if missing
-        now = datetime.now()
-        data = dict(row)
-
-        # Set defaults only if fields are missing
-        if 'created_at' not in data:
-            data['created_at'] = now
-        if 'updated_at' not in data:
-            data['updated_at'] = now
-        if 'name' not in data:
-            data['name'] = data.get('id', 'unnamed')
-
-        return cls.model_validate(data)
+        return _from_row(cls, _with_prompt_defaults(row), trusted)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Iterable[dict[str, Any]], *, trusted: bool = False
+    ) -> list[SupabaseSystemPrompt]:
+        """Create SupabaseSystemPrompt instances from a batch of database rows."""
+        return _from_rows(cls, map(_with_prompt_defaults, rows), trusted)
 
 
 __all__ = [
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Iterable
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
 
+import orjson
+from aiocache import Cache
+
 from atomsAgent.db.models import SupabaseMcpOauthToken, SupabaseMcpOauthTransaction
-from atomsAgent.db.supabase import SupabaseClient
+from atomsAgent.db.supabase import SupabaseClient, SupabaseError
+
+logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class PromptRecord:
     id: str
     content: str
@@ -21,10 +28,18 @@ class PromptRecord:
 
 
 class PromptRepository:
-    """Data access helpers for system prompts."""
+    """Data access helpers for system prompts.
 
-    def __init__(self, client: SupabaseClient) -> None:
+    When a ``cache`` is given, ``list_prompts`` results are kept for ``cache_ttl``
+    seconds per (organization, user), since prompts are read on every chat turn.
+    """
+
+    def __init__(
+        self, client: SupabaseClient, *, cache: Cache | None = None, cache_ttl: int = 60
+    ) -> None:
         self._client = client
+        self._cache = cache
+        self._cache_ttl = cache_ttl
 
     async def list_prompts(
         self,
@@ -32,35 +47,38 @@ class PromptRepository:
         organization_id: UUID | None,
         user_id: UUID | None,
     ) -> list[PromptRecord]:
+        if self._cache is None:
+            return await self._fetch_prompts(organization_id, user_id)
+        key = f"prompts:{organization_id}:{user_id}"
+        records = await self._cache.get(key)  # type: ignore
+        if records is None:
+            records = await self._fetch_prompts(organization_id, user_id)
+            await self._cache.set(key, records, ttl=self._cache_ttl)  # type: ignore
+        return list(records)
+
+    async def _fetch_prompts(
+        self, organization_id: UUID | None, user_id: UUID | None
+    ) -> list[PromptRecord]:
+        # Let PostgREST apply the scope rules so only applicable prompts come back:
+        # global prompts always, organization prompts for the caller's org and user
+        # prompts only when both the org and the user match.
+        scopes = ["scope.eq.global"]
+        if organization_id:
+            scopes.append(f"and(scope.eq.organization,organization_id.eq.{organization_id})")
+            if user_id:
+                scopes.append(
+                    f"and(scope.eq.user,organization_id.eq.{organization_id},user_id.eq.{user_id})"
+                )
         response = await self._client.select(
             "system_prompts",
             columns="id,content,priority,scope,organization_id,user_id,template,enabled",
-            filters={"enabled": "eq.true"},
+            filters={"enabled": "eq.true", "or": f"({','.join(scopes)})"},
             order=["priority.desc"],
         )
-        records: list[PromptRecord] = []
-        org_id_str = str(organization_id) if organization_id else None
-        user_id_str = str(user_id) if user_id else None
-        for row in response.data:
-            scope = row.get("scope")
-            if scope == "global":
-                records.append(_prompt_record_from_row(row))
-            elif (
-                scope == "organization" and org_id_str and row.get("organization_id") == org_id_str
-            ):
-                records.append(_prompt_record_from_row(row))
-            elif (
-                scope == "user"
-                and org_id_str
-                and user_id_str
-                and row.get("organization_id") == org_id_str
-                and row.get("user_id") == user_id_str
-            ):
-                records.append(_prompt_record_from_row(row))
-        return records
+        return [_prompt_record_from_row(row) for row in response.data]
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPConfigRecord:
     id: str
     org_id: str | None  # Changed from organization_id to match DB
@@ -81,11 +99,22 @@ class MCPConfigRecord:
     enabled: bool
 
 
+_MCP_CACHE_NAMESPACE = "mcp-configs:"
+
+
 class MCPRepository:
-    """Data access helpers for MCP configurations."""
+    """Data access helpers for MCP configurations.
 
-    def __init__(self, client: SupabaseClient) -> None:
+    When a ``cache`` is given, ``list_configs`` results are kept for ``cache_ttl``
+    seconds; creating, updating or deleting a configuration clears them.
+    """
+
+    def __init__(
+        self, client: SupabaseClient, *, cache: Cache | None = None, cache_ttl: int = 60
+    ) -> None:
         self._client = client
+        self._cache = cache
+        self._cache_ttl = cache_ttl
 
     async def list_configs(
         self,
@@ -94,37 +123,33 @@ class MCPRepository:
         user_id: UUID | None,
         include_platform: bool = True,
     ) -> list[MCPConfigRecord]:
-        # Get org-specific configs first
-        org_id_str = str(organization_id)
-        org_filters = {"enabled": "eq.true", "org_id": f"eq.{org_id_str}"}
+        if self._cache is None:
+            return await self._fetch_configs(organization_id, user_id, include_platform)
+        key = f"{_MCP_CACHE_NAMESPACE}{organization_id}:{user_id}:{int(include_platform)}"
+        records = await self._cache.get(key)  # type: ignore
+        if records is None:
+            records = await self._fetch_configs(organization_id, user_id, include_platform)
+            await self._cache.set(key, records, ttl=self._cache_ttl)  # type: ignore
+        return list(records)
+
+    async def _fetch_configs(
+        self, organization_id: UUID, user_id: UUID | None, include_platform: bool
+    ) -> list[MCPConfigRecord]:
+        # One query covers every visible config: org-wide rows, the user's own rows
+        # in that org and, optionally, platform rows (no org). Ordering org rows
+        # first keeps platform configs after the org's own ones.
+        scopes = [f"and(org_id.eq.{organization_id},user_id.is.null)"]
+        if user_id:
+            scopes.append(f"and(org_id.eq.{organization_id},user_id.eq.{user_id})")
+        if include_platform:
+            scopes.append("org_id.is.null")
         response = await self._client.select(
             "mcp_configurations",
             columns="id,org_id,user_id,name,type,endpoint,auth_type,auth_token,auth_header,config,scope,enabled,description,created_at,updated_at,created_by,updated_by",
-            filters=org_filters,
+            filters={"enabled": "eq.true", "or": f"({','.join(scopes)})"},
+            order=["org_id.asc.nullslast"],
         )
-        configs: list[MCPConfigRecord] = []
-        user_id_str = str(user_id) if user_id else None
-        for row in response.data:
-            row_org_id = row.get("org_id")
-            row_user_id = row.get("user_id")
-            if row_org_id == org_id_str and row_user_id is None:
-                configs.append(_mcp_record_from_row(row))
-            elif user_id_str and row_org_id == org_id_str and row_user_id == user_id_str:
-                configs.append(_mcp_record_from_row(row))
-
-        # If include_platform, get platform configs separately
-        if include_platform:
-            platform_filters = {"enabled": "eq.true", "org_id": "is.null"}
-            platform_response = await self._client.select(
-                "mcp_configurations",
-                columns="id,org_id,user_id,name,type,endpoint,auth_type,auth_token,auth_header,config,scope,enabled,description,created_at,updated_at,created_by,updated_by",
-                filters=platform_filters,
-            )
-            for row in platform_response.data:
-                if row.get("org_id") is None:
-                    configs.append(_mcp_record_from_row(row))
-
-        return configs
+        return [_mcp_record_from_row(row) for row in response.data]
 
     async def get_config(self, config_id: UUID) -> MCPConfigRecord:
         response = await self._client.select(
@@ -138,6 +163,7 @@ class MCPRepository:
 
     async def create_config(self, payload: dict[str, Any]) -> MCPConfigRecord:
         response = await self._client.insert("mcp_configurations", payload)
+        await self._invalidate()
         return _mcp_record_from_row(response.data[0])
 
     async def update_config(self, config_id: UUID, payload: dict[str, Any]) -> MCPConfigRecord:
@@ -146,6 +172,7 @@ class MCPRepository:
             filters={"id": f"eq.{config_id}"},
             payload=payload,
         )
+        await self._invalidate()
         return _mcp_record_from_row(response.data[0])
 
     async def delete_config(self, config_id: UUID) -> None:
@@ -153,9 +180,15 @@ class MCPRepository:
             "mcp_configurations",
             filters={"id": f"eq.{config_id}"},
         )
+        await self._invalidate()
+
+    async def _invalidate(self) -> None:
+        # A config can be visible under many (org, user) keys, so drop them all.
+        if self._cache is not None:
+            await self._cache.clear(namespace=_MCP_CACHE_NAMESPACE)  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformStatsRecord:
     total_users: int
     active_users: int
@@ -169,7 +202,7 @@ class PlatformStatsRecord:
     circuit_breaker_status: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class AdminRecord:
     id: str
     email: str
@@ -179,7 +212,7 @@ class AdminRecord:
     workos_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditLogRecord:
     id: str
     timestamp: str
@@ -195,23 +228,51 @@ class PlatformRepository:
         self._client = client
 
     async def get_stats(self) -> PlatformStatsRecord:
-        orgs = await self._client.select("organizations", columns="id", count=True)
-        users = await self._client.select("users", columns="id", count=True)
-        sessions = await self._client.select("user_sessions", columns="id", count=True)
-        mcps = await self._client.select("mcp_configurations", columns="id", count=True)
+        try:
+            # platform_stats() (07_platform_stats_rpc.sql) returns all counts at once.
+            response = await self._client.rpc("platform_stats")
+            counts: dict[str, int] = response.data
+        except SupabaseError as exc:
+            logger.debug("platform_stats RPC unavailable, counting tables: %s", exc)
+            counts = await self._count_tables()
         return PlatformStatsRecord(
-            total_organizations=orgs.count or 0,
-            total_users=users.count or 0,
-            active_users=sessions.count or 0,
+            total_organizations=counts.get("total_organizations") or 0,
+            total_users=counts.get("total_users") or 0,
+            active_users=counts.get("active_users") or 0,
             total_requests=0,
             requests_today=0,
             total_tokens=0,
             tokens_today=0,
-            total_mcp_servers=mcps.count or 0,
+            total_mcp_servers=counts.get("total_mcp_servers") or 0,
             active_agents=["claude", "gemini"],
             circuit_breaker_status="healthy",
         )
 
+    async def _count_tables(self) -> dict[str, int]:
+        tables = {
+            "total_organizations": "organizations",
+            "total_users": "users",
+            "active_users": "user_sessions",
+            "total_mcp_servers": "mcp_configurations",
+        }
+        # The counts are independent, so issue them concurrently. A failing table
+        # reports zero instead of failing the whole dashboard. Dashboard figures
+        # do not need to be exact, so large tables use the planner's estimate.
+        results = await asyncio.gather(
+            *(self._client.count(table, mode="estimated") for table in tables.values()),
+            return_exceptions=True,
+        )
+        counts: dict[str, int] = {}
+        for (key, table), result in zip(tables.items(), results):
+            if not isinstance(result, BaseException):
+                counts[key] = result or 0
+                continue
+            if not isinstance(result, Exception):
+                raise result
+            logger.warning("Failed to count %s rows: %s", table, result)
+            counts[key] = 0
+        return counts
+
     async def list_admins(self) -> list[AdminRecord]:
         response = await self._client.select(
             "platform_admins",
@@ -243,7 +304,7 @@ class PlatformRepository:
                 details = raw_details  # type: ignore[assignment]
             elif isinstance(raw_details, str):
                 try:
-                    details = json.loads(raw_details)
+                    details = orjson.loads(raw_details)
                 except Exception:
                     details = {}
             row["details"] = details
@@ -251,7 +312,7 @@ class PlatformRepository:
         return records
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatSessionRecord:
     id: str
     user_id: str
@@ -270,7 +331,7 @@ class ChatSessionRecord:
     archived: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessageRecord:
     id: str
     session_id: str
@@ -341,150 +402,92 @@ class ChatHistoryRepository:
         return sessions, response.count or 0
 
     async def insert_message(self, payload: dict[str, Any]) -> ChatMessageRecord:
-        response = await self._client.insert("chat_messages", payload)
-        return _chat_message_from_row(response.data[0])
+        return (await self.insert_messages([payload]))[0]
 
-    async def fetch_messages(self, session_id: str) -> list[ChatMessageRecord]:
-        response = await self._client.select(
-            "chat_messages",
-            columns="id,session_id,message_index,role,content,metadata,tokens_in,tokens_out,tokens_total,created_at,updated_at",
-            filters={"session_id": f"eq.{session_id}"},
-            order=["message_index.asc"],
-        )
+    async def insert_messages(self, payloads: list[dict[str, Any]]) -> list[ChatMessageRecord]:
+        # PostgREST inserts a JSON array of rows in one request.
+        response = await self._client.insert("chat_messages", payloads)
         return [_chat_message_from_row(row) for row in response.data]
 
+    async def fetch_messages(self, session_id: str) -> list[ChatMessageRecord]:
+        return [message async for message in self.iter_messages(session_id)]
+
+    async def iter_messages(
+        self, session_id: str, *, page_size: int = 200
+    ) -> AsyncIterator[ChatMessageRecord]:
+        """Yield a session's messages in order, fetching ``page_size`` rows at a time.
+
+        Long conversations are decoded page by page instead of as one large body.
+        """
+        offset = 0
+        while True:
+            response = await self._client.select(
+                "chat_messages",
+                columns="id,session_id,message_index,role,content,metadata,tokens_total,created_at,updated_at",
+                filters={"session_id": f"eq.{session_id}"},
+                order=["message_index.asc"],
+                limit=page_size,
+                offset=offset,
+            )
+            for row in response.data:
+                yield _chat_message_from_row(row)
+            if len(response.data) < page_size:
+                return
+            offset += page_size
+
+
+def _optional_str(value: Any) -> str | None:
+    return value if value is None or isinstance(value, str) else str(value)
+
 
 def _prompt_record_from_row(row: dict[str, Any]) -> PromptRecord:
     prompt_id = row.get("id")
     if prompt_id is None:
         raise ValueError("prompt row missing id")
-    if not isinstance(prompt_id, str):
-        prompt_id = str(prompt_id)
-
-    content = row.get("content", "")
-    if not isinstance(content, str):
-        content = str(content)
-
-    priority_raw = row.get("priority", 0)
-    priority = int(priority_raw) if not isinstance(priority_raw, int) else priority_raw
-
-    scope_value = row.get("scope", "global")
-    if not isinstance(scope_value, str):
-        scope_value = str(scope_value)
-
-    organization_id = row.get("organization_id")
-    if organization_id is not None and not isinstance(organization_id, str):
-        organization_id = str(organization_id)
-
-    user_id = row.get("user_id")
-    if user_id is not None and not isinstance(user_id, str):
-        user_id = str(user_id)
-
-    template_value = row.get("template")
-    if template_value is not None and not isinstance(template_value, str):
-        template_value = str(template_value)
 
+    priority = row.get("priority", 0)
     return PromptRecord(
-        id=prompt_id,
-        content=content,
-        priority=priority,
-        scope=scope_value,
-        organization_id=organization_id,
-        user_id=user_id,
-        template=template_value,
+        id=str(prompt_id),
+        content=str(row.get("content", "")),
+        priority=priority if isinstance(priority, int) else int(priority),
+        scope=str(row.get("scope", "global")),
+        organization_id=_optional_str(row.get("organization_id")),
+        user_id=_optional_str(row.get("user_id")),
+        template=_optional_str(row.get("template")),
     )
 
 
+# Nullable columns copied as strings, and required columns that must be non-empty.
+_MCP_OPTIONAL_STR_COLUMNS = (
+    "org_id",
+    "user_id",
+    "endpoint",
+    "auth_token",
+    "auth_header",
+    "config",
+    "scope",
+    "description",
+    "created_at",
+    "updated_at",
+    "created_by",
+    "updated_by",
+)
+_MCP_REQUIRED_STR_COLUMNS = ("name", "type", "auth_type")
+
+
 def _mcp_record_from_row(row: dict[str, Any]) -> MCPConfigRecord:
     record_id = row.get("id")
     if record_id is None:
         raise ValueError("MCP configuration row missing id")
-    record_id_str = str(record_id)
-
-    # Map org_id from database to org_id field
-    org_id = row.get("org_id")
-    if org_id is not None and not isinstance(org_id, str):
-        org_id = str(org_id)
-
-    user_id = row.get("user_id")
-    if user_id is not None and not isinstance(user_id, str):
-        user_id = str(user_id)
-
-    name = row.get("name")
-    if not isinstance(name, str) or not name:
-        raise ValueError("MCP configuration row missing name")
-
-    type_value = row.get("type")
-    if not isinstance(type_value, str) or not type_value:
-        raise ValueError("MCP configuration row missing type")
-
-    endpoint_value = row.get("endpoint")
-    if endpoint_value is not None and not isinstance(endpoint_value, str):
-        endpoint_value = str(endpoint_value)
-
-    auth_value = row.get("auth_type")
-    if not isinstance(auth_value, str) or not auth_value:
-        raise ValueError("MCP configuration row missing auth_type")
-
-    # Map database fields to model fields
-    auth_token = row.get("auth_token")
-    if auth_token is not None and not isinstance(auth_token, str):
-        auth_token = str(auth_token)
-
-    auth_header = row.get("auth_header")
-    if auth_header is not None and not isinstance(auth_header, str):
-        auth_header = str(auth_header)
-
-    config_field = row.get("config")
-    if config_field is not None and not isinstance(config_field, str):
-        config_field = str(config_field)
-
-    scope_field = row.get("scope")
-    if scope_field is not None and not isinstance(scope_field, str):
-        scope_field = str(scope_field)
-
-    description_field = row.get("description")
-    if description_field is not None and not isinstance(description_field, str):
-        description_field = str(description_field)
-
-    enabled_value = row.get("enabled", True)
-    enabled = bool(enabled_value)
-
-    created_at = row.get("created_at")
-    if created_at is not None and not isinstance(created_at, str):
-        created_at = str(created_at)
-
-    updated_at = row.get("updated_at")
-    if updated_at is not None and not isinstance(updated_at, str):
-        updated_at = str(updated_at)
-
-    created_by = row.get("created_by")
-    if created_by is not None and not isinstance(created_by, str):
-        created_by = str(created_by)
-
-    updated_by = row.get("updated_by")
-    if updated_by is not None and not isinstance(updated_by, str):
-        updated_by = str(updated_by)
-
-    return MCPConfigRecord(
-        id=record_id_str,
-        org_id=org_id,
-        user_id=user_id,
-        name=name,
-        type=type_value,
-        endpoint=endpoint_value,
-        auth_type=auth_value,
-        auth_token=auth_token,
-        auth_header=auth_header,
-        config=config_field,
-        scope=scope_field,
-        description=description_field,
-        created_at=created_at,
-        updated_at=updated_at,
-        created_by=created_by,
-        updated_by=updated_by,
-        enabled=enabled,
-    )
+
+    values = {column: _optional_str(row.get(column)) for column in _MCP_OPTIONAL_STR_COLUMNS}
+    for column in _MCP_REQUIRED_STR_COLUMNS:
+        value = row.get(column)
+        if not isinstance(value, str) or not value:
+            raise ValueError(f"MCP configuration row missing {column}")
+        values[column] = value
+
+    return MCPConfigRecord(id=str(record_id), enabled=bool(row.get("enabled", True)), **values)
 
 
 def _chat_session_from_row(row: dict[str, Any]) -> ChatSessionRecord:
@@ -514,14 +517,15 @@ def _chat_message_from_row(row: dict[str, Any]) -> ChatMessageRecord:
         message_index=row.get("message_index", 0) or 0,
         role=row.get("role", ""),
         content=row.get("content", ""),
-        metadata=dict(row.get("metadata", {}) or {}),  # type: ignore[arg-type]
-        tokens=row.get("tokens") or row.get("tokens_total") or row.get("tokens_out"),
+        # Rows are freshly decoded per response, so metadata needs no defensive copy.
+        metadata=row.get("metadata") or {},  # type: ignore[arg-type]
+        tokens=row.get("tokens_total"),
         created_at=str(row.get("created_at", "")),
         updated_at=str(row.get("updated_at", "")),
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPOAuthTransactionRecord:
     """Record for MCP OAuth transaction."""
     id: str
@@ -542,7 +546,7 @@ class MCPOAuthTransactionRecord:
     completed_at: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPOAuthTokenRecord:
     """Record for MCP OAuth token."""
     id: str
@@ -638,3 +642,38 @@ class MCPOAuthRepository:
             return None
 
         return SupabaseMcpOauthToken.from_row(response.data[0])
+
+    async def get_latest_tokens_for_namespaces(
+        self,
+        *,
+        mcp_namespaces: Iterable[str],
+        user_id: UUID | None = None,
+        organization_id: UUID | None = None,
+    ) -> dict[str, SupabaseMcpOauthToken]:
+        """Get the latest OAuth tokens for several namespaces in one query."""
+        namespaces = sorted(set(mcp_namespaces))
+        if not namespaces:
+            return {}
+
+        # Namespaces look like "owner/server"; PostgREST takes JSON-style quoted values.
+        quoted = ",".join(orjson.dumps(ns).decode() for ns in namespaces)
+        filters: dict[str, str] = {"mcp_namespace": f"in.({quoted})"}
+
+        if user_id:
+            filters["user_id"] = f"eq.{user_id}"
+        if organization_id:
+            filters["organization_id"] = f"eq.{organization_id}"
+
+        response = await self._client.select(
+            "mcp_oauth_tokens",
+            columns="*",
+            filters=filters,
+            order=["issued_at.desc"],
+        )
+
+        newest: dict[str, dict[str, Any]] = {}
+        for row in response.data or []:
+            # Rows are newest first, so keep the first one seen per namespace.
+            newest.setdefault(row["mcp_namespace"], row)
+        tokens = SupabaseMcpOauthToken.from_rows(newest.values())
+        return {token.mcp_namespace: token for token in tokens}
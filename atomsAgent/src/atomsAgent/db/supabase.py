@@ -1,10 +1,24 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import logging
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Literal, get_args
 
 import httpx
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# PostgREST count strategies: "exact" runs count(*); "planned" uses the planner's
+# estimate; "estimated" is exact for small results and planned beyond db-max-rows.
+CountMode = Literal["exact", "planned", "estimated"]
+
+
+def _dumps(payload: Any) -> bytes:
+    # orjson returns bytes httpx can send as-is; NON_STR_KEYS keeps json.dumps'
+    # tolerance for int keys in metadata dicts.
+    return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
 
 
 @dataclass(slots=True)
@@ -20,7 +34,15 @@ class SupabaseError(RuntimeError):
 class SupabaseClient:
     """HTTP-based Supabase client using the REST interface."""
 
-    def __init__(self, *, url: str, service_role_key: str, schema: str = "public") -> None:
+    def __init__(
+        self,
+        *,
+        url: str,
+        service_role_key: str,
+        schema: str = "public",
+        max_concurrent_requests: int = 20,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         if not url or not service_role_key:
             raise ValueError("Supabase URL and service role key are required")
         self.base_url = url.rstrip("/") + "/rest/v1"
@@ -38,6 +60,76 @@ class SupabaseClient:
             # Bypass RLS for service role
             "X-Forwarded-For": "127.0.0.1",
         }
+        # Merged over the client's default headers when a count is requested.
+        self._count_headers = {
+            mode: {"Prefer": f"{self._default_headers['Prefer']},count={mode}"}
+            for mode in get_args(CountMode)
+        }
+        # HTTP/2 multiplexes requests over few connections, so the pool limits only
+        # bound TCP connections; in-flight requests are capped by _request_slots.
+        self._max_concurrent_requests = max_concurrent_requests
+        self._limits = httpx.Limits(
+            max_connections=max_concurrent_requests,
+            max_keepalive_connections=max_concurrent_requests,
+        )
+        self._transport = transport
+        self._http_client: httpx.AsyncClient | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+        self._request_slots = asyncio.Semaphore(max_concurrent_requests)
+
+    def _http(self) -> httpx.AsyncClient:
+        """Return the pooled HTTP client, keeping connections alive between calls.
+
+        The client is bound to the event loop that created it, so a new one is
+        opened if this instance is later used from a different loop. Callers that
+        run their own short-lived loops (CLI commands) should ``aclose()`` before
+        the loop ends: connections of a closed loop can no longer be shut down.
+        """
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._http_loop is not loop:
+            if self._http_client is not None:
+                self._close_on_own_loop(self._http_client, self._http_loop)
+            self._http_client = httpx.AsyncClient(
+                headers=self._default_headers,
+                http2=True,
+                limits=self._limits,
+                transport=self._transport,
+                timeout=httpx.Timeout(10.0, connect=3.0),
+            )
+            self._http_loop = loop
+            # Semaphores bind to the loop that first waits on them; renew it with the client
+            self._request_slots = asyncio.Semaphore(self._max_concurrent_requests)
+        return self._http_client
+
+    async def _send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send one request, queueing while ``max_concurrent_requests`` are in flight."""
+        client = self._http()
+        async with self._request_slots:
+            return await client.request(method, url, **kwargs)
+
+    @staticmethod
+    def _close_on_own_loop(
+        client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None
+    ) -> None:
+        # Pooled connections can only be closed on the loop that opened them.
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            logger.warning(
+                "Supabase HTTP client was not closed before its event loop ended; "
+                "its pooled connections are abandoned"
+            )
+
+    async def warmup(self) -> None:
+        """Open a pooled connection (TCP + TLS) ahead of the first real query."""
+        response = await self._send("HEAD", f"{self.base_url}/")
+        self._raise_for_status(response)
+
+    async def aclose(self) -> None:
+        """Close pooled connections; the next request opens a fresh client."""
+        if self._http_client is not None:
+            client, self._http_client, self._http_loop = self._http_client, None, None
+            await client.aclose()
 
     async def select(
         self,
@@ -49,6 +141,7 @@ class SupabaseClient:
         limit: int | None = None,
         offset: int | None = None,
         count: bool = False,
+        count_mode: CountMode = "exact",
     ) -> SupabaseResponse:
         params: dict[str, str] = {"select": columns}
         if filters:
@@ -59,29 +152,45 @@ class SupabaseClient:
             params["limit"] = str(limit)
         if offset is not None:
             params["offset"] = str(offset)
-        headers = dict(self._default_headers)
-        if count:
-            headers["Prefer"] = headers["Prefer"] + ",count=exact"
-
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/{table}",
-                params=params,
-                headers=headers,
-            )
+
+        response = await self._send(
+            "GET",
+            f"{self.base_url}/{table}",
+            params=params,
+            headers=self._count_headers[count_mode] if count else None,
+        )
         self._raise_for_status(response)
         total = self._extract_count(response) if count else None
-        return SupabaseResponse(data=response.json(), count=total)
+        return SupabaseResponse(data=self._decode(response), count=total)
 
-    async def insert(self, table: str, payload: dict[str, Any]) -> SupabaseResponse:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/{table}",
-                headers=self._default_headers,
-                content=json.dumps(payload),
-            )
+    async def count(
+        self,
+        table: str,
+        *,
+        filters: dict[str, str] | None = None,
+        mode: CountMode = "exact",
+    ) -> int | None:
+        """Count matching rows with a HEAD request; only Content-Range comes back."""
+        response = await self._send(
+            "HEAD",
+            f"{self.base_url}/{table}",
+            params=filters,
+            headers=self._count_headers[mode],
+        )
+        self._raise_for_status(response)
+        return self._extract_count(response)
+
+    async def insert(
+        self, table: str, payload: dict[str, Any] | list[dict[str, Any]]
+    ) -> SupabaseResponse:
+        """Insert one row, or several in a single request when given a list."""
+        response = await self._send(
+            "POST",
+            f"{self.base_url}/{table}",
+            content=_dumps(payload),
+        )
         self._raise_for_status(response)
-        return SupabaseResponse(data=response.json())
+        return SupabaseResponse(data=self._decode(response))
 
     async def update(
         self,
@@ -90,44 +199,49 @@ class SupabaseClient:
         filters: dict[str, str],
         payload: dict[str, Any],
     ) -> SupabaseResponse:
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{self.base_url}/{table}",
-                params=filters,
-                headers=self._default_headers,
-                content=json.dumps(payload),
-            )
+        response = await self._send(
+            "PATCH",
+            f"{self.base_url}/{table}",
+            params=filters,
+            content=_dumps(payload),
+        )
         self._raise_for_status(response)
-        return SupabaseResponse(data=response.json())
+        return SupabaseResponse(data=self._decode(response))
 
     async def delete(self, table: str, *, filters: dict[str, str]) -> SupabaseResponse:
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{self.base_url}/{table}",
-                params=filters,
-                headers=self._default_headers,
-            )
+        response = await self._send(
+            "DELETE",
+            f"{self.base_url}/{table}",
+            params=filters,
+        )
         self._raise_for_status(response)
-        return SupabaseResponse(data=response.json())
+        return SupabaseResponse(data=self._decode(response))
 
     async def rpc(
         self, function_name: str, *, params: dict[str, Any] | None = None
     ) -> SupabaseResponse:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.rpc_url}/{function_name}",
-                headers=self._default_headers,
-                content=json.dumps(params or {}),
-            )
+        response = await self._send(
+            "POST",
+            f"{self.rpc_url}/{function_name}",
+            content=_dumps(params or {}),
+        )
         self._raise_for_status(response)
-        return SupabaseResponse(data=response.json())
+        return SupabaseResponse(data=self._decode(response))
+
+    @staticmethod
+    def _decode(response: httpx.Response) -> Any:
+        # Functions returning void (and return=minimal writes) answer 204 with no body.
+        if response.status_code == 204 or not response.content:
+            return None
+        # orjson parses the raw body directly, skipping httpx's text decoding step.
+        return orjson.loads(response.content)
 
     @staticmethod
     def _raise_for_status(response: httpx.Response) -> None:
         if response.status_code >= 400:
             try:
-                payload = response.json()
-            except ValueError:
+                payload = orjson.loads(response.content)
+            except orjson.JSONDecodeError:
                 payload = response.text
             raise SupabaseError(f"Supabase error {response.status_code}: {payload}")
 
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import cache
 
 from aiocache import Cache
 
 from atomsAgent.config import settings
 from atomsAgent.db.repositories import (
     ChatHistoryRepository,
+    MCPOAuthRepository,
     MCPRepository,
     PlatformRepository,
     PromptRepository,
@@ -22,15 +23,16 @@ from atomsAgent.services import (
     VertexModelService,
 )
 from atomsAgent.services.chat_history import ChatHistoryService
+from atomsAgent.services.mcp_oauth import MCPOAuthService, create_mcp_oauth_service
 
 
-@lru_cache
+@cache
 def get_sandbox_manager() -> SandboxManager:
     root_dir = settings.sandbox_root_dir or "/tmp/atomsAgent/sandboxes"
     return SandboxManager(root_path=root_dir)
 
 
-@lru_cache
+@cache
 def get_supabase_client() -> SupabaseClient:
     if not settings.supabase_url or not settings.supabase_service_key:
         raise RuntimeError(
@@ -39,10 +41,11 @@ def get_supabase_client() -> SupabaseClient:
     return SupabaseClient(
         url=settings.supabase_url,
         service_role_key=settings.supabase_service_key,
+        max_concurrent_requests=settings.supabase_max_concurrent_requests,
     )
 
 
-@lru_cache
+@cache
 def get_session_manager() -> ClaudeSessionManager:
     return ClaudeSessionManager(
         sandbox_manager=get_sandbox_manager(),
@@ -51,16 +54,20 @@ def get_session_manager() -> ClaudeSessionManager:
     )
 
 
-@lru_cache
+@cache
 def get_prompt_orchestrator() -> PromptOrchestrator:
     return PromptOrchestrator(
-        prompt_repository=PromptRepository(get_supabase_client()),
+        prompt_repository=PromptRepository(
+            get_supabase_client(),
+            cache=Cache(Cache.MEMORY),
+            cache_ttl=settings.repository_cache_ttl_seconds,
+        ),
         platform_prompt=settings.platform_system_prompt,
         workflow_prompts=settings.workflow_prompt_map,
     )
 
 
-@lru_cache
+@cache
 def get_vertex_model_service() -> VertexModelService:
     cache = Cache(Cache.MEMORY)
     return VertexModelService(
@@ -73,7 +80,7 @@ def get_vertex_model_service() -> VertexModelService:
     )
 
 
-@lru_cache
+@cache
 def get_claude_client() -> ClaudeAgentClient:
     return ClaudeAgentClient(
         session_manager=get_session_manager(),
@@ -81,16 +88,27 @@ def get_claude_client() -> ClaudeAgentClient:
     )
 
 
-@lru_cache
+@cache
 def get_platform_service() -> PlatformService:
     return PlatformService(repository=PlatformRepository(get_supabase_client()))
 
 
-@lru_cache
+@cache
 def get_mcp_service() -> MCPRegistryService:
-    return MCPRegistryService(repository=MCPRepository(get_supabase_client()))
+    return MCPRegistryService(
+        repository=MCPRepository(
+            get_supabase_client(),
+            cache=Cache(Cache.MEMORY),
+            cache_ttl=settings.repository_cache_ttl_seconds,
+        )
+    )
+
+
+@cache
+def get_mcp_oauth_service() -> MCPOAuthService:
+    return create_mcp_oauth_service(MCPOAuthRepository(get_supabase_client()))
 
 
-@lru_cache
+@cache
 def get_chat_history_service() -> ChatHistoryService:
     return ChatHistoryService(repository=ChatHistoryRepository(get_supabase_client()))
@@ -1,9 +1,52 @@
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse
 
 from atomsAgent.api import register_routes
 from atomsAgent.config import settings
+from atomsAgent.db.supabase import SupabaseError
+from atomsAgent.dependencies import (
+    get_chat_history_service,
+    get_mcp_service,
+    get_platform_service,
+    get_prompt_orchestrator,
+    get_supabase_client,
+)
+from atomsAgent.mcp.supabase_client import get_supabase_client as get_mcp_supabase_client
+
+logger = logging.getLogger(__name__)
+
+
+async def _warm_up() -> None:
+    """Build the Supabase-backed services and open a connection before serving."""
+    try:
+        client = get_supabase_client()
+        get_prompt_orchestrator()
+        get_mcp_service()
+        get_platform_service()
+        get_chat_history_service()
+    except Exception as exc:  # Supabase not configured; requests will report it
+        logger.info("Skipping Supabase warm-up: %s", exc)
+        return
+    try:
+        await client.warmup()
+    except (httpx.HTTPError, SupabaseError) as exc:
+        logger.warning("Supabase warm-up request failed: %s", exc)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await _warm_up()
+    yield
+    # Only close the shared Supabase clients if a request actually created them.
+    for get_client in (get_supabase_client, get_mcp_supabase_client):
+        if get_client.cache_info().currsize:
+            await get_client().aclose()
 
 
 def create_app() -> FastAPI:
@@ -15,6 +58,7 @@ def create_app() -> FastAPI:
         redoc_url="/redoc" if settings.enable_docs else None,
         openapi_url="/openapi.json",
         default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
     if settings.cors_allow_origins:
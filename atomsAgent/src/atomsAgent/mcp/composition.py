@@ -10,6 +10,7 @@ from typing import Any
 
 from fastmcp import Client, FastMCP
 
+from atomsAgent.mcp.database import unwrap_server_url
 from atomsAgent.mcp.supabase_client import get_supabase_client as _get_supabase_client
 
 
@@ -104,15 +105,7 @@ async def create_mcp_client(server_config: dict[str, Any]) -> Client:
             raise ValueError(f"HTTP/SSE server {server.get('name')} missing server_url")
         
         # Handle case where URL might be stored as a JSON string
-        if isinstance(server_url, str):
-            # Check if it's a JSON string containing url and source
-            if server_url.startswith('{"url":') and '"source"' in server_url:
-                try:
-                    import json
-                    url_obj = json.loads(server_url)
-                    server_url = url_obj.get("url")
-                except (json.JSONDecodeError, TypeError):
-                    pass
+        server_url = unwrap_server_url(server_url, server_id=server.get("id"))
         
         if not server_url:
             raise ValueError(f"HTTP/SSE server {server.get('name')} has invalid server_url")
@@ -7,13 +7,20 @@ This module provides functions for fetching MCP server configurations from Supab
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
 from typing import Any
 
+import orjson
+
 from atomsAgent.mcp.supabase_client import get_supabase_client
 
 logger = logging.getLogger(__name__)
 
+# Columns read when composing servers; skips the large registry and review metadata.
+MCP_SERVER_COLUMNS = (
+    "id,name,namespace,scope,transport_type,transport_config,url,"
+    "auth_type,auth_config,env,user_id,organization_id,project_id"
+)
+
 
 async def get_user_mcp_servers(user_id: str) -> list[dict[str, Any]]:
     """
@@ -30,6 +37,7 @@ async def get_user_mcp_servers(user_id: str) -> list[dict[str, Any]]:
 
         result = await supabase.select(
             "mcp_servers",
+            columns=MCP_SERVER_COLUMNS,
             filters={
                 "scope": "eq.user",
                 "user_id": f"eq.{user_id}",
@@ -61,6 +69,7 @@ async def get_org_mcp_servers(org_id: str) -> list[dict[str, Any]]:
 
         result = await supabase.select(
             "mcp_servers",
+            columns=MCP_SERVER_COLUMNS,
             filters={
                 "scope": "eq.organization",
                 "organization_id": f"eq.{org_id}",
@@ -92,6 +101,7 @@ async def get_project_mcp_servers(project_id: str) -> list[dict[str, Any]]:
 
         result = await supabase.select(
             "mcp_servers",
+            columns=MCP_SERVER_COLUMNS,
             filters={
                 "scope": "eq.project",
                 "project_id": f"eq.{project_id}",
@@ -108,6 +118,60 @@ async def get_project_mcp_servers(project_id: str) -> list[dict[str, Any]]:
         return []
 
 
+async def get_mcp_servers_for_context(
+    user_id: str | None = None,
+    org_id: str | None = None,
+    project_id: str | None = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Fetch user, organization and project MCP servers in a single query.
+
+    Args:
+        user_id: User ID to fetch user-scoped servers for
+        org_id: Organization ID to fetch organization-scoped servers for
+        project_id: Project ID to fetch project-scoped servers for
+
+    Returns:
+        Tuple of (user servers, organization servers, project servers)
+    """
+    conditions = []
+    if user_id:
+        conditions.append(f"and(scope.eq.user,user_id.eq.{user_id})")
+    if org_id:
+        conditions.append(f"and(scope.eq.organization,organization_id.eq.{org_id})")
+    if project_id:
+        conditions.append(f"and(scope.eq.project,project_id.eq.{project_id})")
+
+    by_scope: dict[str, list[dict[str, Any]]] = {"user": [], "organization": [], "project": []}
+    if not conditions:
+        return by_scope["user"], by_scope["organization"], by_scope["project"]
+
+    try:
+        supabase = get_supabase_client()
+
+        result = await supabase.select(
+            "mcp_servers",
+            columns=MCP_SERVER_COLUMNS,
+            filters={
+                "or": f"({','.join(conditions)})",
+                "enabled": "eq.true",
+            },
+        )
+
+        for server in result.data or []:
+            scoped = by_scope.get(server.get("scope"))
+            if scoped is not None:
+                scoped.append(server)
+        logger.info(
+            f"Found {len(by_scope['user'])} user, {len(by_scope['organization'])} "
+            f"organization and {len(by_scope['project'])} project MCP servers"
+        )
+    except Exception as e:
+        logger.error(f"Error fetching MCP servers: {e}")
+
+    return by_scope["user"], by_scope["organization"], by_scope["project"]
+
+
 async def get_active_profile_servers(user_id: str) -> list[dict[str, Any]]:
     """
     Fetch MCP servers from user's active profile.
@@ -171,6 +235,7 @@ async def get_active_profile_servers(user_id: str) -> list[dict[str, Any]]:
         id_filter = ",".join(f'"{sid}"' for sid in server_ids)
         servers_result = await supabase.select(
             "mcp_servers",
+            columns=MCP_SERVER_COLUMNS,
             filters={"id": f"in.({id_filter})"},
         )
 
@@ -198,6 +263,21 @@ async def get_active_profile_servers(user_id: str) -> list[dict[str, Any]]:
         return []
 
 
+def unwrap_server_url(server_url: Any, *, server_id: Any = None) -> Any:
+    """
+    Return the URL from a JSON-encoded ``{"url": ..., "source": ...}`` value.
+
+    Some rows store the URL column as that JSON object; plain URLs and
+    non-string values are returned unchanged.
+    """
+    if isinstance(server_url, str) and server_url[:7] == '{"url":':
+        try:
+            return orjson.loads(server_url).get("url")
+        except orjson.JSONDecodeError:
+            logger.warning(f"Invalid JSON URL format for server {server_id}")
+    return server_url
+
+
 def convert_db_server_to_mcp_config(
     server: dict[str, Any], 
     *, 
@@ -237,16 +317,7 @@ def convert_db_server_to_mcp_config(
         server_url = server.get("url")
 
         # Handle case where URL might be stored as a JSON string
-        if isinstance(server_url, str):
-            # Check if it's a JSON string containing url and source
-            if server_url.startswith('{"url":') and '"source"' in server_url:
-                try:
-                    import json
-                    url_obj = json.loads(server_url)
-                    server_url = url_obj.get("url")
-                except (json.JSONDecodeError, TypeError):
-                    logger.warning(f"Invalid JSON URL format for server {server.get('id')}")
-                    pass
+        server_url = unwrap_server_url(server_url, server_id=server.get("id"))
 
         if not server_url:
             logger.warning(f"No URL configured for HTTP/SSE server {server.get('id')}")
@@ -322,28 +393,8 @@ async def update_server_usage(server_id: str) -> None:
     try:
         supabase = get_supabase_client()
 
-        current = await supabase.select(
-            "mcp_servers",
-            columns="usage_count",
-            filters={"id": f"eq.{server_id}"},
-            limit=1,
-        )
-        usage_count = 0
-        if current.data:
-            raw_value = current.data[0].get("usage_count")
-            if isinstance(raw_value, int):
-                usage_count = raw_value
-            elif isinstance(raw_value, str) and raw_value.isdigit():
-                usage_count = int(raw_value)
-
-        await supabase.update(
-            "mcp_servers",
-            filters={"id": f"eq.{server_id}"},
-            payload={
-                "usage_count": usage_count + 1,
-                "last_used_at": datetime.now(timezone.utc).isoformat(),
-            },
-        )
+        # Incremented in the database so concurrent calls never lose an update
+        await supabase.rpc("increment_mcp_server_usage", params={"p_id": server_id})
 
     except Exception as e:
         logger.error(f"Error updating server usage: {e}")
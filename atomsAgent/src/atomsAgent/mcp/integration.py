@@ -7,7 +7,11 @@ allowing Claude to use our custom tools (search_requirements, create_requirement
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
@@ -19,6 +23,40 @@ if TYPE_CHECKING:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+# Server rows looked up per chat turn, keyed by the (user, org, project) ids. Only the
+# database rows are cached: OAuth and user tokens are still resolved on every composition.
+_SERVER_RECORDS_TTL_SECONDS = 30.0
+_SERVER_RECORDS_MAX_ENTRIES = 1024
+_ContextKey = tuple[str | None, str | None, str | None]
+# (user servers, org servers, project servers)
+_ContextServers = tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]
+_server_records: OrderedDict[_ContextKey, tuple[float, _ContextServers]] = OrderedDict()
+
+
+def clear_mcp_server_cache() -> None:
+    """Forget cached MCP server rows so the next composition re-reads them."""
+    _server_records.clear()
+
+
+async def _cached_context_servers(
+    key: _ContextKey,
+    fetch: Callable[[], Awaitable[_ContextServers]],
+) -> _ContextServers:
+    now = time.monotonic()
+    cached = _server_records.get(key)
+    if cached is not None and now - cached[0] < _SERVER_RECORDS_TTL_SECONDS:
+        _server_records.move_to_end(key)
+        return cached[1]
+
+    groups = await fetch()
+    # The database helpers return [] on errors too, so only cache real results.
+    if any(groups):
+        _server_records[key] = (now, groups)
+        _server_records.move_to_end(key)
+        while len(_server_records) > _SERVER_RECORDS_MAX_ENTRIES:
+            _server_records.popitem(last=False)
+    return groups
+
 
 def get_atoms_mcp_server_config() -> dict[str, Any]:
     """
@@ -92,9 +130,7 @@ async def compose_mcp_servers(
     from atomsAgent.mcp.database import (
         convert_db_server_to_mcp_config,
         get_active_profile_servers,
-        get_org_mcp_servers,
-        get_project_mcp_servers,
-        get_user_mcp_servers,
+        get_mcp_servers_for_context,
     )
 
     oauth_service: MCPOAuthService | None = None
@@ -108,34 +144,32 @@ async def compose_mcp_servers(
             logger.debug("Invalid UUID value %r when composing MCP servers", value)
             return None
 
-    async def _resolve_oauth_token(record: dict[str, Any]) -> str | None:
-        nonlocal oauth_service
-        auth_type = (record.get("auth_type") or "").lower()
-        if auth_type != "oauth":
-            return None
+    def _uses_oauth(record: dict[str, Any]) -> bool:
+        return (record.get("auth_type") or "").lower() == "oauth"
 
-        namespace = (
+    def _oauth_namespace(record: dict[str, Any]) -> str | None:
+        return (
             record.get("namespace")
             or record.get("registry_namespace")
             or record.get("name")
         )
-        if not namespace:
-            logger.debug("Skipping OAuth token lookup for server with no namespace")
-            return None
-
-        if oauth_service is None:
-            from atomsAgent.dependencies import (
-                get_mcp_oauth_service,  # local import to avoid circular
-            )
-
-            oauth_service = get_mcp_oauth_service()
 
+    def _token_owners(record: dict[str, Any]) -> tuple[UUID | None, UUID | None]:
         # Prefer the record-specific scope, fall back to the compose scope
         record_user = record.get("user_id") or user_id
         record_org = record.get("organization_id") or org_id
+        return _to_uuid(record_user), _to_uuid(record_org)
+
+    async def _resolve_oauth_token(record: dict[str, Any]) -> str | None:
+        if oauth_service is None or not _uses_oauth(record):
+            return None
 
-        user_uuid = _to_uuid(record_user)
-        org_uuid = _to_uuid(record_org)
+        namespace = _oauth_namespace(record)
+        if not namespace:
+            logger.debug("Skipping OAuth token lookup for server with no namespace")
+            return None
+
+        user_uuid, org_uuid = _token_owners(record)
 
         token_record = None
         try:
@@ -167,73 +201,121 @@ async def compose_mcp_servers(
             org_uuid,
         )
         return None
+
+    async def _resolve_oauth_tokens(records: list[dict[str, Any]]) -> list[str | None]:
+        """Resolve tokens for a scope's records with one query per token owner."""
+        oauth_records = [
+            record for record in records if _uses_oauth(record) and _oauth_namespace(record)
+        ]
+        if oauth_service is None or not oauth_records:
+            return await asyncio.gather(*map(_resolve_oauth_token, records))
+
+        # Group the namespaces by owner: ("user_id" | "organization_id", uuid)
+        wanted: dict[tuple[str, UUID], set[str]] = {}
+        for record in oauth_records:
+            namespace = _oauth_namespace(record)
+            user_uuid, org_uuid = _token_owners(record)
+            if user_uuid is not None:
+                wanted.setdefault(("user_id", user_uuid), set()).add(namespace)
+            if org_uuid is not None:
+                wanted.setdefault(("organization_id", org_uuid), set()).add(namespace)
+
+        owners = list(wanted)
+        try:
+            found = await asyncio.gather(
+                *(
+                    oauth_service.latest_tokens_for_namespaces(
+                        mcp_namespaces=wanted[owner], **{owner[0]: owner[1]}
+                    )
+                    for owner in owners
+                )
+            )
+        except MCPOAuthError as exc:
+            logger.warning("Bulk OAuth token lookup failed, resolving per server: %s", exc)
+            return await asyncio.gather(*map(_resolve_oauth_token, records))
+        tokens_by_owner = dict(zip(owners, found))
+
+        resolved: list[str | None] = []
+        for record in records:
+            if not _uses_oauth(record) or not _oauth_namespace(record):
+                resolved.append(await _resolve_oauth_token(record))
+                continue
+            namespace = _oauth_namespace(record)
+            user_uuid, org_uuid = _token_owners(record)
+            token_record = tokens_by_owner.get(("user_id", user_uuid), {}).get(namespace)
+            if token_record is None:
+                token_record = tokens_by_owner.get(("organization_id", org_uuid), {}).get(
+                    namespace
+                )
+            if token_record and token_record.access_token:
+                resolved.append(token_record.access_token)
+                continue
+            logger.debug(
+                "No stored OAuth token found for namespace %s (user=%s, org=%s)",
+                namespace,
+                user_uuid,
+                org_uuid,
+            )
+            resolved.append(None)
+        return resolved
     
     # Start with default servers
     servers = get_default_mcp_servers()
-    
-    # Fetch and add user-specific servers
-    if user_id:
-        logger.info(f"Composing MCP servers for user: {user_id}")
-        try:
-            # Try to get servers from active profile first
-            user_servers_db = await get_active_profile_servers(user_id)
+    if not any((user_id, org_id, project_id, additional_servers)):
+        return servers
 
-            if user_servers_db:
-                logger.info(f"Using {len(user_servers_db)} servers from active MCP profile")
-            else:
-                # Fallback to all enabled user servers if no profile
-                logger.debug("No active profile found, falling back to all user servers")
-                user_servers_db = await get_user_mcp_servers(user_id)
+    async def _load_profile_servers() -> list[dict[str, Any]]:
+        return await get_active_profile_servers(user_id) if user_id else []
 
-            for server_record in user_servers_db:
-                server_name = f"user_{server_record['name']}"
-                oauth_token = await _resolve_oauth_token(server_record)
-                server_config = convert_db_server_to_mcp_config(
-                    server_record,
-                    oauth_token=oauth_token,
-                    user_token=user_token,
-                )
-                if server_config:
-                    servers[server_name] = server_config
-                    logger.debug(f"Added user server: {server_name}")
+    async def _load_context_servers() -> _ContextServers:
+        # One query covers every scope; the active profile lookup runs alongside it.
+        profile_servers, (user_servers, org_servers, project_servers) = await asyncio.gather(
+            _load_profile_servers(),
+            get_mcp_servers_for_context(user_id, org_id, project_id),
+        )
+        # Servers from the active profile replace the user's own server list
+        if profile_servers:
+            logger.info(f"Using {len(profile_servers)} servers from active MCP profile")
+            user_servers = profile_servers
+        elif user_id:
+            logger.debug("No active profile found, falling back to all user servers")
+        return user_servers, org_servers, project_servers
+
+    # (label, server name prefix, id) for each scope, in the order servers are merged
+    scopes = (("user", "user", user_id), ("org", "org", org_id), ("project", "proj", project_id))
+    for label, _, scope_id in scopes:
+        if scope_id:
+            logger.info(f"Composing MCP servers for {label}: {scope_id}")
+
+    groups: _ContextServers = ([], [], [])
+    if user_id or org_id or project_id:
+        try:
+            groups = await _cached_context_servers(
+                (user_id, org_id, project_id), _load_context_servers
+            )
         except Exception as e:
             message = str(e)
             if "Supabase credentials not configured" in message:
-                logger.debug("Supabase not configured; skipping user MCP servers")
+                logger.debug("Supabase not configured; skipping MCP servers")
             else:
-                logger.error(f"Error loading user MCP servers: {message}")
-    
-    # Fetch and add organization-specific servers
-    if org_id:
-        logger.info(f"Composing MCP servers for org: {org_id}")
+                logger.error(f"Error loading MCP servers: {message}")
+
+    # Resolve the OAuth service once, before token lookups run concurrently.
+    if any(_uses_oauth(record) for records in groups for record in records):
         try:
-            org_servers_db = await get_org_mcp_servers(org_id)
-            for server_record in org_servers_db:
-                server_name = f"org_{server_record['name']}"
-                oauth_token = await _resolve_oauth_token(server_record)
-                server_config = convert_db_server_to_mcp_config(
-                    server_record,
-                    oauth_token=oauth_token,
-                    user_token=user_token,
-                )
-                if server_config:
-                    servers[server_name] = server_config
-                    logger.debug(f"Added org server: {server_name}")
+            from atomsAgent.dependencies import (
+                get_mcp_oauth_service,  # local import to avoid circular
+            )
+
+            oauth_service = get_mcp_oauth_service()
         except Exception as e:
-            message = str(e)
-            if "Supabase credentials not configured" in message:
-                logger.debug("Supabase not configured; skipping org MCP servers")
-            else:
-                logger.error(f"Error loading org MCP servers: {message}")
-    
-    # Fetch and add project-specific servers
-    if project_id:
-        logger.info(f"Composing MCP servers for project: {project_id}")
+            logger.error(f"Error loading MCP OAuth service: {e}")
+
+    for (label, prefix, _), records in zip(scopes, groups):
         try:
-            project_servers_db = await get_project_mcp_servers(project_id)
-            for server_record in project_servers_db:
-                server_name = f"proj_{server_record['name']}"
-                oauth_token = await _resolve_oauth_token(server_record)
+            oauth_tokens = await _resolve_oauth_tokens(records)
+            for server_record, oauth_token in zip(records, oauth_tokens):
+                server_name = f"{prefix}_{server_record['name']}"
                 server_config = convert_db_server_to_mcp_config(
                     server_record,
                     oauth_token=oauth_token,
@@ -241,14 +323,14 @@ async def compose_mcp_servers(
                 )
                 if server_config:
                     servers[server_name] = server_config
-                    logger.debug(f"Added project server: {server_name}")
+                    logger.debug(f"Added {label} server: {server_name}")
         except Exception as e:
             message = str(e)
             if "Supabase credentials not configured" in message:
-                logger.debug("Supabase not configured; skipping project MCP servers")
+                logger.debug(f"Supabase not configured; skipping {label} MCP servers")
             else:
-                logger.error(f"Error loading project MCP servers: {message}")
-    
+                logger.error(f"Error loading {label} MCP servers: {message}")
+
     # Add additional servers
     if additional_servers:
         servers.update(additional_servers)
@@ -260,6 +342,7 @@ async def compose_mcp_servers(
 
 # Export for easy importing
 __all__ = [
+    "clear_mcp_server_cache",
     "compose_mcp_servers",
     "get_atoms_mcp_server_config",
     "get_default_mcp_servers",
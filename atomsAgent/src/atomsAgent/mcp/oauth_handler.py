@@ -17,6 +17,8 @@ from urllib.parse import urlencode
 
 import httpx
 
+from atomsAgent.mcp.integration import clear_mcp_server_cache
+
 
 @dataclass
 class OAuthConfig:
@@ -310,6 +312,8 @@ class OAuthHandler:
                         "auth_status": "connected",
                     },
                 )
+                # Cached server rows carry the old auth_config
+                clear_mcp_server_cache()
                 return
             except Exception as e:
                 print(f"Error storing tokens in database: {e}")
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import cache
 
+from atomsAgent.config import settings
 from atomsAgent.db.supabase import SupabaseClient
 from atomsAgent.settings.secrets import get_secrets
 
 
-@lru_cache
+@cache
 def get_supabase_client() -> SupabaseClient:
-    """Return a cached Supabase REST client configured from secrets."""
+    """Return a cached Supabase REST client configured from secrets.
+
+    The single instance keeps its pooled HTTP connections warm across the MCP
+    server lookups made for every composition.
+    """
     secrets = get_secrets()
     url = getattr(secrets, "supabase_url", None)
     key = getattr(secrets, "supabase_service_key", None)
@@ -19,4 +24,8 @@ def get_supabase_client() -> SupabaseClient:
             "Set supabase_url and supabase_service_key in config/secrets.yml.",
         )
 
-    return SupabaseClient(url=url, service_role_key=key)
+    return SupabaseClient(
+        url=url,
+        service_role_key=key,
+        max_concurrent_requests=settings.supabase_max_concurrent_requests,
+    )
@@ -78,8 +78,8 @@ class ChatHistoryService:
 
         new_messages = messages[existing_count:]
         if new_messages:
-            for idx, message in enumerate(new_messages, start=existing_count):
-                await self._repository.insert_message(
+            await self._repository.insert_messages(
+                [
                     {
                         "session_id": session_id,
                         "message_index": idx,
@@ -90,7 +90,9 @@ class ChatHistoryService:
                         "tokens_out": None,
                         "tokens_total": None,
                     }
-                )
+                    for idx, message in enumerate(new_messages, start=existing_count)
+                ]
+            )
             now_iso = _utc_now_iso()
             update_payload: dict[str, object] = {
                 "message_count": existing_count + len(new_messages),
@@ -240,8 +240,8 @@ class MCPOAuthService:
                 f"OAuth token endpoint error ({response.status_code}): {response.text}"
             )
 
-        token_data = response.json()
-        oauth_token = OAuthToken.model_validate(token_data)
+        # Parse and validate the raw body in one pass instead of json -> dict -> model.
+        oauth_token = OAuthToken.model_validate_json(response.content)
 
         expires_at: datetime | None = None
         if oauth_token.expires_in:
@@ -258,7 +258,7 @@ class MCPOAuthService:
             "token_type": oauth_token.token_type,
             "scope": oauth_token.scope or " ".join(transaction.scopes or []),
             "expires_at": expires_at.isoformat() if expires_at else None,
-            "upstream_response": json.dumps(token_data),
+            "upstream_response": response.text,
         }
 
         token_record = await self._repository.store_tokens(token_payload)
@@ -299,6 +299,24 @@ class MCPOAuthService:
             organization_id=organization_id,
         )
 
+    async def latest_tokens_for_namespaces(
+        self,
+        *,
+        mcp_namespaces: Iterable[str],
+        user_id: UUID | None = None,
+        organization_id: UUID | None = None,
+    ) -> dict[str, SupabaseMcpOauthToken]:
+        """Latest token per namespace for one owner, fetched in a single query."""
+        if user_id is None and organization_id is None:
+            raise MCPOAuthError(
+                "Cannot fetch OAuth tokens without a user_id or organization_id"
+            )
+        return await self._repository.get_latest_tokens_for_namespaces(
+            mcp_namespaces=mcp_namespaces,
+            user_id=user_id,
+            organization_id=organization_id,
+        )
+
     # ------------------------------------------------------------------ Provider loading
     def _load_providers(self, config_path: Path) -> dict[str, OAuthProviderConfig]:
         raw_config = _load_yaml_config(config_path)
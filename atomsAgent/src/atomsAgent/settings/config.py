@@ -21,6 +21,8 @@ class ConfigSettings(BaseSettings):
     vertex_location: str = Field(default="us-central1")
 
     model_cache_ttl_seconds: int = Field(default=600)
+    repository_cache_ttl_seconds: int = Field(default=60)
+    supabase_max_concurrent_requests: int = Field(default=20)
 
     platform_prompt_id: str | None = Field(default=None)
     platform_system_prompt: str | None = Field(default=None)
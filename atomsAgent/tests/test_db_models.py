@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from uuid import UUID
+
+import orjson
+
+from atomsAgent.db import models
+from atomsAgent.db.generated.fastapi.schema_public_latest import AuditLogUpdate, UsageLogInsert
+from atomsAgent.db.models import SupabaseMcpOauthTransaction, SupabaseSystemPrompt
+
+
+def test_from_trusted_skips_validation():
+    row = {"organization_id": "not-a-uuid", "quantity": "12"}
+
+    record = UsageLogInsert.from_trusted(**row)
+
+    assert record.organization_id == "not-a-uuid"
+    assert record.quantity == "12"
+    assert record.model_fields_set == {"organization_id", "quantity"}
+
+
+def test_to_json_uses_orjson_hook():
+    record = AuditLogUpdate(
+        id="6a2f41a3-c54c-4c3b-8e2b-3f1f1d6b8b3b",
+        ip_address="10.0.0.1",
+        timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+    payload = orjson.loads(record.to_json(exclude_none=True))
+
+    assert payload == {
+        "id": "6a2f41a3-c54c-4c3b-8e2b-3f1f1d6b8b3b",
+        "ip_address": "10.0.0.1",
+        "timestamp": "2025-01-01T00:00:00Z",
+    }
+
+
+def test_validate_many_returns_models():
+    row = {
+        "feature": "chat",
+        "organization_id": "6a2f41a3-c54c-4c3b-8e2b-3f1f1d6b8b3b",
+        "unit_type": "tokens",
+        "user_id": "0f8d7c1e-2a4b-4c6d-8e0f-1a2b3c4d5e6f",
+    }
+    rows = [{**row, "quantity": 1}, {**row, "quantity": "2"}]
+
+    records = UsageLogInsert.validate_many(rows)
+
+    assert [record.quantity for record in records] == [1, 2]
+    assert all(isinstance(record, UsageLogInsert) for record in records)
+    assert UsageLogInsert.validate_many_json(orjson.dumps(rows)) == records
+
+
+def test_model_dump_fast_matches_exclude_none():
+    record = AuditLogUpdate(
+        id="6a2f41a3-c54c-4c3b-8e2b-3f1f1d6b8b3b",
+        ip_address="10.0.0.1",
+        metadata={"source": "api"},
+    )
+
+    assert record.model_dump_fast() == record.model_dump(exclude_none=True)
+
+
+def test_insert_uuid_columns_stay_strings():
+    record = UsageLogInsert(
+        feature="chat",
+        organization_id="0190b3a4-5c6d-7e8f-9a0b-1c2d3e4f5a6b",
+        quantity=1,
+        unit_type="tokens",
+        user_id="0f8d7c1e-2a4b-4c6d-8e0f-1a2b3c4d5e6f",
+    )
+
+    assert record.organization_id == "0190b3a4-5c6d-7e8f-9a0b-1c2d3e4f5a6b"
+
+
+def test_insert_uuid_columns_accept_uuid_instances():
+    user_id = UUID("0f8d7c1e-2a4b-4c6d-8e0f-1a2b3c4d5e6f")
+    record = UsageLogInsert(
+        feature="chat",
+        organization_id=UUID(int=1),
+        quantity=1,
+        unit_type="tokens",
+        user_id=user_id,
+    )
+
+    assert record.user_id == str(user_id)
+    assert record.organization_id == "00000000-0000-0000-0000-000000000001"
+
+
+def test_to_patch_bytes_only_sends_set_fields():
+    record = AuditLogUpdate(id="6a2f41a3-c54c-4c3b-8e2b-3f1f1d6b8b3b", metadata=None)
+
+    assert orjson.loads(record.to_patch_bytes()) == {
+        "id": "6a2f41a3-c54c-4c3b-8e2b-3f1f1d6b8b3b",
+        "metadata": None,
+    }
+
+
+def test_from_row_validates_unless_told_the_row_is_trusted():
+    row = {
+        "id": "0190b3a4-5c6d-7e8f-9a0b-1c2d3e4f5a6b",
+        "mcp_namespace": "example/server",
+        "provider_key": "test",
+        "status": "pending",
+        "created_at": "2025-01-01T00:00:00Z",
+        "updated_at": "2025-01-01T00:00:00Z",
+    }
+
+    validated = SupabaseMcpOauthTransaction.from_row(row)
+    trusted = SupabaseMcpOauthTransaction.from_row(row, trusted=True)
+
+    assert trusted.id == row["id"]
+    assert validated.id == UUID(row["id"])
+
+
+def test_from_rows_fills_system_prompt_defaults():
+    required = {"enabled": True, "priority": 0, "scope": "global"}
+    rows = [
+        {
+            "id": "p1",
+            "content": "a",
+            "name": "first",
+            "created_at": "2025-01-01T00:00:00Z",
+            "updated_at": "2025-01-01T00:00:00Z",
+            **required,
+        },
+        {"id": "p2", "content": "b", **required},
+    ]
+
+    prompts = SupabaseSystemPrompt.from_rows(rows)
+
+    assert [prompt.name for prompt in prompts] == ["first", "p2"]
+    assert isinstance(prompts[1].created_at, datetime)
+
+
+def test_row_models_define_no_validators():
+    for name in models.__all__:
+        decorators = getattr(models, name).__pydantic_decorators__
+
+        assert not decorators.field_validators, name
+        assert not decorators.model_validators, name
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+FIXTURE = Path(__file__).parent / "fixtures" / "sb_pydantic_schema_public.txt"
+
+
+@pytest.fixture
+def generator():
+    spec = importlib.util.spec_from_file_location(
+        "generate_supabase_models", ROOT / "scripts" / "generate_supabase_models.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_post_processed_schema_imports(generator, tmp_path, monkeypatch):
+    schema_file = tmp_path / "schema_public_latest.py"
+    shutil.copy(FIXTURE, schema_file)
+    monkeypatch.setattr(generator, "SCHEMA_FILE", schema_file)
+    monkeypatch.setattr(generator, "SCHEMA_PACKAGE", schema_file.with_suffix(""))
+
+    generator.post_process_schema()
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        schema = importlib.import_module("schema_public_latest")
+        for name in schema.__all__:
+            model = getattr(schema, name)
+            if hasattr(model, "model_rebuild"):
+                model.model_rebuild()
+
+        log = schema.McpServerUsageLogUpdate(ip_address="10.0.0.1")
+        assert str(log.ip_address) == "10.0.0.1"
+    finally:
+        for module in [name for name in sys.modules if name.startswith("schema_public_latest")]:
+            del sys.modules[module]
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import asyncio
+
+from atomsAgent.db.supabase import SupabaseResponse
+from atomsAgent.mcp import database
+
+
+class _RpcClient:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict]] = []
+
+    async def rpc(self, function_name: str, *, params: dict):
+        self.calls.append((function_name, params))
+        return SupabaseResponse(data=None)
+
+
+def test_server_usage_is_incremented_in_one_rpc(monkeypatch):
+    client = _RpcClient()
+    monkeypatch.setattr(database, "get_supabase_client", lambda: client)
+
+    asyncio.run(database.update_server_usage("srv-1"))
+
+    assert client.calls == [("increment_mcp_server_usage", {"p_id": "srv-1"})]
@@ -9,8 +9,8 @@ from atomsAgent.db.repositories import MCPOAuthTokenRecord
 def test_compose_servers_injects_oauth_header(monkeypatch):
     user_uuid = str(UUID(int=5))
 
-    async def _fake_user_servers(user_id: str):  # pragma: no cover - simple stub
-        return [
+    async def _fake_context_servers(user_id=None, org_id=None, project_id=None):
+        user_servers = [
             {
                 "id": "srv-1",
                 "name": "drive",
@@ -22,11 +22,9 @@ def test_compose_servers_injects_oauth_header(monkeypatch):
                 "user_id": user_id,
             }
         ]
+        return user_servers, [], []
 
-    async def _fake_org_servers(org_id: str):  # pragma: no cover - unused
-        return []
-
-    async def _fake_project_servers(project_id: str):  # pragma: no cover - unused
+    async def _fake_profile_servers(user_id: str):  # pragma: no cover - simple stub
         return []
 
     class _FakeOAuthService:
@@ -49,9 +47,20 @@ def test_compose_servers_injects_oauth_header(monkeypatch):
                 )
             return None
 
-    monkeypatch.setattr("atomsAgent.mcp.database.get_user_mcp_servers", _fake_user_servers)
-    monkeypatch.setattr("atomsAgent.mcp.database.get_org_mcp_servers", _fake_org_servers)
-    monkeypatch.setattr("atomsAgent.mcp.database.get_project_mcp_servers", _fake_project_servers)
+        async def latest_tokens_for_namespaces(self, *, mcp_namespaces, **owner):
+            tokens = {}
+            for namespace in mcp_namespaces:
+                token = await self.latest_tokens_for_namespace(mcp_namespace=namespace, **owner)
+                if token is not None:
+                    tokens[namespace] = token
+            return tokens
+
+    monkeypatch.setattr(
+        "atomsAgent.mcp.database.get_mcp_servers_for_context", _fake_context_servers
+    )
+    monkeypatch.setattr(
+        "atomsAgent.mcp.database.get_active_profile_servers", _fake_profile_servers
+    )
     monkeypatch.setattr("atomsAgent.dependencies.get_mcp_oauth_service", lambda: _FakeOAuthService())
 
     from atomsAgent.mcp.integration import compose_mcp_servers
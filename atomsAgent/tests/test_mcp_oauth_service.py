@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
+import json
 from uuid import UUID
 
 import pytest
@@ -143,15 +144,16 @@ def test_start_transaction_generates_pkce(tmp_path):
 class _FakeHTTPResponse:
     def __init__(self, status_code: int = 200):
         self.status_code = status_code
-
-    def json(self):
-        return {
-            "access_token": "ACCESS",
-            "refresh_token": "REFRESH",
-            "expires_in": 3600,
-            "token_type": "Bearer",
-            "scope": "files.read",
-        }
+        self.text = json.dumps(
+            {
+                "access_token": "ACCESS",
+                "refresh_token": "REFRESH",
+                "expires_in": 3600,
+                "token_type": "Bearer",
+                "scope": "files.read",
+            }
+        )
+        self.content = self.text.encode()
 
 
 class _FakeAsyncClient:
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID
+
+from aiocache import Cache
+
+from atomsAgent.db.repositories import ChatHistoryRepository, MCPOAuthRepository, MCPRepository
+from atomsAgent.db.supabase import SupabaseResponse
+
+
+class _CountingClient:
+    def __init__(self) -> None:
+        self.selects = 0
+
+    async def select(self, table: str, **kwargs):
+        self.selects += 1
+        return SupabaseResponse(
+            data=[{"id": "cfg-1", "name": "files", "type": "http", "auth_type": "none"}]
+        )
+
+    async def delete(self, table: str, **kwargs):
+        return SupabaseResponse(data=[])
+
+
+def test_list_configs_is_cached_until_a_config_changes():
+    client = _CountingClient()
+    repo = MCPRepository(client, cache=Cache(Cache.MEMORY), cache_ttl=60)  # type: ignore[arg-type]
+
+    async def scenario() -> None:
+        for _ in range(2):
+            configs = await repo.list_configs(organization_id=UUID(int=1), user_id=None)
+            assert [config.id for config in configs] == ["cfg-1"]
+        assert client.selects == 1
+
+        await repo.delete_config(UUID(int=9))
+        await repo.list_configs(organization_id=UUID(int=1), user_id=None)
+        assert client.selects == 2
+
+    asyncio.run(scenario())
+
+
+class _MessagePagesClient:
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.pages: list[tuple[int, int]] = []
+
+    async def select(self, table: str, *, limit: int, offset: int, **kwargs):
+        self.pages.append((offset, limit))
+        indexes = range(offset, min(offset + limit, self.total))
+        return SupabaseResponse(
+            data=[{"id": f"m{i}", "session_id": "s1", "message_index": i} for i in indexes]
+        )
+
+
+def test_fetch_messages_pages_through_long_sessions():
+    client = _MessagePagesClient(total=5)
+    repo = ChatHistoryRepository(client)  # type: ignore[arg-type]
+
+    messages = asyncio.run(repo.fetch_messages("s1"))
+
+    assert [message.message_index for message in messages] == [0, 1, 2, 3, 4]
+    assert client.pages == [(0, 200)]
+
+    async def collect() -> list[int]:
+        return [m.message_index async for m in repo.iter_messages("s1", page_size=2)]
+
+    client.pages.clear()
+    assert asyncio.run(collect()) == [0, 1, 2, 3, 4]
+    assert client.pages == [(0, 2), (2, 2), (4, 2)]
+
+
+class _TokenRowsClient:
+    def __init__(self) -> None:
+        self.filters: dict[str, str] = {}
+
+    async def select(self, table: str, *, filters: dict[str, str], **kwargs):
+        self.filters = filters
+        rows = [
+            (3, "drive/server", "2025-01-03T00:00:00Z"),
+            (2, "mail", "2025-01-02T00:00:00Z"),
+            (1, "drive/server", "2025-01-01T00:00:00Z"),
+        ]
+        return SupabaseResponse(
+            data=[
+                {
+                    "id": str(UUID(int=token_id)),
+                    "transaction_id": str(UUID(int=100 + token_id)),
+                    "provider_key": "test",
+                    "mcp_namespace": namespace,
+                    "issued_at": issued_at,
+                }
+                for token_id, namespace, issued_at in rows
+            ]
+        )
+
+
+def test_latest_tokens_for_namespaces_keeps_newest_per_namespace():
+    client = _TokenRowsClient()
+    repo = MCPOAuthRepository(client)  # type: ignore[arg-type]
+
+    tokens = asyncio.run(
+        repo.get_latest_tokens_for_namespaces(
+            mcp_namespaces=["mail", "drive/server", "mail"], user_id=UUID(int=5)
+        )
+    )
+
+    assert {namespace: token.id for namespace, token in tokens.items()} == {
+        "drive/server": UUID(int=3),
+        "mail": UUID(int=2),
+    }
+    assert client.filters == {
+        "mcp_namespace": 'in.("drive/server","mail")',
+        "user_id": f"eq.{UUID(int=5)}",
+    }
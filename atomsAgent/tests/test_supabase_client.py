@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import httpx
+
+from atomsAgent.db.supabase import SupabaseClient
+
+
+def _client() -> SupabaseClient:
+    return SupabaseClient(url="https://example.supabase.co", service_role_key="service-key")
+
+
+def test_http_client_from_another_loop_is_closed_on_that_loop():
+    client = _client()
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever, daemon=True)
+    thread.start()
+
+    async def current_http():
+        return client._http()
+
+    try:
+        first = asyncio.run_coroutine_threadsafe(current_http(), other_loop).result()
+
+        async def scenario():
+            second = client._http()
+            assert second is not first
+            await client.aclose()
+
+        asyncio.run(scenario())
+        # The replaced client is closed by its own loop
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other_loop).result()
+        assert first.is_closed
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+
+
+def test_in_flight_requests_are_capped():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json=[])
+
+    client = SupabaseClient(
+        url="https://example.supabase.co",
+        service_role_key="service-key",
+        max_concurrent_requests=3,
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def scenario():
+        await asyncio.gather(*(client.select("mcp_servers") for _ in range(10)))
+        await client.aclose()
+
+    asyncio.run(scenario())
+
+    assert peak == 3
+
+
+def test_rpc_returning_void_decodes_to_none():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(204)
+
+    client = SupabaseClient(
+        url="https://example.supabase.co",
+        service_role_key="service-key",
+        transport=httpx.MockTransport(handler),
+    )
+
+    async def scenario():
+        try:
+            return await client.rpc("increment_mcp_server_usage", params={"p_id": "srv-1"})
+        finally:
+            await client.aclose()
+
+    response = asyncio.run(scenario())
+
+    assert response.data is None
+    assert requests[0].url.path == "/rest/v1/rpc/increment_mcp_server_usage"